@@ -1,3 +1,6 @@
 import dynetworkx.classes
 
 from dynetworkx.classes import *
+
+import dynetworkx.algorithms
+from dynetworkx.algorithms import *
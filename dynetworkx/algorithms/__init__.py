@@ -0,0 +1,3 @@
+from dynetworkx.algorithms.temporal_paths import *
+from dynetworkx.algorithms.temporal_motifs import *
+from dynetworkx.algorithms.temporal_components import *
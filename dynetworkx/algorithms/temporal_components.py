@@ -0,0 +1,218 @@
+"""
+Connected components of interval graphs over sliding windows.
+
+The windows are those of `IntervalGraph.iter_snapshots` with `width` and `step`:
+windows [b, b + width) where b goes from the beginning of the interval graph by
+`step`, until one begins at or after its end. The components of a window are
+those of its snapshot, with the nodes and edges which overlap the window.
+In an IntervalDiGraph, the direction of edges is ignored (weakly connected components).
+"""
+from array import array
+
+import networkx as nx
+
+__all__ = ['windowed_connected_components']
+
+
+def windowed_connected_components(G, width, step=None, sizes=False):
+    """Generate the connected components of G in each window of a sliding window.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+
+    width : number
+        Length of the windows.
+
+    step : number, optional (default= width)
+        Time between the beginnings of consecutive windows.
+        If smaller than `width`, consecutive windows overlap.
+
+    sizes : bool, optional (default= False)
+        If True, the sizes of the components are generated instead of their labels.
+
+    Yields
+    ------
+    labels : NumPy array
+        For each window, the component of each node in the order of `G.nodes()`,
+        labeled by the index of its first node in that order,
+        or -1 for nodes without edges in the window.
+
+    sizes : NumPy array
+        For each window, the sizes of its components in decreasing order, if sizes= True.
+
+    Raises
+    ------
+    NetworkXError
+        If width or step is not bigger than zero.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 10), (2, 3, 5, 15), (4, 5, 0, 20), (3, 4, 12, 14)])
+    >>> list(G.nodes())
+    [1, 2, 3, 4, 5]
+    >>> for labels in dnx.windowed_connected_components(G, 5):
+    ...     print(labels)
+    [ 0  0 -1  3  3]
+    [0 0 0 3 3]
+    [-1  1  1  1  1]
+    [-1 -1 -1  3  3]
+    >>> [s.tolist() for s in dnx.windowed_connected_components(G, 10, step=5, sizes=True)]
+    [[3, 2], [5], [4], [2]]
+
+    Notes
+    -----
+    Components are maintained incrementally as edges enter and leave the windows,
+    with an offline dynamic connectivity algorithm: the windows during which each
+    pair of nodes is connected are a few ranges of consecutive windows, which are
+    stored in the nodes of a segment tree over the windows covering them.
+    A depth-first traversal of the tree merges components with a union-find
+    structure when entering a node, for its pairs, and undoes the merges when leaving it.
+    Thus each range is merged a number of times logarithmic in the number of windows,
+    instead of every edge once per window, and components are read at each leaf.
+    """
+    if width <= 0 or (step is not None and step <= 0):
+        raise nx.NetworkXError("windowed_connected_components: width and step must be bigger than zero.")
+    if step is None:
+        step = width
+
+    return _windowed_components(G, width, step, sizes)
+
+
+def _windowed_components(G, width, step, sizes):
+    """Generate the components of `windowed_connected_components`, after checking its arguments."""
+    import numpy as np
+    from dynetworkx.classes.snapshotgraph import _disjoint_ranges
+
+    begin, end = G.interval()
+    count = 0
+    if begin is not None:
+        count = max(int(np.ceil((end - begin) / float(step))), 0)
+        while begin + step * count < end:
+            count += 1
+        while count and begin + step * (count - 1) >= end:
+            count -= 1
+    if not count:
+        return
+    starts = begin + step * np.arange(count)
+
+    nodes = list(G.nodes())
+    n = len(nodes)
+    index = {node: i for i, node in enumerate(nodes)}
+
+    ebegin, eend, u, v, labels, _ = G._edge_columns()
+    ids = np.array([index[node] for node in labels], dtype=np.int64)
+    u, v = ids[u], ids[v]
+    low, high = np.minimum(u, v), np.maximum(u, v)
+
+    # window i overlaps [b, e) if starts[i] < e and starts[i] + width > b
+    first = np.searchsorted(starts + width, ebegin, side='right')
+    last = np.searchsorted(starts, eend, side='left') - 1
+
+    # windows of each pair of nodes, as disjoint ranges joined when consecutive
+    group = low * n + high
+    order = np.lexsort((first, group))
+    group, first, last = _disjoint_ranges(group[order], first[order], last[order], count)
+    if len(group):
+        joined = np.empty(len(group), dtype=bool)
+        joined[0] = False
+        joined[1:] = (group[1:] == group[:-1]) & (first[1:] == last[:-1] + 1)
+        heads = np.flatnonzero(~joined)
+        group, first, last = group[heads], first[heads], np.maximum.reduceat(last, heads)
+
+    # ranges in the nodes of the segment tree covering them, leaves are size + window index
+    size = 1
+    while size < count:
+        size *= 2
+    tree = {}
+    for pair, lo, hi in zip(group.tolist(), (first + size).tolist(), (last + size + 1).tolist()):
+        while lo < hi:
+            if lo & 1:
+                tree.setdefault(lo, []).append(pair)
+                lo += 1
+            if hi & 1:
+                hi -= 1
+                tree.setdefault(hi, []).append(pair)
+            lo //= 2
+            hi //= 2
+
+    # union-find by size without path compression, so that merges can be undone,
+    # in C long arrays ('q' is missing in Python 2), which NumPy views as dtype 'l'
+    parent = array('l', range(n))
+    component_size = array('l', [1] * n)
+    degree = array('l', [0] * n)
+    views = [np.frombuffer(a, dtype='l') if n else np.zeros(0, dtype='l')
+             for a in (parent, component_size, degree)]
+
+    # depth-first traversal of the tree, a node is pushed again as ~node to undo its merges after its children
+    merges = []
+    stack = [1]
+    while stack:
+        node = stack.pop()
+        if node < 0:
+            for x, y, root in reversed(merges.pop()):
+                degree[x] -= 1
+                degree[y] -= 1
+                if root >= 0:
+                    component_size[parent[root]] -= component_size[root]
+                    parent[root] = root
+            continue
+
+        undo = []
+        for pair in tree.get(node, ()):
+            x, y = divmod(pair, n)
+            degree[x] += 1
+            degree[y] += 1
+            rx, ry = x, y
+            while parent[rx] != rx:
+                rx = parent[rx]
+            while parent[ry] != ry:
+                ry = parent[ry]
+            if rx == ry:
+                undo.append((x, y, -1))
+                continue
+            if component_size[rx] < component_size[ry]:
+                rx, ry = ry, rx
+            parent[ry] = rx
+            component_size[rx] += component_size[ry]
+            undo.append((x, y, ry))
+        merges.append(undo)
+        stack.append(~node)
+
+        if node >= size:
+            yield _window_components(views, sizes)
+            continue
+        for child in (2 * node + 1, 2 * node):
+            # skip the subtrees past the last window
+            leaf = child
+            while leaf < size:
+                leaf *= 2
+            if leaf - size < count:
+                stack.append(child)
+
+
+def _window_components(views, sizes):
+    """Return the component labels, or sizes, of the nodes with edges from the union-find arrays."""
+    import numpy as np
+
+    parent, component_size, degree = views
+    active = degree > 0
+
+    # roots by pointer jumping, as deep as the union-find trees, which is logarithmic
+    roots = parent.copy()
+    while True:
+        jumped = parent[roots]
+        if np.array_equal(jumped, roots):
+            break
+        roots = jumped
+
+    if sizes:
+        return np.sort(component_size[np.unique(roots[active])])[::-1]
+
+    first = np.full(len(roots), len(roots), dtype=np.int64)
+    positions = np.flatnonzero(active)
+    np.minimum.at(first, roots[positions], positions)
+    labels = first[roots]
+    labels[~active] = -1
+    return labels
@@ -0,0 +1,431 @@
+"""
+Temporal motif counting for interval graphs.
+
+A delta-temporal motif is a sequence of three edges, ordered in time, on two
+or three nodes, in which the last edge begins at most delta time units after
+the first one. Every edge is an event at its begin time, edges which begin at the
+same time are ordered as in `IntervalGraph.edges`, sorted by end and endpoints.
+
+A motif is represented as the tuple of its three edges in time order, on nodes
+0, 1 and 2, labeled as in the smallest such tuple. In an IntervalDiGraph, edges
+are directed from u to v and there are 36 motifs: 4 on two nodes, and 32 on three
+nodes. In an IntervalGraph, there are 5 motifs: 1 on two nodes, and 4 on three nodes.
+Self-loops are never part of a motif.
+"""
+from itertools import permutations, product
+
+import networkx as nx
+
+__all__ = ['temporal_motif_counts']
+
+
+def temporal_motif_counts(G, delta, size=None, processes=1):
+    """Count all the delta-temporal motifs of three edges of G.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+
+    delta : number
+        Largest time between the beginnings of the first and the last edge of a motif.
+
+    size : 2, 3 or None, optional (default= None)
+        Number of nodes of the motifs to count. If None, motifs on both
+        two and three nodes are counted.
+
+    processes : integer or None, optional (default= 1)
+        Number of worker processes counting motifs, each in a shard of time.
+        If None, the number of CPUs is used.
+
+    Returns
+    -------
+    counts : dict
+        Dict keyed by motif, as a tuple of three edges on nodes 0, 1 and 2,
+        to the number of its occurrences in G. Every motif of the requested
+        size is a key, including those which do not occur.
+
+    Raises
+    ------
+    NetworkXError
+        If delta is negative, or size is not 2, 3 or None.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalDiGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 1, 1, 5), (1, 2, 3, 5), (2, 3, 4, 10), (3, 1, 20, 30)])
+    >>> counts = dnx.temporal_motif_counts(G, 5)
+    >>> counts[((0, 1), (1, 0), (0, 1))]
+    1
+    >>> counts[((0, 1), (1, 0), (1, 2))]
+    1
+    >>> sum(counts.values())
+    4
+
+    In an IntervalGraph, motifs are undirected.
+
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 1, 5), (3, 1, 2, 5)])
+    >>> dnx.temporal_motif_counts(G, 2, size=3)
+    {((0, 1), (0, 1), (0, 2)): 0, ((0, 1), (0, 2), (0, 1)): 0, ((0, 1), (0, 2), (0, 2)): 0, ((0, 1), (0, 2), (1, 2)): 1}
+
+    Notes
+    -----
+    The counter-based algorithms of Paranjape et al. [1]_ count all the motifs in
+    a single pass over the time-sorted edges of each part of G, with a sliding window of
+    width delta: the edges of each pair of nodes for motifs on two nodes, the edges
+    of each node for star motifs, in which one node is in all three edges, and the
+    edges of each triangle of the static graph for triangle motifs. Triangles are
+    only searched in the static graphs of the edges in two consecutive blocks of
+    width delta. When an edge
+    enters the window, the number of motifs it completes is read from counters of
+    the single edges and pairs of edges in the window, which are then updated in
+    constant time. Thus motifs are counted in time linear in the number of edges,
+    plus the number of edges of each triangle, times the number of triangles.
+
+    With several processes, the edges are split in shards of consecutive begin times.
+    Each shard counts the motifs whose first edge is in it, from its edges and
+    those which begin within delta after it.
+
+    References
+    ----------
+    .. [1] A. Paranjape, A. R. Benson and J. Leskovec.
+       Motifs in Temporal Networks.
+       WSDM 2017.
+    """
+    if delta < 0:
+        raise nx.NetworkXError("temporal_motif_counts: delta must be non-negative, {0} was passed.".format(delta))
+    if size not in (None, 2, 3):
+        raise nx.NetworkXError("temporal_motif_counts: size must be 2, 3 or None, {0} was passed.".format(size))
+
+    import numpy as np
+
+    begin, _, u, v, labels, _ = G._edge_columns()
+    loops = u == v
+    if loops.any():
+        begin, u, v = begin[~loops], u[~loops], v[~loops]
+
+    directed = G.is_directed()
+    edges = (begin, u, v, len(labels), directed, delta, size)
+
+    if processes == 1 or len(begin) < 2:
+        counts = _motif_arrays(edges, 0, len(begin))
+    else:
+        counts = _motif_arrays_pool(edges, processes)
+
+    motifs = {}
+    for keys, shard_counts in zip(_motif_keys(directed, size), counts):
+        for key, count in zip(keys, shard_counts):
+            if key is not None:
+                motifs[key] = motifs.get(key, 0) + int(count)
+
+    return motifs
+
+
+def _motif_arrays_pool(edges, processes):
+    """Return the motif counters of `_motif_arrays`, summed over shards counted by a pool of worker processes."""
+    import numpy as np
+    from multiprocessing import Pool, cpu_count
+
+    if processes is None:
+        processes = cpu_count()
+
+    begin = edges[0]
+    delta = edges[5]
+    starts = [len(begin) * k // processes for k in range(processes + 1)]
+    starts = sorted(set(starts))
+
+    # the motifs whose first edge is in [lo, hi) are those of the edges in [lo, halo),
+    # without those of the edges in [hi, halo)
+    tasks = []
+    for lo, hi in zip(starts, starts[1:]):
+        halo = int(np.searchsorted(begin, begin[hi - 1] + delta, side='right'))
+        tasks.append((lo, halo, 1))
+        if hi < halo:
+            tasks.append((hi, halo, -1))
+
+    pool = Pool(processes, initializer=_init_motif_worker, initargs=(edges,))
+    try:
+        results = pool.map(_shard_motif_arrays, tasks)
+    finally:
+        pool.terminate()
+
+    return [sum(counts) for counts in zip(*results)]
+
+
+def _init_motif_worker(edges):
+    """Initialize a temporal_motif_counts worker process."""
+    global _motif_worker
+    _motif_worker = edges
+
+
+def _shard_motif_arrays(task):
+    """Return the motif counters of the edges in [lo, hi) of a temporal_motif_counts worker, times sign."""
+    lo, hi, sign = task
+    return [sign * counts for counts in _motif_arrays(_motif_worker, lo, hi)]
+
+
+def _motif_arrays(edges, lo, hi):
+    """Return the counters of the pair, star and triangle motifs of the edges in [lo, hi).
+
+    Parameters
+    ----------
+    edges : tuple
+        Begin times (sorted), integer ids of the nodes u and v, number of node ids,
+        whether edges are directed, delta and size, as set up by `temporal_motif_counts`.
+
+    Returns
+    -------
+    pair, star, triangle : NumPy arrays
+        Counters in the layouts of `_sequence_counts` for the edges of pairs,
+        `_star_counts`, and `_sequence_counts` for the edges of triangles,
+        matching the keys of `_motif_keys`.
+    """
+    import numpy as np
+
+    begin, u, v, n, directed, delta, size = edges
+    begin, u, v = begin[lo:hi], u[lo:hi], v[lo:hi]
+    ndirs = 2 if directed else 1
+
+    pair = np.zeros(ndirs ** 3, dtype=np.int64)
+    star = np.zeros(3 * ndirs ** 3, dtype=np.int64)
+    triangle = np.zeros((3 * ndirs) ** 3, dtype=np.int64)
+
+    times = begin.tolist()
+    low = np.minimum(u, v)
+    high = np.maximum(u, v)
+    # direction of each edge, relative to its pair of nodes, or to its node
+    flips = ((u != low).astype(np.int64) if directed else np.zeros(len(u), dtype=np.int64)).tolist()
+    edge_keys = low * n + high
+
+    if size in (None, 2):
+        # edges of each pair of nodes, in time order
+        order = np.argsort(edge_keys, kind='stable')
+        bounds = (np.flatnonzero(np.diff(edge_keys[order])) + 1).tolist()
+        order = order.tolist()
+        for start, stop in zip([0] + bounds, bounds + [len(order)]):
+            if stop - start >= 3:
+                rows = order[start:stop]
+                pair += _sequence_counts([times[r] for r in rows], [flips[r] for r in rows], ndirs, delta)
+
+    if size == 2:
+        return pair, star, triangle
+
+    # edges of each node, as the center of stars, in time order
+    centers = np.concatenate((u, v))
+    order_c = np.lexsort((np.tile(np.arange(len(u)), 2), centers))
+    centers = centers[order_c]
+    bounds_c = np.flatnonzero(np.diff(centers)) + 1
+    nbrs = np.concatenate((v, u))[order_c].tolist()
+    dirs = (np.concatenate((np.zeros(len(u), dtype=np.int64), np.ones(len(v), dtype=np.int64)))
+            if directed else np.zeros(2 * len(u), dtype=np.int64))[order_c].tolist()
+    rows_c = (order_c % max(len(u), 1)).tolist()
+    for start, stop in zip(np.concatenate(([0], bounds_c)).tolist(),
+                           np.concatenate((bounds_c, [len(centers)])).tolist()):
+        if stop - start >= 3 and len(set(nbrs[start:stop])) > 1:
+            star += _star_counts([times[r] for r in rows_c[start:stop]], nbrs[start:stop],
+                                 dirs[start:stop], ndirs, delta)
+
+    # the three edges of a motif are in a block of width delta, or in two consecutive ones:
+    # the triangle motifs whose first edge is in a block are those of the edges in it and the next one,
+    # without those of the edges in the next one
+    if len(times):
+        blocks = np.floor(begin / delta) if delta > 0 else begin
+        bounds_b = (np.flatnonzero(np.diff(blocks)) + 1).tolist()
+        firsts = blocks[[0] + bounds_b].tolist()
+        starts_b = [0] + bounds_b
+        stops_b = bounds_b + [len(times)]
+        edge_keys = edge_keys.tolist()
+        for b in range(len(starts_b)):
+            if b + 1 < len(starts_b) and delta > 0 and firsts[b + 1] == firsts[b] + 1:
+                triangle += _triangle_counts(times, edge_keys, flips, starts_b[b], stops_b[b + 1], n, ndirs, delta)
+                triangle -= _triangle_counts(times, edge_keys, flips, starts_b[b + 1], stops_b[b + 1], n, ndirs, delta)
+            else:
+                triangle += _triangle_counts(times, edge_keys, flips, starts_b[b], stops_b[b], n, ndirs, delta)
+
+    return pair, star, triangle
+
+
+def _triangle_counts(times, keys, flips, lo, hi, n, ndirs, delta):
+    """Return the counters of the triangle motifs of the edges in [lo, hi), from the triangles of their static graph."""
+    import numpy as np
+
+    triangle = np.zeros((3 * ndirs) ** 3, dtype=np.int64)
+    if hi - lo < 3:
+        return triangle
+
+    pairs = {}
+    adj = {}
+    for r in range(lo, hi):
+        rows = pairs.get(keys[r])
+        if rows is None:
+            rows = pairs[keys[r]] = []
+            x, y = divmod(keys[r], n)
+            adj.setdefault(x, set()).add(y)
+            adj.setdefault(y, set()).add(x)
+        rows.append(r)
+
+    for x, nbrs_x in adj.items():
+        for y in nbrs_x:
+            if y <= x:
+                continue
+            for z in nbrs_x & adj[y]:
+                if z <= y:
+                    continue
+                rows = []
+                labels = []
+                for p, key in enumerate((x * n + y, x * n + z, y * n + z)):
+                    rows.extend(pairs[key])
+                    labels.extend(p * ndirs + flips[r] for r in pairs[key])
+                # rows are positions in time order
+                merged = sorted(range(len(rows)), key=rows.__getitem__)
+                triangle += _sequence_counts([times[rows[i]] for i in merged], [labels[i] for i in merged],
+                                             3 * ndirs, delta)
+
+    return triangle
+
+
+def _sequence_counts(times, labels, nlabels, delta):
+    """Return the counts of the sequences of three labels of events within delta time units.
+
+    Returns a NumPy array in which the count of labels (a, b, c) is at a * nlabels**2 + b * nlabels + c.
+    """
+    import numpy as np
+
+    nl = nlabels
+    c1 = [0] * nl
+    c2 = [0] * nl ** 2
+    c3 = [0] * nl ** 3
+    first = 0
+    for k, t in enumerate(times):
+        # remove the events which are more than delta before the new one
+        while t - times[first] > delta:
+            a = labels[first]
+            c1[a] -= 1
+            for b in range(nl):
+                c2[a * nl + b] -= c1[b]
+            first += 1
+
+        c = labels[k]
+        for ab in range(nl * nl):
+            c3[ab * nl + c] += c2[ab]
+        for a in range(nl):
+            c2[a * nl + c] += c1[a]
+        c1[c] += 1
+
+    return np.array(c3, dtype=np.int64)
+
+
+def _star_counts(times, nbrs, dirs, ndirs, delta):
+    """Return the counts of the star motifs of the events of a center node within delta time units.
+
+    The three events of a star motif have exactly two neighbors: the first two
+    events share a neighbor (pattern 0), or the first and last (pattern 1), or
+    the last two (pattern 2). Returns a NumPy array in which the count of
+    the pattern p with directions (a, b, c) is at p * ndirs**3 + a * ndirs**2 + b * ndirs + c.
+
+    Besides the counters of events and pairs of events with the same neighbor,
+    every event in the window keeps the number of events of each direction added
+    before it. Since the window holds all the events after its first one, the
+    pairs of events which begin or end with a neighbor are derived from those numbers.
+    """
+    import numpy as np
+
+    nd = ndirs
+    nd2 = nd * nd
+    counts = [0] * (3 * nd ** 3)
+    added = [0] * nd
+    removed = [0] * nd
+    same = [0] * nd2
+    # neighbor -> events in the window by direction, pairs of events with the neighbor,
+    # sums of the added counters after its events, and before its events
+    nbr_counters = {}
+    before = []
+    first = 0
+    for k, t in enumerate(times):
+        while t - times[first] > delta:
+            a = dirs[first]
+            single, pairs, after_sums, before_sums = nbr_counters[nbrs[first]]
+            single[a] -= 1
+            snapshot = before[first]
+            for b in range(nd):
+                same[a * nd + b] -= single[b]
+                pairs[a * nd + b] -= single[b]
+                after_sums[a * nd + b] -= snapshot[b] + (b == a)
+                before_sums[a * nd + b] -= snapshot[b]
+            removed[a] += 1
+            first += 1
+
+        c = dirs[k]
+        counters = nbr_counters.get(nbrs[k])
+        if counters is None:
+            counters = nbr_counters[nbrs[k]] = ([0] * nd, [0] * nd2, [0] * nd2, [0] * nd2)
+        single, pairs, after_sums, before_sums = counters
+
+        for a in range(nd):
+            for b in range(nd):
+                ab = a * nd + b
+                own = pairs[ab]
+                index = ab * nd + c
+                # first two events with another neighbor
+                counts[index] += same[ab] - own
+                # first event with this neighbor, second one with another
+                counts[nd ** 3 + index] += single[a] * added[b] - after_sums[ab] - own
+                # second event with this neighbor, first one with another
+                counts[2 * nd ** 3 + index] += before_sums[b * nd + a] - single[b] * removed[a] - own
+
+        before.append(tuple(added))
+        for a in range(nd):
+            same[a * nd + c] += single[a]
+            pairs[a * nd + c] += single[a]
+            after_sums[c * nd + a] += added[a] + (a == c)
+            before_sums[c * nd + a] += added[a]
+        single[c] += 1
+        added[c] += 1
+
+    return np.array(counts, dtype=np.int64)
+
+
+def _motif_keys(directed, size):
+    """Return the motifs of the counters of `_motif_arrays`, None for counters which are not motifs."""
+    ndirs = 2 if directed else 1
+
+    def edge(x, y, d):
+        return (x, y) if d == 0 else (y, x)
+
+    pair = [None] * ndirs ** 3
+    star = [None] * (3 * ndirs ** 3)
+    triangle = [None] * (3 * ndirs) ** 3
+
+    if size in (None, 2):
+        for i, (a, b, c) in enumerate(product(range(ndirs), repeat=3)):
+            pair[i] = _canonical_motif([edge(0, 1, a), edge(0, 1, b), edge(0, 1, c)], directed)
+
+    if size in (None, 3):
+        # center 0, neighbors 1 and 2
+        for p, nbrs in enumerate(((2, 2, 1), (1, 2, 1), (2, 1, 1))):
+            for i, dirs in enumerate(product(range(ndirs), repeat=3)):
+                star[p * ndirs ** 3 + i] = _canonical_motif([edge(0, x, d) for x, d in zip(nbrs, dirs)], directed)
+
+        # pairs of the triangle (0, 1), (0, 2), (1, 2)
+        sides = ((0, 1), (0, 2), (1, 2))
+        for ps in permutations(range(3)):
+            for dirs in product(range(ndirs), repeat=3):
+                a, b, c = (p * ndirs + d for p, d in zip(ps, dirs))
+                triangle[(a * 3 * ndirs + b) * 3 * ndirs + c] = _canonical_motif(
+                    [edge(sides[p][0], sides[p][1], d) for p, d in zip(ps, dirs)], directed)
+
+    return pair, star, triangle
+
+
+def _canonical_motif(edges, directed):
+    """Return the smallest tuple of the edges, over all the labelings of their nodes."""
+    nodes = sorted(set(n for e in edges for n in e))
+    best = None
+    for labels in permutations(range(len(nodes))):
+        relabel = dict(zip(nodes, labels))
+        motif = tuple((relabel[x], relabel[y]) if directed else tuple(sorted((relabel[x], relabel[y])))
+                      for x, y in edges)
+        if best is None or motif < best:
+            best = motif
+
+    return best
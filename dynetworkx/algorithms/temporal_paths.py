@@ -0,0 +1,427 @@
+"""
+Time-respecting (temporal) path algorithms for interval graphs.
+
+A temporal path is a sequence of edges, each traversed at a departure time
+during its interval, such that every edge is traversed after arriving at
+its first node. Traversing an edge takes `delay` time units. An edge with
+interval [b, e) can be traversed departing at any time t with b <= t < e,
+arriving at time t + delay.
+In an IntervalDiGraph, edges are only traversed from u to v.
+
+All the algorithms only consider paths within the interval [begin, end):
+departing at or after begin and arriving before end.
+"""
+from heapq import heappush, heappop
+
+import networkx as nx
+
+__all__ = ['temporal_earliest_arrival',
+           'temporal_latest_departure',
+           'temporal_fastest',
+           'temporal_shortest']
+
+
+def temporal_earliest_arrival(G, source, begin=None, end=None, delay=0, return_paths=False):
+    """Compute the earliest arrival times from source to all reachable nodes.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+
+    source : node or container of nodes
+        Starting node for paths. If a container of nodes is given, the
+        earliest arrival from any of them is computed.
+
+    begin : number, optional (default= beginning of G)
+        Time of departure from source.
+
+    end : number, optional (default= None)
+        Paths must arrive before end. If None, there is no limit.
+
+    delay : number, optional (default= 0)
+        Time it takes to traverse an edge.
+
+    return_paths : bool, optional (default= False)
+        If True, a dict of the paths to each node is returned as the second argument.
+
+    Returns
+    -------
+    arrival : dict
+        Dict keyed by node to the earliest arrival time at that node.
+        Sources arrive at begin.
+
+    paths : dict
+        Dict keyed by node to a list of nodes of an earliest arrival
+        path from source to that node, if return_paths= True.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 7, 10), (1, 3, 12, 20), (3, 4, 0, 30)])
+    >>> dnx.temporal_earliest_arrival(G, 1)
+    {1: 0, 2: 0, 3: 7, 4: 7}
+    >>> dnx.temporal_earliest_arrival(G, 1, begin=6, delay=1)
+    {1: 6, 3: 13, 4: 14}
+
+    Notes
+    -----
+    A Dijkstra-like label-setting search in order of arrival time. From each
+    node, only the edge with the smallest begin among the edges to a neighbor
+    which have not ended is followed, which is a binary search.
+    """
+    sources = _sources(G, source)
+    if begin is None:
+        begin = G.interval()[0]
+    if end is None:
+        end = float('inf')
+
+    adj = G._window_adjacency(begin, end)
+
+    arrival = {}
+    heap = []
+    for i, n in enumerate(sources):
+        heappush(heap, (begin, i, n, (n, None)))
+
+    count = len(heap)
+    parents = {}
+    while heap:
+        t, _, u, path = heappop(heap)
+        if u in arrival:
+            continue
+        arrival[u] = t
+        parents[u] = path
+
+        if t >= end - delay:
+            continue
+
+        for v, iedges in adj.get(u, {}).items():
+            if v in arrival:
+                continue
+            iedge = iedges.first_overlap(t, end - delay)
+            if iedge is None:
+                continue
+
+            heappush(heap, (max(t, iedge.begin) + delay, count, v, (v, path)))
+            count += 1
+
+    if return_paths:
+        return arrival, {n: _unwind(path) for n, path in parents.items()}
+
+    return arrival
+
+
+def temporal_latest_departure(G, target, begin=None, end=None, delay=0, return_paths=False):
+    """Compute the latest departure times from all nodes which reach target.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+        Both begin and end of every edge must be integers.
+
+    target : node or container of nodes
+        Ending node for paths. If a container of nodes is given, the
+        latest departure to any of them is computed.
+
+    begin : integer, optional (default= None)
+        Paths must depart at or after begin. If None, there is no limit.
+
+    end : integer, optional (default= end of G + delay)
+        Paths must arrive at target before end. If None and G has no edges,
+        there is no end to depart before, and no node departs.
+
+    delay : integer, optional (default= 0)
+        Time it takes to traverse an edge.
+
+    return_paths : bool, optional (default= False)
+        If True, a dict of the paths from each node is returned as the second argument.
+
+    Returns
+    -------
+    departure : dict
+        Dict keyed by node to the latest time of departure from that node,
+        which still reaches target before end. Targets depart at end - 1.
+        Empty if no time of departure is in [begin, end), or if end is None
+        and G has no edges.
+
+    paths : dict
+        Dict keyed by node to a list of nodes of a latest departure
+        path from that node to target, if return_paths= True.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 7, 10), (1, 3, 12, 20), (3, 4, 0, 30)])
+    >>> dnx.temporal_latest_departure(G, 1, end=15)
+    {1: 14, 3: 14, 4: 14, 2: 9}
+    >>> dnx.temporal_latest_departure(G, 1, begin=15, end=15)
+    {}
+    >>> H = dnx.IntervalGraph()
+    >>> H.add_node(1)
+    >>> dnx.temporal_latest_departure(H, 1)
+    {}
+    """
+    targets = _sources(G, target)
+    if end is None:
+        if not len(G.edges()):
+            return ({}, {}) if return_paths else {}
+        end = G.interval()[1] + delay
+    if begin is None:
+        begin = float('-inf')
+
+    # not even the targets depart in an empty window
+    if begin > end - 1:
+        return ({}, {}) if return_paths else {}
+
+    adj = G._window_adjacency(begin, end, predecessors=True)
+
+    departure = {}
+    heap = []
+    for i, n in enumerate(targets):
+        heappush(heap, (-(end - 1), i, n, (n, None)))
+
+    count = len(heap)
+    parents = {}
+    while heap:
+        t, _, v, path = heappop(heap)
+        if v in departure:
+            continue
+        t = -t
+        departure[v] = t
+        parents[v] = path
+
+        # latest departure towards v, to be there by t
+        limit = t - delay
+        for u, iedges in adj.get(v, {}).items():
+            if u in departure:
+                continue
+            latest_end = iedges.latest_end(limit + 1)
+            if latest_end is None:
+                continue
+
+            latest = min(latest_end - 1, limit)
+            if latest < begin:
+                continue
+
+            heappush(heap, (-latest, count, u, (u, path)))
+            count += 1
+
+    if return_paths:
+        return departure, {n: _unwind(path)[::-1] for n, path in parents.items()}
+
+    return departure
+
+
+def temporal_fastest(G, source, begin=None, end=None, delay=0, return_paths=False):
+    """Compute the durations of the fastest paths from source to all reachable nodes.
+
+    The duration of a path is the time between the departure from source
+    and the arrival at its last node. The departure from source is as late as possible.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+        Both begin and end of every edge must be integers.
+
+    source : node or container of nodes
+        Starting node for paths. If a container of nodes is given, the
+        fastest path from any of them is computed.
+
+    begin : integer, optional (default= beginning of G)
+        Paths must depart at or after begin.
+
+    end : integer, optional (default= None)
+        Paths must arrive before end. If None, there is no limit.
+
+    delay : integer, optional (default= 0)
+        Time it takes to traverse an edge.
+
+    return_paths : bool, optional (default= False)
+        If True, a dict of the paths to each node is returned as the second argument.
+
+    Returns
+    -------
+    duration : dict
+        Dict keyed by node to the duration of the fastest path to that node.
+        Sources have a duration of 0.
+
+    paths : dict
+        Dict keyed by node to a list of nodes of a fastest path from
+        source to that node, if return_paths= True.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 7, 10), (1, 3, 12, 20), (3, 4, 0, 30)])
+    >>> dnx.temporal_fastest(G, 1, delay=1)
+    {1: 0, 2: 1, 3: 1, 4: 2}
+
+    Notes
+    -----
+    A label-setting search in order of duration. Since waiting at source is free,
+    a label holds a whole range of departure times from source, which
+    reach a node after the same duration. Labels which are dominated
+    (with an earlier departure and a later arrival) by a label of the same node are pruned.
+    """
+    sources = _sources(G, source)
+    if begin is None:
+        begin = G.interval()[0]
+    latest = float('inf') if end is None else end - 1 - delay
+
+    adj = G._window_adjacency(begin, float('inf') if end is None else end)
+
+    # a label (duration, lo, hi) reaches its node at time s + duration, for any departure s in [lo, hi]
+    duration = {}
+    labels = {}
+    heap = []
+    for i, n in enumerate(sources):
+        heappush(heap, (0, i, begin, latest, n, (n, None)))
+
+    count = len(heap)
+    parents = {}
+    while heap:
+        d, _, lo, hi, u, path = heappop(heap)
+        if any(hi <= hi1 and lo1 <= lo + d - d1 for d1, lo1, hi1 in labels.get(u, ())):
+            continue
+        labels.setdefault(u, []).append((d, lo, hi))
+        if u not in duration:
+            duration[u] = d
+            parents[u] = path
+
+        for v, iedges in adj.get(u, {}).items():
+            for iedge in iedges.overlap(lo + d, latest + 1):
+                if hi + d < iedge.begin:
+                    # wait for the edge, departing from source as late as possible
+                    label = (iedge.begin + delay - hi, hi, hi)
+                else:
+                    label = (d + delay, max(lo, iedge.begin - d), min(hi, min(iedge.end - 1, latest) - d))
+                    if label[1] > label[2]:
+                        continue
+
+                heappush(heap, (label[0], count, label[1], label[2], v, (v, path)))
+                count += 1
+
+    if return_paths:
+        return duration, {n: _unwind(path) for n, path in parents.items()}
+
+    return duration
+
+
+def temporal_shortest(G, source, begin=None, end=None, delay=0, return_paths=False):
+    """Compute the number of edges of the shortest temporal paths from source to all reachable nodes.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+
+    source : node or container of nodes
+        Starting node for paths. If a container of nodes is given, the
+        shortest path from any of them is computed.
+
+    begin : number, optional (default= beginning of G)
+        Time of departure from source.
+
+    end : number, optional (default= None)
+        Paths must arrive before end. If None, there is no limit.
+
+    delay : number, optional (default= 0)
+        Time it takes to traverse an edge.
+
+    return_paths : bool, optional (default= False)
+        If True, a dict of the paths to each node is returned as the second argument.
+
+    Returns
+    -------
+    length : dict
+        Dict keyed by node to the number of edges of the shortest temporal path to that node.
+
+    paths : dict
+        Dict keyed by node to a list of nodes of a shortest temporal path
+        from source to that node, which arrives the earliest among them, if return_paths= True.
+
+    Examples
+    --------
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 7, 10), (1, 3, 12, 20), (3, 4, 0, 30)])
+    >>> dnx.temporal_shortest(G, 1)
+    {1: 0, 2: 1, 3: 1, 4: 2}
+    >>> dnx.temporal_shortest(G, 1, end=12)
+    {1: 0, 2: 1, 3: 2, 4: 3}
+
+    Notes
+    -----
+    A breadth-first search, which keeps the earliest arrival at each
+    node by the number of edges of the path so far. A node is searched again
+    from a longer path only if it arrives there earlier.
+    """
+    sources = _sources(G, source)
+    if begin is None:
+        begin = G.interval()[0]
+    if end is None:
+        end = float('inf')
+
+    adj = G._window_adjacency(begin, end)
+
+    length = {}
+    arrival = {}
+    parents = {}
+    frontier = {}
+    for n in sources:
+        length[n] = 0
+        arrival[n] = begin
+        parents[n] = (n, None)
+        frontier[n] = (begin, parents[n])
+
+    hops = 0
+    while frontier:
+        hops += 1
+        next_frontier = {}
+        for u, (t, path) in frontier.items():
+            if t >= end - delay:
+                continue
+
+            for v, iedges in adj.get(u, {}).items():
+                iedge = iedges.first_overlap(t, end - delay)
+                if iedge is None:
+                    continue
+
+                t_v = max(t, iedge.begin) + delay
+                if t_v < arrival.get(v, float('inf')):
+                    arrival[v] = t_v
+                    next_frontier[v] = (t_v, (v, path))
+                    if length.get(v, hops) == hops:
+                        length[v] = hops
+                        parents[v] = (v, path)
+
+        frontier = next_frontier
+
+    if return_paths:
+        return length, {n: _unwind(path) for n, path in parents.items()}
+
+    return length
+
+
+def _sources(G, source):
+    """Return the list of nodes of a node or container of nodes, raising NodeNotFound if any is not in G."""
+    if source in G:
+        return [source]
+
+    try:
+        sources = list(source)
+    except TypeError:
+        raise nx.NodeNotFound("Source {} not in G".format(source))
+
+    for n in sources:
+        if n not in G:
+            raise nx.NodeNotFound("Source {} not in G".format(n))
+
+    return sources
+
+
+def _unwind(path):
+    """Return the list of nodes of a path linked as (node, parent path) 2-tuples, from the first node."""
+    nodes = []
+    while path is not None:
+        nodes.append(path[0])
+        path = path[1]
+
+    return nodes[::-1]
@@ -0,0 +1,61 @@
+from nose.tools import assert_equal, assert_raises
+import random
+
+import networkx as nx
+
+import dynetworkx as dnx
+
+
+def brute_components(G, width, step):
+    """Return the labels and sizes of the components of the subgraph of each window, found by networkx."""
+    nodes = list(G.nodes())
+    begin, end = G.interval()
+    windows = []
+    while begin < end and len(G.edges()):
+        H = G.to_subgraph(begin, begin + width)
+        H = H.to_undirected() if H.is_directed() else H
+        labels = [-1] * len(nodes)
+        for component in nx.connected_components(H):
+            first = min(nodes.index(n) for n in component)
+            for n in component:
+                labels[nodes.index(n)] = first
+        windows.append((labels, sorted((len(c) for c in nx.connected_components(H)), reverse=True)))
+        begin += step
+    return windows
+
+
+class TestWindowedConnectedComponents(object):
+    """Tests of windowed_connected_components against the components of the subgraph of each window."""
+
+    def test_brute_force(self):
+        rng = random.Random(5)
+        for Graph in (dnx.IntervalGraph, dnx.IntervalDiGraph, dnx.ArrayIntervalGraph, dnx.SQLiteIntervalGraph):
+            for _ in range(40):
+                G = Graph()
+                nodes = rng.randint(1, 10)
+                if rng.random() < 0.3:
+                    G.add_node('isolated')
+                for _ in range(rng.randint(0, 30)):
+                    begin = rng.randint(0, 50)
+                    G.add_edge(rng.randrange(nodes), rng.randrange(nodes), begin,
+                               begin + rng.choice([1, 2, 3, 7, 20]))
+                width = rng.choice([1, 2, 3.5, 5, 10, 100])
+                step = rng.choice([1, 2, 4, 7.5, width])
+
+                expected = brute_components(G, width, step)
+                labels = list(dnx.windowed_connected_components(G, width, step))
+                sizes = list(dnx.windowed_connected_components(G, width, step, sizes=True))
+                assert_equal([l.tolist() for l in labels], [l for l, s in expected])
+                assert_equal([s.tolist() for s in sizes], [s for l, s in expected])
+
+    def test_default_step(self):
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, 0, 10), (2, 3, 5, 15), (4, 5, 0, 20), (3, 4, 12, 14)])
+        assert_equal([l.tolist() for l in dnx.windowed_connected_components(G, 5)],
+                     [l for l, s in brute_components(G, 5, 5)])
+
+    def test_invalid_window(self):
+        G = dnx.IntervalGraph()
+        G.add_edge(1, 2, 0, 10)
+        assert_raises(nx.NetworkXError, dnx.windowed_connected_components, G, 0)
+        assert_raises(nx.NetworkXError, dnx.windowed_connected_components, G, 5, step=-1)
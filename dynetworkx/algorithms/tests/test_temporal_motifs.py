@@ -0,0 +1,88 @@
+from nose.tools import assert_equal, assert_raises
+from itertools import combinations, permutations
+import random
+
+import networkx as nx
+
+import dynetworkx as dnx
+
+
+def canonical(edges, directed):
+    """Return the smallest tuple of the edges over all the labelings of their nodes with 0, 1 and 2."""
+    nodes = sorted(set(n for e in edges for n in e))
+    motifs = []
+    for labels in permutations(range(len(nodes))):
+        relabel = dict(zip(nodes, labels))
+        motifs.append(tuple((relabel[x], relabel[y]) if directed else tuple(sorted((relabel[x], relabel[y])))
+                            for x, y in edges))
+    return min(motifs)
+
+
+def brute_motif_counts(G, delta):
+    """Count the motifs by enumerating all the triples of edges in time order."""
+    begin, _, u, v, labels, _ = G._edge_columns()
+    events = [(b, x, y) for b, x, y in zip(begin.tolist(), u.tolist(), v.tolist()) if x != y]
+    counts = {}
+    for i, j, k in combinations(range(len(events)), 3):
+        if events[k][0] - events[i][0] > delta:
+            continue
+        edges = [events[i][1:], events[j][1:], events[k][1:]]
+        if len(set(n for e in edges for n in e)) > 3:
+            continue
+        motif = canonical(edges, G.is_directed())
+        counts[motif] = counts.get(motif, 0) + 1
+    return counts
+
+
+def random_graph(Graph, rng):
+    G = Graph()
+    nodes = rng.randint(2, 6)
+    for _ in range(rng.randint(0, 30)):
+        begin = rng.randint(0, 30)
+        G.add_edge(rng.randrange(nodes), rng.randrange(nodes), begin, begin + rng.randint(1, 5))
+    return G
+
+
+class TestTemporalMotifCounts(object):
+    """Tests of temporal_motif_counts against the enumeration of all the triples of edges."""
+
+    def test_brute_force(self):
+        rng = random.Random(1)
+        for Graph in (dnx.IntervalGraph, dnx.IntervalDiGraph, dnx.ArrayIntervalGraph, dnx.SQLiteIntervalGraph):
+            for _ in range(30):
+                G = random_graph(Graph, rng)
+                delta = rng.choice([0, 1, 2, 2.5, 5, 100])
+                counts = dnx.temporal_motif_counts(G, delta)
+                assert_equal(len(counts), 36 if G.is_directed() else 5)
+                expected = brute_motif_counts(G, delta)
+                assert_equal({m: c for m, c in counts.items() if c}, expected)
+
+    def test_sizes(self):
+        rng = random.Random(2)
+        for Graph in (dnx.IntervalGraph, dnx.IntervalDiGraph):
+            for _ in range(10):
+                G = random_graph(Graph, rng)
+                counts = dnx.temporal_motif_counts(G, 4)
+                pairs = dnx.temporal_motif_counts(G, 4, size=2)
+                triples = dnx.temporal_motif_counts(G, 4, size=3)
+                assert_equal(len(pairs), 4 if G.is_directed() else 1)
+                assert_equal(len(triples), 32 if G.is_directed() else 4)
+                assert_equal(pairs, {m: counts[m] for m in pairs})
+                assert_equal(triples, {m: counts[m] for m in triples})
+
+    def test_processes(self):
+        rng = random.Random(3)
+        for Graph in (dnx.IntervalGraph, dnx.IntervalDiGraph):
+            for _ in range(3):
+                G = random_graph(Graph, rng)
+                assert_equal(dnx.temporal_motif_counts(G, 3, processes=3), dnx.temporal_motif_counts(G, 3))
+
+    def test_self_loops(self):
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, 0, 5), (1, 1, 1, 5), (2, 1, 2, 5), (1, 2, 3, 5)])
+        assert_equal(dnx.temporal_motif_counts(G, 10)[((0, 1), (0, 1), (0, 1))], 1)
+
+    def test_invalid_arguments(self):
+        G = dnx.IntervalGraph()
+        assert_raises(nx.NetworkXError, dnx.temporal_motif_counts, G, -1)
+        assert_raises(nx.NetworkXError, dnx.temporal_motif_counts, G, 1, size=4)
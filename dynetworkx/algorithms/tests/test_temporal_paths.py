@@ -0,0 +1,202 @@
+from nose.tools import assert_equal, assert_true, assert_raises
+from collections import deque
+import random
+
+import networkx as nx
+
+import dynetworkx as dnx
+
+
+def random_graphs(Graph, count, seed):
+    """Return small random interval graphs with integer times, some with an isolated node."""
+    rng = random.Random(seed)
+    graphs = []
+    for _ in range(count):
+        G = Graph()
+        G.add_node(0)
+        nodes = rng.randint(2, 7)
+        for _ in range(rng.randint(0, 20)):
+            begin = rng.randint(0, 25)
+            G.add_edge(rng.randrange(nodes), rng.randrange(nodes), begin, begin + rng.randint(1, 6))
+        if rng.random() < 0.3:
+            G.add_node('isolated')
+        graphs.append(G)
+    return graphs
+
+
+def edge_list(G):
+    """Return the (u, v, begin, end) 4-tuples of the edges in every direction they can be traversed."""
+    edges = []
+    for iv in G.edges():
+        u, v = iv.data
+        edges.append((u, v, iv.begin, iv.end))
+        if not G.is_directed():
+            edges.append((v, u, iv.begin, iv.end))
+    return edges
+
+
+def horizon(G, delay):
+    return G.interval()[1] + delay + 1
+
+
+def reachable(G, sources, begin, end, delay):
+    """Return the times at which each node is reached from sources, departing at begin, by
+    exhaustive search of the (node, time) states, moving by waiting one time unit or traversing an edge."""
+    edges = edge_list(G)
+    last = horizon(G, delay) if end is None else min(end, horizon(G, delay))
+    end = float('inf') if end is None else end
+    seen = set((n, begin) for n in sources)
+    queue = deque(seen)
+    while queue:
+        u, t = queue.popleft()
+        moves = [(u, t + 1)] if t + 1 <= last else []
+        moves.extend((v, t + delay) for a, v, b, e in edges if a == u and b <= t < e and t + delay < end)
+        for state in moves:
+            if state not in seen:
+                seen.add(state)
+                queue.append(state)
+
+    times = {}
+    for n, t in seen:
+        times.setdefault(n, []).append(t)
+    return times
+
+
+def brute_earliest_arrival(G, sources, begin, end, delay):
+    return {n: min(times) for n, times in reachable(G, sources, begin, end, delay).items()}
+
+
+def brute_latest_departure(G, targets, begin, end, delay):
+    edges = edge_list(G)
+    good = set()
+    for t in range(end - 1, begin - 1, -1):
+        good.update((n, t) for n in G.nodes() if n in targets or (n, t + 1) in good)
+        changed = True
+        while changed:
+            changed = False
+            for u, v, b, e in edges:
+                if (u, t) not in good and b <= t < e and t + delay <= end - 1 and (v, t + delay) in good:
+                    good.add((u, t))
+                    changed = True
+
+    departure = {}
+    for n, t in good:
+        departure[n] = max(t, departure.get(n, t))
+    return departure
+
+
+def brute_fastest(G, sources, begin, end, delay):
+    duration = {n: 0 for n in sources}
+    for s in range(begin, horizon(G, delay)):
+        for n, t in brute_earliest_arrival(G, sources, s, end, delay).items():
+            if end is None or t < end:
+                duration[n] = min(t - s, duration.get(n, t - s))
+    return duration
+
+
+def brute_shortest(G, sources, begin, end, delay):
+    """Return the fewest edges of a path to each node, by a 0-1 breadth-first search of the (node, time) states."""
+    edges = edge_list(G)
+    last = horizon(G, delay) if end is None else min(end, horizon(G, delay))
+    end = float('inf') if end is None else end
+    hops = {(n, begin): 0 for n in sources}
+    queue = deque(hops)
+    while queue:
+        u, t = queue.popleft()
+        h = hops[(u, t)]
+        if t + 1 <= last and hops.get((u, t + 1), h + 1) > h:
+            hops[(u, t + 1)] = h
+            queue.appendleft((u, t + 1))
+        for a, v, b, e in edges:
+            if a == u and b <= t < e and t + delay < end and hops.get((v, t + delay), h + 2) > h + 1:
+                hops[(v, t + delay)] = h + 1
+                queue.append((v, t + delay))
+
+    length = {}
+    for (n, t), h in hops.items():
+        length[n] = min(h, length.get(n, h))
+    return length
+
+
+def walk(G, path, depart, end, delay):
+    """Return the earliest arrival along the nodes of path departing at depart, or None if it is not a temporal path."""
+    edges = edge_list(G)
+    end = float('inf') if end is None else end
+    t = depart
+    for u, v in zip(path[:-1], path[1:]):
+        departures = [max(t, b) for a, w, b, e in edges if (a, w) == (u, v) and e > t and max(t, b) + delay < end]
+        if not departures:
+            return None
+        t = min(departures) + delay
+    return t
+
+
+class TestTemporalPaths(object):
+    """Tests of the temporal path algorithms against exhaustive searches of small random interval graphs."""
+
+    Graphs = (dnx.IntervalGraph, dnx.IntervalDiGraph, dnx.ArrayIntervalGraph, dnx.SQLiteIntervalGraph)
+
+    def cases(self):
+        rng = random.Random(7)
+        for i, Graph in enumerate(self.Graphs):
+            for G in random_graphs(Graph, 25, seed=i):
+                begin = rng.choice([0, 3, 10])
+                end = rng.choice([None, 12, 20, 40])
+                yield G, begin, end, rng.choice([0, 1, 3])
+
+    def test_earliest_arrival(self):
+        for G, begin, end, delay in self.cases():
+            arrival, paths = dnx.temporal_earliest_arrival(G, 0, begin, end, delay, return_paths=True)
+            assert_equal(arrival, brute_earliest_arrival(G, [0], begin, end, delay))
+            for n, path in paths.items():
+                assert_equal(path[0], 0)
+                assert_equal(path[-1], n)
+                assert_equal(walk(G, path, begin, end, delay), arrival[n])
+
+    def test_latest_departure(self):
+        for G, begin, end, delay in self.cases():
+            if end is None:
+                end = G.interval()[1] + delay
+            departure, paths = dnx.temporal_latest_departure(G, 0, begin, end, delay, return_paths=True)
+            assert_equal(departure, brute_latest_departure(G, [0], begin, end, delay))
+            for n, path in paths.items():
+                assert_equal(path[0], n)
+                assert_equal(path[-1], 0)
+                assert_true(walk(G, path, departure[n], end, delay) <= end - 1)
+
+    def test_fastest(self):
+        for G, begin, end, delay in self.cases():
+            duration = dnx.temporal_fastest(G, 0, begin, end, delay)
+            assert_equal(duration, brute_fastest(G, [0], begin, end, delay))
+
+    def test_shortest(self):
+        for G, begin, end, delay in self.cases():
+            length, paths = dnx.temporal_shortest(G, 0, begin, end, delay, return_paths=True)
+            assert_equal(length, brute_shortest(G, [0], begin, end, delay))
+            for n, path in paths.items():
+                assert_equal(len(path) - 1, length[n])
+                assert_true(walk(G, path, begin, end, delay) is not None)
+
+    def test_several_sources(self):
+        for G, begin, end, delay in self.cases():
+            sources = [n for n in (0, 1, 'isolated') if n in G]
+            assert_equal(dnx.temporal_earliest_arrival(G, sources, begin, end, delay),
+                         brute_earliest_arrival(G, sources, begin, end, delay))
+            assert_equal(dnx.temporal_shortest(G, sources, begin, end, delay),
+                         brute_shortest(G, sources, begin, end, delay))
+
+    def test_graph_without_edges(self):
+        G = dnx.IntervalGraph()
+        G.add_node(1)
+        assert_equal(dnx.temporal_earliest_arrival(G, 1, begin=0), {1: 0})
+        assert_equal(dnx.temporal_latest_departure(G, 1), {})
+        assert_equal(dnx.temporal_latest_departure(G, 1, return_paths=True), ({}, {}))
+        assert_equal(dnx.temporal_latest_departure(G, 1, end=5), {1: 4})
+
+    def test_node_not_found(self):
+        G = dnx.IntervalGraph()
+        G.add_edge(1, 2, 0, 5)
+        for func in (dnx.temporal_earliest_arrival, dnx.temporal_latest_departure,
+                     dnx.temporal_fastest, dnx.temporal_shortest):
+            assert_raises(nx.NodeNotFound, func, G, 3)
+            assert_raises(nx.NodeNotFound, func, G, [1, 3])
@@ -1,2 +1,6 @@
 from .intervalgraph import IntervalGraph
+from .intervaldigraph import IntervalDiGraph
+from .arrayintervalgraph import ArrayIntervalGraph
+from .sqliteintervalgraph import SQLiteIntervalGraph
 from .snapshotgraph import SnapshotGraph
+from .graphviews import window_view
@@ -0,0 +1,928 @@
+from networkx.classes.graph import Graph
+from networkx.exception import NetworkXError
+from intervaltree import Interval, IntervalTree
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.reportviews import NodeDataView
+from dynetworkx.classes.intervalgraph import IntervalGraph, _IntervalEdgeDict, _deep_sizeof
+from dynetworkx.classes.reportviews import _EMPTY_ATTR
+
+
+class ArrayIntervalGraph(IntervalGraph):
+    """Undirected interval graph backed by columnar NumPy arrays.
+
+    ArrayIntervalGraph has the same public API as IntervalGraph, but instead of
+    keeping every edge as an Interval object in an IntervalTree (plus two
+    adjacency dict entries), the edges are stored in parallel arrays
+    `begin`, `end`, `u` and `v` sorted by begin. Nodes are interned to
+    dense integer ids through a node label table.
+
+    An auxiliary array holds the running maximum of `end` in begin order,
+    which turns window queries into two binary searches and one vectorized mask.
+    This makes ArrayIntervalGraph a good fit for large, mostly read-only
+    contact data, where it uses a small fraction of the memory of IntervalGraph.
+
+    Requires NumPy. Both begin and end of every edge must be numbers.
+
+    Parameters
+    ----------
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Examples
+    --------
+    >>> G = dnx.ArrayIntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    >>> G.edges(begin=10)
+    IntervalEdgeView([Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4)), Interval(12, 19, (6, 4))])
+    >>> G.number_of_nodes(begin=5, end=8)
+    3
+
+    Notes
+    -----
+    Added edges are buffered and merged into the sorted arrays, in one
+    vectorized pass, the next time the graph is queried. Thus adding edges in
+    large batches (e.g. with `add_edges_from`) before querying is much faster than
+    interleaving single edge additions and queries. Removing edges rewrites
+    the arrays.
+
+    Edge attribute dicts are only allocated for edges which have attributes,
+    or whose attributes have been accessed.
+    """
+
+    def __init__(self, **attr):
+        """Initialize an array interval graph with name, or graph attributes.
+
+        Parameters
+        ----------
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G = dnx.ArrayIntervalGraph(name='my graph')
+        >>> G.graph
+        {'name': 'my graph'}
+        """
+        import numpy as np
+
+        self.graph = {}  # dictionary for graph attributes
+        self._node = {}
+
+        # node label table
+        self._labels = []
+        self._ids = {}
+
+        # edge columns, sorted by begin
+        self._begin = np.empty(0, dtype=np.int64)
+        self._end = np.empty(0, dtype=np.int64)
+        self._u = np.empty(0, dtype=np.int64)
+        self._v = np.empty(0, dtype=np.int64)
+        self._max_end = np.empty(0, dtype=np.int64)
+        self._eattr = []  # None if no edge has attributes
+
+        # (offsets, rows) of the edges of each node id, in CSR layout, built on the first node query
+        self._node_rows = None
+
+        # edges added since the last merge into the columns, one by one and as blocks of columns
+        self._pending = []
+        self._pending_columns = []
+
+        self._retention = None
+
+        self.graph.update(attr)
+
+    def __getstate__(self):
+        """Return the state of the array interval graph for pickling.
+
+        The edge columns are already flat arrays, and are pickled as they are,
+        after merging any pending edges. The node index is rebuilt when needed.
+        """
+        self._consolidate()
+        state = self.__dict__.copy()
+        state['_node_rows'] = None
+        return state
+
+    def __setstate__(self, state):
+        """Restore the array interval graph from the state returned by `__getstate__`."""
+        self.__dict__.update(state)
+        self._node_rows = None
+
+    @property
+    def tree(self):
+        """An IntervalTree of all the edges, built on every access.
+
+        Only provided for compatibility with IntervalGraph, use the
+        methods of the graph to query edges.
+        """
+        return IntervalTree(self.edges())
+
+    @property
+    def window_cache_size(self):
+        """Always None, window queries are not cached.
+
+        The window queries of ArrayIntervalGraph are binary searches over the sorted edge columns, which are not cached.
+        Setting window_cache_size to anything but None raises NetworkXError.
+        """
+        return None
+
+    @window_cache_size.setter
+    def window_cache_size(self, size):
+        if size is not None:
+            raise NetworkXError("ArrayIntervalGraph: window queries are not cached, window_cache_size can only be None.")
+
+    def window_cache_info(self):
+        """Return the statistics of the window query cache, which is always empty.
+
+        See IntervalGraph.window_cache_info for details.
+        """
+        return {'hits': 0, 'misses': 0, 'entries': 0, 'size': 0, 'max_size': None}
+
+    def interval(self):
+        """Return a 2-tuple as (begin, end) interval of the entire
+         interval graph.
+
+         Note that end is non-inclusive.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 10), (3, 7, 9, 16)])
+        >>> G.interval()
+        (0, 16)
+        """
+        self._consolidate()
+
+        if len(self._begin) == 0:
+            return 0, 0
+
+        return self._begin[0].item(), self._max_end[-1].item()
+
+    def add_node(self, node_for_adding, **attr):
+        """Add a single node `node_for_adding`  and update node attributes.
+
+        See IntervalGraph.add_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_node(1)
+        >>> G.add_node('Hello', size=10)
+        >>> G.number_of_nodes()
+        2
+        """
+        if node_for_adding not in self._node:
+            self._node[node_for_adding] = attr
+        else:  # update attr even if node already exists
+            self._node[node_for_adding].update(attr)
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """Add multiple nodes.
+
+        See IntervalGraph.add_nodes_from for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_nodes_from('Hello')
+        >>> G.add_nodes_from([(1, dict(size=11)), (2, {'color':'blue'})])
+        >>> G.has_node('e')
+        True
+        """
+        for n in nodes_for_adding:
+            try:
+                if n not in self._node:
+                    self._node[n] = attr.copy()
+                else:
+                    self._node[n].update(attr)
+            except TypeError:
+                nn, ndict = n
+                if nn not in self._node:
+                    self._node[nn] = attr.copy()
+                    self._node[nn].update(ndict)
+                else:
+                    self._node[nn].update(attr)
+                    self._node[nn].update(ndict)
+
+    def number_of_nodes(self, begin=None, end=None):
+        """Return the number of nodes in the interval graph between the given interval.
+
+        See IntervalGraph.number_of_nodes for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (3, 4, 8, 11)])
+        >>> G.number_of_nodes()
+        4
+        >>> G.number_of_nodes(begin=5, end=8) # end is non-inclusive
+        0
+        >>> G.number_of_nodes(begin=5, end=9)
+        2
+        """
+        if begin is None and end is None:
+            return len(self._node)
+
+        return len(self.__window_node_ids(begin, end))
+
+    def has_node(self, n, begin=None, end=None):
+        """Return True if the interval graph contains the node n, during the given interval.
+
+        See IntervalGraph.has_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edge(3, 4, 2, 5)
+        >>> G.has_node(3, begin=2)
+        True
+        >>> G.has_node(3, end=2) # end is non-inclusive
+        False
+        """
+        try:
+            exists_node = n in self._node
+        except TypeError:
+            exists_node = False
+
+        if (begin is None and end is None) or not exists_node:
+            return exists_node
+
+        begin, end = self.__fill_interval(begin, end)
+        rows = self.__node_rows(n)
+        return bool(((self._begin[rows] < end) & (self._end[rows] > begin)).any())
+
+    def nodes(self, begin=None, end=None, data=False, default=None):
+        """A NodeDataView of the ArrayIntervalGraph nodes.
+
+        See IntervalGraph.nodes for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> list(G.nodes(begin=4, end=12)) # non-inclusive end
+        [1, 2, 4]
+        """
+        if begin is None and end is None:
+            return NodeDataView(self._node, data=data, default=default)
+
+        node_dict = {self._labels[i]: self._node[self._labels[i]] for i in self.__window_node_ids(begin, end)}
+
+        return NodeDataView(node_dict, data=data, default=default)
+
+    def remove_node(self, n, begin=None, end=None):
+        """Remove the presence of a node n within the given interval.
+
+        See IntervalGraph.remove_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.remove_node(2, begin=4, end=6)
+        >>> list(G.nodes(begin=4, end=6))
+        []
+        >>> list(G.nodes(begin=4, end=16))
+        [2, 4, 6]
+        """
+        if n not in self._node:
+            return
+
+        self._consolidate()
+        i = self._ids.get(n)
+
+        if i is not None:
+            remove = (self._u == i) | (self._v == i)
+            if begin is not None or end is not None:
+                begin, end = self.__fill_interval(begin, end)
+                remove &= (self._begin < end) & (self._end > begin)
+
+            self.__remove_rows(remove)
+
+        # delete the node and its attributes if no edge left
+        if i is None or not ((self._u == i) | (self._v == i)).any():
+            self._node.pop(n, None)
+
+    def add_edge(self, u, v, begin, end, **attr):
+        """Add an edge between u and v, during interval [begin, end).
+
+        See IntervalGraph.add_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edge(1, 2, 3, 10)
+        >>> G.add_edge(1, 3, 4, 9, weight=7, capacity=15, length=342.7)
+        """
+        if not begin < end:
+            raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}."
+                                .format(Interval(begin, end, (u, v))))
+
+        # add nodes
+        if u not in self._node:
+            self._node[u] = {}
+        if v not in self._node:
+            self._node[v] = {}
+
+        self._pending.append((begin, end, self.__node_id(u), self.__node_id(v), attr or None))
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add all the edges in ebunch_to_add.
+
+        See IntervalGraph.add_edges_from for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'label': 'WN2898'})], weight=3)
+        """
+        for e in ebunch_to_add:
+            ne = len(e)
+            if ne == 5:
+                u, v, begin, end, dd = e
+            elif ne == 4:
+                u, v, begin, end = e
+                dd = {}
+            else:
+                raise NetworkXError("Edge tuple {0} must be a 4-tuple or 5-tuple.".format(e))
+
+            datadict = attr.copy()
+            datadict.update(dd)
+            self.add_edge(u, v, begin, end, **datadict)
+
+    def has_edge(self, u, v, begin=None, end=None, overlapping=True):
+        """Return True if there exists an edge between u and v
+        in the interval graph, during the given interval.
+
+        See IntervalGraph.has_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> G.has_edge(1, 2)
+        True
+        >>> G.has_edge(2, 4, begin=12)
+        False
+        >>> G.has_edge(2, 4, begin=1, end=11, overlapping=False)
+        True
+        """
+        if not overlapping and (begin is None or end is None):
+            raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
+
+        rows = self.__pair_rows(u, v)
+
+        if begin is None and end is None:
+            return len(rows) > 0
+
+        if not overlapping:
+            return bool(((self._begin[rows] == begin) & (self._end[rows] == end)).any())
+
+        begin, end = self.__fill_interval(begin, end)
+        return bool(((self._begin[rows] < end) & (self._end[rows] > begin)).any())
+
+    def edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
+        """A view of the Interval objects of the ArrayIntervalGraph edges.
+
+        See IntervalGraph.edges for details. Edges are reported in order of their begin.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.edges(begin=10)
+        IntervalEdgeView([Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4)), Interval(12, 19, (6, 4))])
+        >>> G.edges(u=2, v=4, end=8)
+        IntervalEdgeView([Interval(1, 11, (2, 4))])
+        """
+        return super(ArrayIntervalGraph, self).edges(u, v, begin, end, data, default)
+
+    def _iter_edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
+        """Return an iterator of the edges reported by `edges`, for edge views.
+
+        The matching rows are selected at once, and their Interval objects are
+        built in blocks of rows while iterating.
+        """
+        rows = self.__edge_rows(u, v, begin, end)
+        eattr = self._eattr
+
+        for lo in range(0, len(rows), 4096):
+            block = rows[lo:lo + 4096]
+            iedges = [Interval(b, e, (self._labels[i], self._labels[j])) for b, e, i, j in
+                      zip(self._begin[block].tolist(), self._end[block].tolist(),
+                          self._u[block].tolist(), self._v[block].tolist())]
+
+            # Appending attribute data if needed
+            if data is False:
+                for iv in iedges:
+                    yield iv
+            elif data is True:
+                for iv, r in zip(iedges, block.tolist()):
+                    yield iv, (eattr[r] if eattr is not None else None) or _EMPTY_ATTR
+            elif eattr is None:
+                for iv in iedges:
+                    yield iv, default
+            else:
+                for iv, r in zip(iedges, block.tolist()):
+                    yield iv, eattr[r].get(data, default) if eattr[r] is not None else default
+
+    def _iter_edge_attrs(self):
+        """Return an iterator of (Interval, attribute dict or None) 2-tuples of all the edges.
+
+        See IntervalGraph._iter_edge_attrs for details.
+        """
+        self._consolidate()
+        eattr = self._eattr
+        for r, iv in enumerate(self._iter_edges()):
+            yield iv, eattr[r] if eattr is not None else None
+
+    def _count_edges(self, u=None, v=None, begin=None, end=None):
+        """Return the number of edges reported by `edges`, for edge views."""
+        return len(self.__edge_rows(u, v, begin, end))
+
+    def remove_edge(self, u, v, begin=None, end=None, overlapping=True):
+        """Remove the edge between u and v in the interval graph,
+        during the given interval.
+
+        See IntervalGraph.remove_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 5, 9), (1, 2, 8, 15)])
+        >>> G.remove_edge(1, 2, begin=2, end=4)
+        >>> G.has_edge(1, 2)
+        True
+        """
+        import numpy as np
+
+        if not overlapping and (begin is None or end is None):
+            raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
+
+        rows = self.__pair_rows(u, v)
+
+        if not overlapping:
+            rows = rows[(self._begin[rows] == begin) & (self._end[rows] == end)]
+        elif begin is not None or end is not None:
+            begin, end = self.__fill_interval(begin, end)
+            rows = rows[(self._begin[rows] < end) & (self._end[rows] > begin)]
+
+        remove = np.zeros(len(self._begin), dtype=bool)
+        remove[rows] = True
+        self.__remove_rows(remove)
+
+    def expire_before(self, t):
+        """Remove all the edges which end at or before t, and the nodes left without edges.
+
+        See IntervalGraph.expire_before for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12), (3, 4, 14, 20)])
+        >>> G.expire_before(12)
+        >>> list(G.nodes())
+        [3, 4]
+
+        Notes
+        -----
+        Only the edges which begin before t are searched, but the
+        columns are rewritten, which takes time proportional to the number of edges.
+        With `retention` set, edges are expired when added edges are merged into the columns.
+        """
+        import numpy as np
+
+        self._consolidate()
+
+        # edges beginning at or after t end after it
+        hi = np.searchsorted(self._begin, t, side='left')
+        expired = np.flatnonzero(self._end[:hi] <= t)
+        if not len(expired):
+            return
+
+        ids = np.unique(np.concatenate((self._u[expired], self._v[expired])))
+        remove = np.zeros(len(self._begin), dtype=bool)
+        remove[expired] = True
+        self.__remove_rows(remove)
+
+        # delete the nodes and their attributes if no edge left
+        for i in ids[~np.isin(ids, np.concatenate((self._u, self._v)))].tolist():
+            self._node.pop(self._labels[i], None)
+
+        if 2 * len(self._node) < len(self._labels):
+            self.__compact_labels()
+
+    def _expire_retention(self):
+        """Remove the edges which ended before the retention window, if one is set."""
+        if self._retention is not None and len(self._begin) and not self._pending and not self._pending_columns:
+            self.expire_before(self._max_end[-1].item() - self._retention)
+
+    def to_subgraph(self, begin, end, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False):
+        """Return a networkx Graph or MultiGraph which includes all the nodes and
+        edges which have overlapping intervals with the given interval.
+
+        See IntervalGraph.to_subgraph for details.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> H = G.to_subgraph(4, 12)
+        >>> list(H.edges(data=True))
+        [(2, 4, {}), (2, 1, {})]
+        """
+        if end <= begin:
+            raise NetworkXError("IntervalGraph: subgraph duration must be strictly bigger than zero: "
+                                "begin: {}, end: {}.".format(begin, end))
+
+        rows = self.__window_rows(begin, end)
+
+        if multigraph:
+            G = MultiGraph()
+        else:
+            G = Graph()
+
+        labels = self._labels
+        eattr = self._eattr if self._eattr is not None else [None] * len(self._begin)
+        edges = zip(self._u[rows].tolist(), self._v[rows].tolist(), self._begin[rows].tolist(),
+                    self._end[rows].tolist(), rows.tolist())
+
+        if edge_data and edge_interval_data:
+            G.add_edges_from((labels[i], labels[j], dict(eattr[r] or {}, begin=b, end=e))
+                             for i, j, b, e, r in edges)
+        elif edge_data:
+            G.add_edges_from((labels[i], labels[j], dict(eattr[r] or {}))
+                             for i, j, b, e, r in edges)
+        elif edge_interval_data:
+            G.add_edges_from((labels[i], labels[j], {'begin': b, 'end': e})
+                             for i, j, b, e, r in edges)
+        else:
+            G.add_edges_from((labels[i], labels[j]) for i, j, b, e, r in edges)
+
+        # include node attributes
+        if node_data:
+            G.add_nodes_from((n, self._node[n].copy()) for n in G.nodes)
+
+        return G
+
+    def _add_edge_columns(self, u, v, begin, end, attr=None):
+        """Add the edges given as columns, without handling each edge in Python.
+
+        Parameters
+        ----------
+        u, v, begin, end : sequences or NumPy arrays of equal length
+            Nodes and intervals of the edges.
+        attr : dict, optional (default= None)
+            Edge attribute columns, keyed by attribute name.
+        """
+        import numpy as np
+
+        begin = np.asarray(begin)
+        end = np.asarray(end)
+
+        null = np.flatnonzero(begin >= end)
+        if len(null):
+            raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}."
+                                .format(Interval(begin[null[0]].item(), end[null[0]].item(), (u[null[0]], v[null[0]]))))
+
+        if attr:
+            names = list(attr)
+            values = zip(*(attr[name].tolist() if hasattr(attr[name], 'tolist') else attr[name] for name in names))
+            eattr = [dict(zip(names, row)) for row in values]
+        else:
+            eattr = [None] * len(begin)
+
+        self._pending_columns.append((begin, end, self.__node_ids(u), self.__node_ids(v), eattr))
+
+    def _edge_columns(self):
+        """Return all the edges as columns, sorted by begin, then end and endpoints.
+
+        See IntervalGraph._edge_columns for details. The columns are the arrays of the graph, not copies.
+        The label table holds every node of the graph, including the nodes without edges.
+        """
+        self._consolidate()
+        for n in self._node:
+            if n not in self._ids:
+                self.__node_id(n)
+        if len(self._labels) > len(self._node):
+            self.__compact_labels()
+        return self._begin, self._end, self._u, self._v, self._labels, self._eattr
+
+    def _load_edge_columns(self, begin, end, u, v, labels, eattr=None, max_end=None):
+        """Add the edges given as sorted columns of node ids, as returned by `_edge_columns`.
+
+        If the graph has no edges, the arrays are used as the edge columns
+        of the graph, as they are (e.g. memory-mapped). The nodes of the edges
+        must then be in the graph already.
+        """
+        import numpy as np
+
+        self._consolidate()
+        if len(self._begin) or self._labels:
+            return super(ArrayIntervalGraph, self)._load_edge_columns(begin, end, u, v, labels, eattr=eattr)
+
+        self._labels = list(labels)
+        self._ids = {n: i for i, n in enumerate(self._labels)}
+
+        self._begin, self._end, self._u, self._v = begin, end, u, v
+        self._max_end = max_end if max_end is not None else (np.maximum.accumulate(end) if len(end) else end)
+        self._eattr = eattr
+        self._node_rows = None
+
+    def memory_usage(self):
+        """Return the memory used by the interval graph, in bytes, by part.
+
+        See IntervalGraph.memory_usage for details. The 'edges' are the edge columns,
+        and the node label table is part of the 'nodes'. There is no 'adjacency',
+        and the 'index' is the running maximum of end and the node index, along with any pending edges.
+        Memory-mapped columns are counted with their full size.
+
+        Examples
+        --------
+        >>> G = dnx.ArrayIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (1, 2, 8, 15, {'weight': 2})])
+        >>> G.memory_usage()['edges']
+        96
+        """
+        self._consolidate()
+
+        seen = set()
+        return {'nodes': _deep_sizeof([self._node, self._labels, self._ids], seen),
+                'edges': sum(column.nbytes for column in (self._begin, self._end, self._u, self._v)),
+                'edge_attrs': _deep_sizeof([self._eattr], seen),
+                'adjacency': 0,
+                'index': (self._max_end.nbytes + sum(a.nbytes for a in self._node_rows or ()) +
+                          _deep_sizeof([self._pending, self._pending_columns], seen))}
+
+    def _window_adjacency(self, begin, end, predecessors=False):
+        """Return the adjacency of the edges overlapping [begin, end), for window views.
+
+        See IntervalGraph._window_adjacency for details. The adjacency is built
+        from the edges in the window, and shares their attribute dicts. Edges without
+        attributes are mapped to None.
+        """
+        adj = {}
+        labels = self._labels
+        rows = self.__window_rows(begin, end)
+        eattr = self._eattr
+        attrs = [eattr[r] for r in rows.tolist()] if eattr is not None else [None] * len(rows)
+        for b, e, i, j, attr in zip(self._begin[rows].tolist(), self._end[rows].tolist(),
+                                    self._u[rows].tolist(), self._v[rows].tolist(), attrs):
+            u, v = labels[i], labels[j]
+            iedges = adj.setdefault(u, {}).get(v)
+            if iedges is None:
+                iedges = adj[u][v] = adj.setdefault(v, {})[u] = _IntervalEdgeDict()
+            iedges[Interval(b, e, (u, v))] = attr
+
+        return adj
+
+    def _edge_attr_dict(self, iedge):
+        """Return the attribute dict of an edge of the graph, creating it if the edge has none.
+
+        See IntervalGraph._edge_attr_dict for details.
+        """
+        for r in self.__edge_rows(iedge.data[0], iedge.data[1], iedge.begin, iedge.end).tolist():
+            if self._begin[r] == iedge.begin and self._end[r] == iedge.end:
+                return self._edge_attr(r)
+        raise KeyError("Edge {} not found".format(iedge))
+
+    def _edge_attr(self, row):
+        """Return the attribute dict of the edge at `row`, creating it if the edge has none."""
+        if self._eattr is None:
+            self._eattr = [None] * len(self._begin)
+
+        attr = self._eattr[row]
+        if attr is None:
+            attr = self._eattr[row] = {}
+        return attr
+
+    def _consolidate(self):
+        """Merge the pending edges into the sorted edge columns.
+
+        Edges are sorted by begin, then end and endpoints. Duplicate edges,
+        with the same interval and nodes in either order, are dropped and
+        their attributes are merged into the first edge, in order of insertion.
+        """
+        if not self._pending and not self._pending_columns:
+            return
+
+        import numpy as np
+
+        eattr = self._eattr if self._eattr is not None else [None] * len(self._begin)
+        blocks = [(self._begin, self._end, self._u, self._v, eattr)] + self._pending_columns
+        if self._pending:
+            blocks.append((np.array([e[0] for e in self._pending]), np.array([e[1] for e in self._pending]),
+                           np.array([e[2] for e in self._pending], dtype=np.int64),
+                           np.array([e[3] for e in self._pending], dtype=np.int64),
+                           [e[4] for e in self._pending]))
+        self._pending = []
+        self._pending_columns = []
+
+        begin, end, u, v = (np.concatenate([block[i] for block in blocks]) for i in range(4))
+        eattr = [attr for block in blocks for attr in block[4]]
+
+        # undirected edges are identified regardless of the order of their nodes
+        low = np.minimum(u, v)
+        high = np.maximum(u, v)
+        insertion = np.arange(len(begin))
+
+        order = np.lexsort((insertion, high, low, end, begin))
+        begin, end, u, v, low, high = begin[order], end[order], u[order], v[order], low[order], high[order]
+
+        duplicate = np.zeros(len(begin), dtype=bool)
+        duplicate[1:] = ((begin[1:] == begin[:-1]) & (end[1:] == end[:-1]) &
+                         (low[1:] == low[:-1]) & (high[1:] == high[:-1]))
+
+        order = order.tolist()
+        if duplicate.any():
+            # update the attributes of the first inserted edge of each group of duplicates
+            first = None
+            for r, is_duplicate in enumerate(duplicate.tolist()):
+                if not is_duplicate:
+                    first = order[r]
+                elif eattr[order[r]]:
+                    if eattr[first] is None:
+                        eattr[first] = {}
+                    eattr[first].update(eattr[order[r]])
+
+            keep = ~duplicate
+            begin, end, u, v = begin[keep], end[keep], u[keep], v[keep]
+            order = [r for r, k in zip(order, keep.tolist()) if k]
+
+        self._begin, self._end, self._u, self._v = begin, end, u, v
+        self._eattr = [eattr[r] for r in order]
+        self._max_end = np.maximum.accumulate(end) if len(end) else end
+        self._node_rows = None
+
+        self._expire_retention()
+
+    def __remove_rows(self, remove):
+        """Remove the edges at the rows marked True in the boolean array `remove`."""
+        import numpy as np
+
+        if not remove.any():
+            return
+
+        keep = ~remove
+        self._begin, self._end = self._begin[keep], self._end[keep]
+        self._u, self._v = self._u[keep], self._v[keep]
+        if self._eattr is not None:
+            self._eattr = [a for a, k in zip(self._eattr, keep.tolist()) if k]
+        self._max_end = np.maximum.accumulate(self._end) if len(self._end) else self._end
+        self._node_rows = None
+
+    def __compact_labels(self):
+        """Drop the removed nodes from the label table, renumbering the node ids of the edges."""
+        import numpy as np
+
+        self._consolidate()
+        keep = np.array([n in self._node for n in self._labels], dtype=bool)
+        new_ids = np.cumsum(keep) - 1
+        self._u, self._v = new_ids[self._u], new_ids[self._v]
+        self._labels = [n for n, k in zip(self._labels, keep.tolist()) if k]
+        self._ids = {n: i for i, n in enumerate(self._labels)}
+        self._node_rows = None
+
+    def __node_id(self, n):
+        """Return the integer id of node n in the label table, assigning one if needed."""
+        i = self._ids.get(n)
+        if i is None:
+            i = self._ids[n] = len(self._labels)
+            self._labels.append(n)
+        return i
+
+    def __node_ids(self, nodes):
+        """Return a NumPy array of the integer ids of the sequence of nodes, adding any new node."""
+        import numpy as np
+
+        if hasattr(nodes, 'dtype') and nodes.ndim == 1:
+            # intern every distinct node once
+            try:
+                labels, inverse = np.unique(nodes, return_inverse=True)
+            except TypeError:
+                pass
+            else:
+                labels = labels.tolist()
+                for n in labels:
+                    if n not in self._node:
+                        self._node[n] = {}
+                return np.array([self.__node_id(n) for n in labels], dtype=np.int64)[inverse]
+
+        nodes = nodes.tolist() if hasattr(nodes, 'tolist') else nodes
+        for n in nodes:
+            if n not in self._node:
+                self._node[n] = {}
+        return np.array([self.__node_id(n) for n in nodes], dtype=np.int64)
+
+    def __fill_interval(self, begin, end):
+        """Replace undefined begin or end with the interval of the entire graph.
+
+        Same as IntervalGraph, the default end is shifted up by 1 to make it inclusive.
+        """
+        graph_begin, graph_end = self.interval()
+        if begin is None:
+            begin = graph_begin
+        if end is None:
+            end = graph_end + 1
+        return begin, end
+
+    def __edge_rows(self, u, v, begin, end):
+        """Return the rows of the edges reported by `edges`."""
+        import numpy as np
+
+        if u is None and v is None:
+            if begin is None and end is None:
+                self._consolidate()
+                return np.arange(len(self._begin))
+            return self.__window_rows(begin, end)
+
+        if u is not None and v is not None:
+            rows = self.__pair_rows(u, v)
+        elif u is not None:
+            rows = self.__node_rows(u)
+        else:
+            rows = self.__node_rows(v)
+
+        if begin is not None:
+            rows = rows[self._end[rows] >= begin]
+        if end is not None:
+            rows = rows[self._begin[rows] < end]
+
+        return rows
+
+    def __window_rows(self, begin, end):
+        """Return the sorted rows of all edges overlapping [begin, end)."""
+        import numpy as np
+
+        begin, end = self.__fill_interval(begin, end)
+
+        # rows before lo have all ended by begin, and rows from hi on begin at or after end.
+        hi = np.searchsorted(self._begin, end, side='left')
+        lo = np.searchsorted(self._max_end[:hi], begin, side='right')
+
+        return lo + np.flatnonzero(self._end[lo:hi] > begin)
+
+    def __window_node_ids(self, begin, end):
+        """Return the unique ids of all nodes with an edge overlapping [begin, end)."""
+        import numpy as np
+
+        rows = self.__window_rows(begin, end)
+        return np.unique(np.concatenate((self._u[rows], self._v[rows]))).tolist()
+
+    def __node_rows(self, n):
+        """Return the sorted rows of all edges incident to node n.
+
+        Raises a KeyError if n is not in the graph, same as IntervalGraph.
+        """
+        import numpy as np
+
+        if n not in self._node:
+            raise KeyError(n)
+
+        self._consolidate()
+        i = self._ids.get(n)
+        if i is None:
+            return np.empty(0, dtype=np.int64)
+
+        return self.__id_rows(i)
+
+    def __pair_rows(self, u, v):
+        """Return the sorted rows of all edges between nodes u and v."""
+        import numpy as np
+
+        self._consolidate()
+        i = self._ids.get(u)
+        j = self._ids.get(v)
+        if i is None or j is None:
+            return np.empty(0, dtype=np.int64)
+
+        # filter the edges of the node with fewer of them
+        rows = min(self.__id_rows(i), self.__id_rows(j), key=len)
+        u, v = self._u[rows], self._v[rows]
+        return rows[((u == i) & (v == j)) | ((u == j) & (v == i))]
+
+    def __id_rows(self, i):
+        """Return the sorted rows of all edges incident to the node with id i, from the node index.
+
+        The index lists the rows of the edges of each node id, by increasing id, with the
+        offsets where each id begins (CSR layout). It is built in one sort of the endpoints
+        of all edges, and dropped whenever the edge columns change.
+        """
+        import numpy as np
+
+        if self._node_rows is None:
+            m = len(self._u)
+            rows = np.arange(m, dtype=np.int64)
+            # self-loops are listed once, under u
+            loop = self._u == self._v
+            ids = np.concatenate((self._u, self._v[~loop]))
+            rows = np.concatenate((rows, rows[~loop]))
+            order = np.lexsort((rows, ids))
+            offsets = np.zeros(len(self._labels) + 1, dtype=np.int64)
+            np.cumsum(np.bincount(ids, minlength=len(self._labels)), out=offsets[1:])
+            self._node_rows = (offsets, rows[order])
+
+        offsets, rows = self._node_rows
+        if i + 1 >= len(offsets):
+            return rows[:0]
+        return rows[offsets[i]:offsets[i + 1]]
@@ -0,0 +1,297 @@
+"""Views of interval graphs as networkx graphs during a time window.
+
+A window view reports the nodes and edges of an interval graph which overlap
+a given interval, through the networkx Graph or MultiGraph API, without
+building or copying a graph. The views are read-only, and report data from the
+interval graph object, so changes to the interval graph show in its views.
+We provide an attribute G._graph which points to the interval graph object.
+"""
+from collections import Mapping
+
+import networkx as nx
+from networkx.classes import Graph, MultiGraph
+from networkx.exception import NetworkXError
+
+from dynetworkx.classes.reportviews import _EMPTY_ATTR
+
+__all__ = ['window_view']
+
+
+class WindowNodeAtlas(Mapping):  # nodedict
+    """A read-only Mapping of the nodes with an edge overlapping [begin, end)
+    to their attribute dicts.
+
+    For directed graphs, the incoming edges are looked up in `pred`."""
+
+    __slots__ = ('_nodes', '_adj', '_pred', 'begin', 'end')
+
+    def __getstate__(self):
+        return {'_nodes': self._nodes, '_adj': self._adj, '_pred': self._pred, 'begin': self.begin, 'end': self.end}
+
+    def __setstate__(self, state):
+        self._nodes = state['_nodes']
+        self._adj = state['_adj']
+        self._pred = state['_pred']
+        self.begin = state['begin']
+        self.end = state['end']
+
+    def __init__(self, nodes, adj, begin, end, pred=None):
+        self._nodes = nodes
+        self._adj = adj
+        self._pred = pred
+        self.begin = begin
+        self.end = end
+
+    def __len__(self):
+        return sum(1 for n in self)
+
+    def __iter__(self):
+        return (n for n in self._nodes if self.__active(n))
+
+    def __contains__(self, n):
+        try:
+            return n in self._nodes and self.__active(n)
+        except TypeError:
+            return False
+
+    def __getitem__(self, n):
+        if n in self:
+            return self._nodes[n]
+        raise KeyError("Key {} not found".format(n))
+
+    def __active(self, n):
+        if any(iedges.overlaps(self.begin, self.end) for iedges in self._adj.get(n, {}).values()):
+            return True
+        return self._pred is not None and \
+            any(iedges.overlaps(self.begin, self.end) for iedges in self._pred.get(n, {}).values())
+
+    def copy(self):
+        return {n: self._nodes[n].copy() for n in self}
+
+    def __str__(self):
+        return str({n: self._nodes[n] for n in self})
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (self.__class__.__name__, self._nodes, self.begin, self.end)
+
+
+class WindowAtlas(Mapping):  # nbrdict
+    """A read-only Mapping of the neighbors connected by an edge overlapping [begin, end)
+    to the attribute dict of the earliest of these edges.
+
+    Edges without attributes report a shared read-only empty mapping."""
+
+    __slots__ = ('_nbrs', 'begin', 'end')
+
+    def __getstate__(self):
+        return {'_nbrs': self._nbrs, 'begin': self.begin, 'end': self.end}
+
+    def __setstate__(self, state):
+        self._nbrs = state['_nbrs']
+        self.begin = state['begin']
+        self.end = state['end']
+
+    def __init__(self, nbrs, begin, end):
+        self._nbrs = nbrs
+        self.begin = begin
+        self.end = end
+
+    def __len__(self):
+        return sum(1 for nbr in self)
+
+    def __iter__(self):
+        return (nbr for nbr, iedges in self._nbrs.items() if iedges.overlaps(self.begin, self.end))
+
+    def __contains__(self, nbr):
+        try:
+            return nbr in self._nbrs and self._nbrs[nbr].overlaps(self.begin, self.end)
+        except TypeError:
+            return False
+
+    def __getitem__(self, nbr):
+        iedges = self._nbrs[nbr]
+        overlap = iedges.overlap(self.begin, self.end)
+        if not overlap:
+            raise KeyError("Key {} not found".format(nbr))
+        return self._window_edges(iedges, overlap)
+
+    def _window_edges(self, iedges, overlap):
+        return iedges.peek(overlap[0]) or _EMPTY_ATTR
+
+    def copy(self):
+        return {nbr: self[nbr].copy() for nbr in self}
+
+    def __str__(self):
+        return str({nbr: self[nbr] for nbr in self})
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (self.__class__.__name__, self._nbrs, self.begin, self.end)
+
+
+class WindowMultiAtlas(WindowAtlas):  # nbrdict
+    """A read-only Mapping of the neighbors connected by an edge overlapping [begin, end)
+    to a Mapping of these edges, keyed by their Interval objects, to their attribute dicts."""
+
+    __slots__ = ()
+
+    def _window_edges(self, iedges, overlap):
+        return WindowKeyAtlas(iedges, self.begin, self.end)
+
+    def copy(self):
+        return {nbr: {iedge: d.copy() for iedge, d in self[nbr].items()} for nbr in self}
+
+
+class WindowKeyAtlas(WindowAtlas):  # keydict
+    """A read-only Mapping of the edges between two nodes which overlap [begin, end),
+    keyed by their Interval objects, to their attribute dicts."""
+
+    __slots__ = ()
+
+    def __len__(self):
+        return len(self._nbrs.overlap(self.begin, self.end))
+
+    def __iter__(self):
+        return iter(self._nbrs.overlap(self.begin, self.end))
+
+    def __contains__(self, iedge):
+        try:
+            return iedge in self._nbrs and iedge.begin < self.end and iedge.end > self.begin
+        except (TypeError, AttributeError):
+            return False
+
+    def __getitem__(self, iedge):
+        if iedge in self:
+            return self._nbrs.peek(iedge) or _EMPTY_ATTR
+        raise KeyError("Key {} not found".format(iedge))
+
+    def copy(self):
+        return {iedge: self[iedge].copy() for iedge in self}
+
+
+class WindowAdjacency(Mapping):  # adjdict
+    """A read-only Mapping of the nodes with an edge overlapping [begin, end)
+    to their neighbors during [begin, end)."""
+
+    __slots__ = ('_atlas', '_nodes', '_adj', 'begin', 'end')
+
+    def __getstate__(self):
+        return {'_atlas': self._atlas, '_nodes': self._nodes, '_adj': self._adj,
+                'begin': self.begin, 'end': self.end}
+
+    def __setstate__(self, state):
+        self._atlas = state['_atlas']
+        self._nodes = state['_nodes']
+        self._adj = state['_adj']
+        self.begin = state['begin']
+        self.end = state['end']
+
+    def __init__(self, adj, begin, end, atlas=WindowAtlas, nodes=None):
+        self._atlas = atlas
+        self._nodes = WindowNodeAtlas(adj, adj, begin, end) if nodes is None else nodes
+        self._adj = adj
+        self.begin = begin
+        self.end = end
+
+    def __len__(self):
+        return len(self._nodes)
+
+    def __iter__(self):
+        return iter(self._nodes)
+
+    def __contains__(self, n):
+        return n in self._nodes
+
+    def __getitem__(self, n):
+        if n in self._nodes:
+            return self._atlas(self._adj.get(n, {}), self.begin, self.end)
+        raise KeyError("Key {} not found".format(n))
+
+    def copy(self):
+        return {n: self[n].copy() for n in self}
+
+    def __str__(self):
+        return str({n: self[n] for n in self})
+
+    def __repr__(self):
+        return '%s(%r, %r, %r)' % (self.__class__.__name__, self._adj, self.begin, self.end)
+
+
+def window_view(G, begin, end, multigraph=False):
+    """ View of `G` during the interval [begin, end) as a networkx graph.
+
+    `window_view` provides a read-only view of the nodes and edges of
+    the interval graph `G`, which overlap the given interval, the same
+    as `G.to_subgraph(begin, end, edge_data=True, node_data=True)`
+    but without building a graph or copying any attribute dict.
+    Changes to `G` are reflected in the view.
+
+    Parameters
+    ----------
+    G : IntervalGraph
+
+    begin: integer
+        Inclusive beginning time of the window.
+
+    end: integer
+        Non-inclusive ending time of the window.
+
+    multigraph: bool, optional (default= False)
+        If True, the view is a networkx MultiGraph with the edges keyed by
+        their Interval objects. If False, a networkx Graph, which reports the
+        attributes of the earliest edge between two nodes.
+        For an IntervalDiGraph, a MultiDiGraph or a DiGraph.
+
+    Returns
+    -------
+    graph : networkx Graph, MultiGraph, DiGraph or MultiDiGraph
+        A read-only graph view of the interval graph during the window.
+
+    Notes
+    -----
+    The view queries the edges of `G` on every access, which makes node and
+    edge lookups O(log n) in the number of edges between two nodes and
+    counting nodes O(number of edges of the nodes). If many algorithms
+    are run on the same window, `G.to_subgraph` may be faster.
+
+    For an ArrayIntervalGraph, the adjacency of the edges overlapping the
+    window is built once, when the view is created, sharing the attribute dicts
+    of the edges. Changes to the edges of `G` are then not reflected in the view.
+
+    Examples
+    --------
+    >>> import networkx as nx
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    >>> H = dnx.window_view(G, 4, 12)
+    >>> list(H.edges())
+    [(1, 2), (2, 4)]
+    >>> nx.shortest_path(H, 1, 4)
+    [1, 2, 4]
+    >>> M = dnx.window_view(G, 4, 12, multigraph=True)
+    >>> list(M.edges(keys=True))
+    [(1, 2, Interval(3, 10, (1, 2))), (2, 4, Interval(1, 11, (2, 4))), (2, 4, Interval(8, 15, (2, 4)))]
+    """
+    if end <= begin:
+        raise NetworkXError("IntervalGraph: window duration must be strictly bigger than zero: "
+                            "begin: {}, end: {}.".format(begin, end))
+
+    newG = nx.freeze(G._graph_class(multigraph)())
+
+    # create view by assigning attributes from G
+    newG._graph = G
+    newG.graph = G.graph
+
+    atlas = WindowMultiAtlas if multigraph else WindowAtlas
+    adj = G._window_adjacency(begin, end)
+    if not G.is_directed():
+        newG._node = WindowNodeAtlas(G._node, adj, begin, end)
+        newG._adj = WindowAdjacency(adj, begin, end, atlas=atlas)
+        return newG
+
+    # nodes of a directed view are active with either incoming or outgoing edges
+    pred = G._window_adjacency(begin, end, predecessors=True)
+    newG._node = WindowNodeAtlas(G._node, adj, begin, end, pred=pred)
+    nodes = WindowNodeAtlas(adj, adj, begin, end, pred=pred)
+    newG._succ = newG._adj = WindowAdjacency(adj, begin, end, atlas=atlas, nodes=nodes)
+    newG._pred = WindowAdjacency(pred, begin, end, atlas=atlas, nodes=nodes)
+    return newG
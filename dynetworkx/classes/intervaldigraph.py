@@ -0,0 +1,316 @@
+from itertools import chain
+from networkx.classes.digraph import DiGraph
+from networkx.classes.multidigraph import MultiDiGraph
+from networkx.exception import NetworkXError
+from intervaltree import Interval
+from dynetworkx.classes.intervalgraph import IntervalGraph, _IntervalEdgeDict
+
+
+class IntervalDiGraph(IntervalGraph):
+    """Base class for directed interval graphs.
+
+    The IntervalDiGraph class allows any hashable object as a node
+    and can associate key/value attribute pairs with each directed edge.
+
+    Each edge must have one begin and one end, and goes from its first
+    node u to its second node v. Multiple edges with the same direction
+    and different intervals are allowed, while (u, v) and (v, u) are different edges.
+
+    IntervalDiGraph has the same methods as IntervalGraph, where
+    `edges(u=n)` reports the edges out of n and `edges(v=n)` the edges
+    into n. Subgraphs and snapshots are networkx DiGraph or MultiDiGraph objects.
+
+    Parameters
+    ----------
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    See Also
+    --------
+    IntervalGraph
+
+    Examples
+    --------
+    >>> G = dnx.IntervalDiGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 1, 1, 11), (2, 4, 12, 19)])
+    >>> G.edges(u=2)
+    IntervalEdgeView([Interval(1, 11, (2, 1)), Interval(12, 19, (2, 4))])
+    >>> list(G.predecessors(1))
+    [2]
+    >>> G.out_degree(begin=10, end=15)
+    {1: 0, 2: 2, 4: 0}
+    >>> type(G.to_subgraph(0, 5))
+    <class 'networkx.classes.digraph.DiGraph'>
+
+    Notes
+    -----
+    The outgoing edges of each node are kept in a successor dict (`_succ`,
+    the same object as `_adj`) and its incoming edges in a predecessor dict
+    (`_pred`), both keyed by neighbor, which share the dict of interval edges
+    of each pair of nodes. Only the nodes with incoming edges are in `_pred`.
+    Thus queries in either direction never filter the edges of the other direction.
+    """
+
+    def __init__(self, **attr):
+        """Initialize a directed interval graph with edges, name, or graph attributes.
+
+        Parameters
+        ----------
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G = dnx.IntervalDiGraph(name='my graph')
+        >>> G.graph
+        {'name': 'my graph'}
+        """
+        super(IntervalDiGraph, self).__init__(**attr)
+        self._succ = self._adj
+        self._pred = {}
+
+    def is_directed(self):
+        """Return True if the interval graph is directed, False otherwise."""
+        return True
+
+    def successors(self, n, begin=None, end=None):
+        """Return an iterator over the successor nodes of n, connected by
+        an edge from n overlapping the given interval.
+
+        Parameters
+        ----------
+        n : node
+           A node in the graph.
+        begin: integer, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges.
+        end: integer, optional  (default= end of the entire interval graph + 1)
+            Non-inclusive ending time of the edges.
+
+        Raises
+        ------
+        NetworkXError
+            If n is not in the interval graph.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (1, 3, 12, 19)])
+        >>> list(G.successors(1))
+        [2, 3]
+        >>> list(G.successors(1, begin=10))
+        [3]
+        """
+        try:
+            return self.__neighbors(self._succ[n], begin, end)
+        except KeyError:
+            raise NetworkXError("The node {0} is not in the interval graph.".format(n))
+
+    def predecessors(self, n, begin=None, end=None):
+        """Return an iterator over the predecessor nodes of n, connected by
+        an edge to n overlapping the given interval.
+
+        Parameters
+        ----------
+        n : node
+           A node in the graph.
+        begin: integer, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges.
+        end: integer, optional  (default= end of the entire interval graph + 1)
+            Non-inclusive ending time of the edges.
+
+        Raises
+        ------
+        NetworkXError
+            If n is not in the interval graph.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 3, 3, 10), (2, 3, 12, 19)])
+        >>> list(G.predecessors(3, end=10))
+        [1]
+        """
+        if n not in self._node:
+            raise NetworkXError("The node {0} is not in the interval graph.".format(n))
+
+        return self.__neighbors(self._pred.get(n, {}), begin, end)
+
+    def in_degree(self, nbunch=None, begin=None, end=None, multigraph=False):
+        """Return the in-degree of a node or nodes during the given interval.
+
+        Parameters
+        ----------
+        nbunch : single node, or container of nodes, optional (default= all nodes)
+            The degree of a single node, or a dict of the degrees of the nodes
+            in the container, which are in the interval graph.
+        begin: integer, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges.
+        end: integer, optional  (default= end of the entire interval graph + 1)
+            Non-inclusive ending time of the edges.
+        multigraph : bool, optional (default= False)
+            If True, the number of edges into a node overlapping the interval.
+            If False, the number of its predecessors during the interval,
+            which is its in-degree in `to_subgraph(begin, end)`.
+
+        Returns
+        -------
+        degree : int or dict
+            The in-degree of the node if a single node is given,
+            otherwise a dict of in-degrees keyed by node.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 3, 3, 10), (2, 3, 12, 19), (2, 3, 4, 6)])
+        >>> G.in_degree(3)
+        2
+        >>> G.in_degree(3, end=10, multigraph=True)
+        2
+        >>> G.in_degree(begin=10)
+        {1: 0, 3: 1, 2: 0}
+        """
+        return self.__degree(self._pred, nbunch, begin, end, multigraph)
+
+    def out_degree(self, nbunch=None, begin=None, end=None, multigraph=False):
+        """Return the out-degree of a node or nodes during the given interval.
+
+        Parameters
+        ----------
+        nbunch : single node, or container of nodes, optional (default= all nodes)
+            The degree of a single node, or a dict of the degrees of the nodes
+            in the container, which are in the interval graph.
+        begin: integer, optional  (default= beginning of the entire interval graph)
+            Inclusive beginning time of the edges.
+        end: integer, optional  (default= end of the entire interval graph + 1)
+            Non-inclusive ending time of the edges.
+        multigraph : bool, optional (default= False)
+            If True, the number of edges out of a node overlapping the interval.
+            If False, the number of its successors during the interval,
+            which is its out-degree in `to_subgraph(begin, end)`.
+
+        Returns
+        -------
+        degree : int or dict
+            The out-degree of the node if a single node is given,
+            otherwise a dict of out-degrees keyed by node.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalDiGraph()
+        >>> G.add_edges_from([(1, 3, 3, 10), (1, 2, 12, 19), (1, 3, 4, 6)])
+        >>> G.out_degree(1)
+        2
+        >>> G.out_degree(1, end=10, multigraph=True)
+        2
+        """
+        return self.__degree(self._succ, nbunch, begin, end, multigraph)
+
+    def __neighbors(self, nbrs, begin, end):
+        """Return an iterator of the neighbors in `nbrs` connected by an edge overlapping [begin, end)."""
+        if begin is None and end is None:
+            return iter(list(nbrs))
+
+        if begin is None:
+            begin = self.tree.begin()
+        if end is None:
+            end = self.tree.end() + 1
+
+        return iter([nbr for nbr, iedges in nbrs.items() if iedges.overlaps(begin, end)])
+
+    def __degree(self, adj, nbunch, begin, end, multigraph):
+        """Return the degree of a node, or dict of the degrees of nodes, in the adjacency `adj`."""
+        if begin is not None or end is not None:
+            if begin is None:
+                begin = self.tree.begin()
+            if end is None:
+                end = self.tree.end() + 1
+
+        def degree(n):
+            nbrs = adj.get(n, {})
+            if begin is None and end is None:
+                return sum(map(len, nbrs.values())) if multigraph else len(nbrs)
+            if multigraph:
+                return sum(len(iedges.overlap(begin, end)) for iedges in nbrs.values())
+            return sum(1 for iedges in nbrs.values() if iedges.overlaps(begin, end))
+
+        if nbunch in self:
+            return degree(nbunch)
+
+        if nbunch is None:
+            nbunch = self._node
+
+        return {n: degree(n) for n in nbunch if n in self._node}
+
+    def _get_iedge(self, u, v, begin, end):
+        """Return the interval edge from u to v with the exact interval if found, otherwise return None."""
+        iedges = self._succ.get(u, {}).get(v)
+        if iedges is None:
+            return None
+
+        iedge = Interval(begin, end, (u, v))
+        if iedge in iedges:
+            return iedge
+
+        return None
+
+    def _pair_iedges(self, u, v):
+        """Return the dict of the interval edges from u to v, adding the nodes and the dict if needed."""
+        # add nodes
+        if u not in self._node:
+            self._succ[u] = {}
+            self._node[u] = {}
+        if v not in self._node:
+            self._succ[v] = {}
+            self._node[v] = {}
+
+        iedges = self._succ[u].get(v)
+        if iedges is None:
+            # the successor and the predecessor share the same dict of interval edges
+            u, v = self._label(u), self._label(v)
+            iedges = self._succ[u][v] = self._pred.setdefault(v, {})[u] = _IntervalEdgeDict((u, v))
+
+        return iedges
+
+    def _label(self, n):
+        """Return the node label equal to n used by the interval edges of n, or n if it has no edges."""
+        for nbrs in (self._succ.get(n, {}), self._pred.get(n, {})):
+            for iedges in nbrs.values():
+                return iedges._pair[0] if iedges._pair[0] == n else iedges._pair[1]
+        return n
+
+    def _remove_pair(self, u, v):
+        """Remove v from the successors of u, and u from the predecessors of v."""
+        del self._succ[u][v]
+        del self._pred[v][u]
+        if not self._pred[v]:
+            del self._pred[v]
+
+    def _node_iedges(self, n, successors=True, predecessors=True):
+        """Return the dicts of the interval edges of node n, to each of its neighbors.
+
+        Only the dicts of its outgoing edges if predecessors=False,
+        and of its incoming edges if successors=False.
+        """
+        if not predecessors:
+            return self._succ[n].values()
+        if not successors:
+            return self._pred.get(n, {}).values()
+        return list(chain(self._succ[n].values(), self._pred.get(n, {}).values()))
+
+    def _remove_isolated(self, n):
+        """Remove node n and its attributes if it has no edges left."""
+        if n in self._succ and not self._succ[n] and n not in self._pred:
+            del self._succ[n]
+            del self._node[n]
+
+    def _window_adjacency(self, begin, end, predecessors=False):
+        """Return the successors, or the predecessors if predecessors=True, for window views.
+
+        See IntervalGraph._window_adjacency for details.
+        """
+        return self._pred if predecessors else self._succ
+
+    def _graph_class(self, multigraph=False):
+        """Return the networkx graph class of the subgraphs and snapshots of the interval graph."""
+        return MultiDiGraph if multigraph else DiGraph
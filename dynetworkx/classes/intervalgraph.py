@@ -1,9 +1,19 @@
 import dynetworkx as dnx
+from collections import Counter, OrderedDict
+from operator import itemgetter
+from itertools import chain
+from bisect import bisect_left, bisect_right
 from networkx.classes.graph import Graph
 from networkx.exception import NetworkXError
 from intervaltree import Interval, IntervalTree
+from intervaltree.node import Node
+from sortedcontainers import SortedDict
 from networkx.classes.multigraph import MultiGraph
 from networkx.classes.reportviews import NodeView, EdgeView, NodeDataView
+from networkx.utils.decorators import open_file
+from dynetworkx.classes.reportviews import IntervalEdgeView, IntervalEdgeDataView, _EMPTY_ATTR
+from dynetworkx.classes.snapshotgraph import SnapshotGraph, _series_bins, _series_times, _window_ranges, \
+    _point_ranges, _csr_ranges, _count_ranges, _expand_ranges, _sparse_tensor
 
 
 class IntervalGraph(object):
@@ -106,11 +116,23 @@ class IntervalGraph(object):
     IntervalTree allows for fast interval based search through edges,
     which makes interval graph analyes possible.
 
-    The Graph class uses a dict-of-dict-of-dict data structure.
+    The IntervalGraph class uses a dict-of-dict-of-dict-of-dict data structure.
     The outer dict (node_dict) holds adjacency information keyed by node.
     The next dict (adjlist_dict) represents the adjacency information and holds
-    edge data keyed by interval object.  The inner dict (edge_attr_dict) represents
-    the edge data and holds edge attribute values keyed by attribute names.
+    the interval edges keyed by neighbor. The next dict (iedge_dict) holds
+    edge data keyed by interval object, for all the edges between the two nodes.
+    It is shared by both nodes and keeps a sorted index of its intervals,
+    which makes interval queries between two nodes a binary search.
+    The inner dict (edge_attr_dict) represents the edge data and holds
+    edge attribute values keyed by attribute names. It is only created for
+    edges with attributes, or once the attributes of an edge are accessed.
+    The intervals between two nodes share their (u, v) data tuple, which holds
+    a single copy of each node label.
+
+    Node queries during an interval are answered by a node activity index,
+    which holds the union of the intervals of the edges of each node, as sorted
+    disjoint intervals, and an IntervalTree of all of them. The index is updated
+    for the nodes whose edges changed on the next node query.
     """
 
     def __init__(self, **attr):
@@ -128,13 +150,44 @@ class IntervalGraph(object):
         >>> G.graph
         {'name': 'my graph'}
         """
-        self.tree = IntervalTree()
+        self._tree = IntervalTree()
+        self._tree_iedges = None  # intervals of the tree to build on first access, after unpickling
         self.graph = {}  # dictionary for graph attributes
         self._adj = {}
         self._node = {}
 
+        # node activity index: merged intervals of the edges of each node, and a tree of all of them
+        self._node_segments = {}
+        self._node_tree = IntervalTree()
+        self._dirty_nodes = set()
+
+        # retention window, and the edges keyed by end, only kept once edges are expired
+        self._retention = None
+        self._ends = None
+
+        # number of changes to the edges, and the cache of window queries, if enabled
+        self._version = 0
+        self._window_cache_size = None
+        self._window_cache = None
+
         self.graph.update(attr)
 
+    @property
+    def tree(self):
+        """IntervalTree of all the edges of the interval graph.
+
+        After unpickling, the tree is built on first access.
+        """
+        if self._tree_iedges is not None:
+            self._tree = _build_tree(self._tree_iedges)
+            self._tree_iedges = None
+        return self._tree
+
+    @tree.setter
+    def tree(self, tree):
+        self._tree = tree
+        self._tree_iedges = None
+
     @property
     def name(self):
         """String identifier of the interval graph.
@@ -149,6 +202,96 @@ class IntervalGraph(object):
     def name(self, s):
         self.graph['name'] = s
 
+    @property
+    def retention(self):
+        """Length of the time window of edges kept in the interval graph.
+
+        If set, every time edges are added, the edges which end at or before
+        the end of the interval graph minus `retention` are removed, along with the
+        nodes left without edges, as with `expire_before`. If None, the default,
+        all edges are kept.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.retention = 10
+        >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12)])
+        >>> G.add_edge(3, 4, 14, 20)
+        >>> G.edges()
+        IntervalEdgeView([Interval(14, 20, (3, 4)), Interval(4, 12, (2, 3))])
+        """
+        return self._retention
+
+    @retention.setter
+    def retention(self, duration):
+        if duration is not None and not duration > 0:
+            raise NetworkXError("IntervalGraph: retention must be bigger than zero or None. "
+                                "{0} was passed.".format(duration))
+        self._retention = duration
+        self._expire_retention()
+
+    @property
+    def window_cache_size(self):
+        """Maximum number of bytes of window query results kept in a cache.
+
+        If set, the edges and nodes found during an interval by `edges`, `nodes`,
+        `number_of_nodes` and `to_subgraph`, without node filtering, are cached by
+        their (begin, end) interval. The least recently used results are dropped
+        once the cache is bigger than `window_cache_size`, and all of them once the
+        edges of the interval graph change. If None, the default, nothing is cached.
+
+        See Also
+        --------
+        window_cache_info
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.window_cache_size = 2 ** 20
+        >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12)])
+        >>> G.number_of_nodes(begin=0, end=3)
+        2
+        >>> list(G.nodes(begin=0, end=3))
+        [1, 2]
+        >>> G.window_cache_info()['hits']
+        1
+        """
+        return self._window_cache_size
+
+    @window_cache_size.setter
+    def window_cache_size(self, size):
+        if size is not None and not size > 0:
+            raise NetworkXError("IntervalGraph: window_cache_size must be bigger than zero or None. "
+                                "{0} was passed.".format(size))
+        self._window_cache_size = size
+        if size is None:
+            self._window_cache = None
+        elif self._window_cache is not None:
+            self._window_cache.max_size = size
+            self._window_cache.shrink()
+
+    def window_cache_info(self):
+        """Return the statistics of the cache of window queries.
+
+        Returns
+        -------
+        info : dict
+            'hits' and 'misses': number of window queries answered from the cache,
+            and computed, since the cache was enabled.
+            'entries' and 'size': number of results in the cache, and their size in bytes.
+            'max_size': `window_cache_size`.
+
+        See Also
+        --------
+        window_cache_size
+        """
+        cache = self._window_cache
+        if cache is None:
+            return {'hits': 0, 'misses': 0, 'entries': 0, 'size': 0, 'max_size': self._window_cache_size}
+
+        return {'hits': cache.hits, 'misses': cache.misses, 'entries': len(cache.entries), 'size': cache.size,
+                'max_size': cache.max_size}
+
     def __str__(self):
         """Return the interval graph name.
 
@@ -198,6 +341,63 @@ class IntervalGraph(object):
         except TypeError:
             return False
 
+    def __getstate__(self):
+        """Return the state of the interval graph for pickling.
+
+        The edges are pickled as flat columns of begin, end, node ids and attribute
+        dicts, instead of the interval tree and the adjacency, which refer to every
+        edge more than once. Indexes are not pickled and rebuilt after unpickling.
+
+        Examples
+        --------
+        >>> import pickle
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2.5})])
+        >>> H = pickle.loads(pickle.dumps(G))
+        >>> sorted(H.edges(data=True))
+        [(Interval(1, 11, (2, 4)), {'weight': 2.5}), (Interval(3, 10, (1, 2)), {})]
+        """
+        labels = list(self._node)
+        ids = {n: i for i, n in enumerate(labels)}
+
+        begin, end, u, v, eattr = [], [], [], [], []
+        for iv, d in self._iter_edge_attrs():
+            begin.append(iv.begin)
+            end.append(iv.end)
+            u.append(ids[iv.data[0]])
+            v.append(ids[iv.data[1]])
+            eattr.append(d)
+
+        state = {name: value for name, value in vars(self).items() if name not in _INDEX_ATTRS}
+        state['_edges'] = (labels, begin, end, u, v, eattr if any(eattr) else None)
+        return state
+
+    def __setstate__(self, state):
+        """Restore the interval graph from the state returned by `__getstate__`.
+
+        The adjacency is rebuilt from the edge columns, while the interval tree is
+        built on its first access and the node activity index on the first node query.
+        """
+        labels, begin, end, u, v, eattr = state.pop('_edges')
+        self.__init__()
+        self.__dict__.update(state)
+        for n in self._node:
+            self._adj[n] = {}
+
+        iedges = []
+        for b, e, i, j, d in zip(begin, end, u, v, eattr if eattr is not None else [None] * len(begin)):
+            pair_iedges = self._pair_iedges(labels[i], labels[j])
+            iedge = Interval(b, e, pair_iedges.pair(labels[i], labels[j]))
+            pair_iedges[iedge] = d
+            iedges.append(iedge)
+
+        self._tree_iedges = iedges
+        self._dirty_nodes = set(self._node)
+
+    def is_directed(self):
+        """Return True if the interval graph is directed, False otherwise."""
+        return False
+
     def interval(self):
         """Return a 2-tuple as (begin, end) interval of the entire
          interval graph.
@@ -357,15 +557,7 @@ class IntervalGraph(object):
         if end is None:
             end = self.tree.end() + 1
 
-        iedges = self.tree[begin:end]
-
-        inodes = set()
-
-        for iv in iedges:
-            inodes.add(iv.data[0])
-            inodes.add(iv.data[1])
-
-        return len(inodes)
+        return len(self.__active_nodes(begin, end))
 
     def has_node(self, n, begin=None, end=None):
         """Return True if the interval graph contains the node n, during the given interval.
@@ -418,13 +610,15 @@ class IntervalGraph(object):
         if end is None:
             end = self.tree.end() + 1
 
-        iedges = self._adj[n].keys()
-
-        for iv in iedges:
-            if iv.overlaps(begin=begin, end=end):
-                return True
+        self.__update_node_index()
+        segments = self._node_segments.get(n)
+        if segments is None:
+            return False
 
-        return False
+        # segments are disjoint, so the last one beginning before end ends the latest
+        begins, ends = segments
+        i = bisect_left(begins, end)
+        return i > 0 and ends[i - 1] > begin
 
     def nodes(self, begin=None, end=None, data=False, default=None):
         """A NodeDataView of the IntervalGraph nodes.
@@ -491,14 +685,7 @@ class IntervalGraph(object):
         if end is None:
             end = self.tree.end() + 1
 
-        iedges = self.tree[begin:end]
-
-        inodes = set()
-        for iv in iedges:
-            inodes.add(iv.data[0])
-            inodes.add(iv.data[1])
-
-        node_dict = {n: self._node[n] for n in inodes}
+        node_dict = {n: self._node[n] for n in self.__active_nodes(begin, end)}
 
         return NodeDataView(node_dict, data=data, default=default)
 
@@ -542,8 +729,7 @@ class IntervalGraph(object):
             return
 
         if begin is None and end is None:
-            for iedge in list(self._adj[n].keys()):
-                self.__remove_iedge(iedge)
+            iedges_to_remove = [iv for iedges in self._node_iedges(n) for iv in iedges]
         else:
             if begin is None:
                 begin = self.tree.begin()
@@ -551,14 +737,13 @@ class IntervalGraph(object):
             if end is None:
                 end = self.tree.end() + 1
 
-            for iedge in self.tree[begin:end]:
-                if iedge.data[0] == n or iedge.data[1] == n:
-                    self.__remove_iedge(iedge)
+            iedges_to_remove = [iv for iedges in self._node_iedges(n) for iv in iedges.overlap(begin, end)]
+
+        for iedge in iedges_to_remove:
+            self._remove_iedge(iedge)
 
         # delete the node and its attributes if no edge left
-        if len(self._adj[n]) == 0:
-            self._adj.pop(n, None)
-            self._node.pop(n, None)
+        self._remove_isolated(n)
 
     def add_edge(self, u, v, begin, end, **attr):
         """Add an edge between u and v, during interval [begin, end).
@@ -613,31 +798,30 @@ class IntervalGraph(object):
         >>> G.add_edge(1, 3, 4, 9, weight=7, capacity=15, length=342.7)
         """
 
-        iedge = self.__get_iedge_in_tree(begin, end, u, v)
+        iedge = self._get_iedge(u, v, begin, end)
 
         # if edge exists, just update attr
         if iedge is not None:
-            # since both point to the same attr, updating one is enough
-            self._adj[u][iedge].update(attr)
+            if attr:
+                self._adj[u][v][iedge].update(attr)
             return
 
-        iedge = Interval(begin, end, (u, v))
+        if not begin < end:
+            raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}."
+                                .format(Interval(begin, end, (u, v))))
 
-        # add nodes
-        if u not in self._node:
-            self._adj[u] = {}
-            self._node[u] = {}
-        if v not in self._node:
-            self._adj[v] = {}
-            self._node[v] = {}
+        iedges = self._pair_iedges(u, v)
+        iedge = Interval(begin, end, iedges.pair(u, v))
 
-        # add edge
-        try:
-            self.tree.add(iedge)
-        except ValueError:
-            raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}.".format(iedge))
+        # add edge, attribute dicts are only created for edges with attributes
+        self.tree.add(iedge)
+        iedges[iedge] = attr or None
+        self._version += 1
+        self._dirty_nodes.update(iedge.data)
 
-        self._adj[u][iedge] = self._adj[v][iedge] = attr
+        if self._ends is not None:
+            self._ends.setdefault(end, set()).add(iedge)
+        self._expire_retention()
 
     def add_edges_from(self, ebunch_to_add, **attr):
         """Add all the edges in ebunch_to_add.
@@ -646,7 +830,8 @@ class IntervalGraph(object):
         ----------
         ebunch_to_add : container of edges
             Each edge given in the container will be added to the
-            interval graph. The edges must be given as as 4-tuples (u, v, being, end).
+            interval graph. The edges must be given as as 4-tuples (u, v, being, end)
+            or 5-tuples (u, v, begin, end, d) where d is a dictionary containing edge data.
             Both begin and end must be orderable and the same type across all edges.
         attr : keyword arguments, optional
             Edge data (or labels or objects) can be assigned using
@@ -661,6 +846,13 @@ class IntervalGraph(object):
         Adding the same edge (with the same interval) twice has no effect
         but any edge data will be updated when each duplicate edge is added.
 
+        The edges are added in bulk: duplicates are resolved for the whole container
+        first, then the adjacency is filled in one pass. If there are more new edges
+        than edges already in the interval graph, the interval tree is rebuilt
+        in one pass from the sorted intervals instead of inserting them one by one.
+        Thus, adding all the edges with a single call is considerably faster
+        than calling `add_edge` for each edge.
+
         Examples
         --------
         >>> G = dnx.IntervalGraph()
@@ -669,14 +861,60 @@ class IntervalGraph(object):
         Associate data to edges
 
         >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)], weight=3)
-        >>> G.add_edges_from([(3, 4, 2, 19), (1, 4, 1, 3)], label='WN2898')
+        >>> G.add_edges_from([(3, 4, 2, 19), (1, 4, 1, 3, {'weight': 5})], label='WN2898')
         """
 
+        # new interval edges keyed by (begin, end, u, v), in order of appearance
+        new_iedges = {}
+
         for e in ebunch_to_add:
-            if len(e) != 4:
-                raise NetworkXError("Edge tuple {0} must be a 4-tuple.".format(e))
+            ne = len(e)
+            if ne == 5:
+                u, v, begin, end, dd = e
+            elif ne == 4:
+                u, v, begin, end = e
+                dd = {}
+            else:
+                raise NetworkXError("Edge tuple {0} must be a 4-tuple or 5-tuple.".format(e))
+
+            if begin >= end:
+                raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}."
+                                    .format(Interval(begin, end, (u, v))))
+
+            datadict = new_iedges.get((begin, end, u, v))
+            if datadict is None and not self.is_directed():
+                datadict = new_iedges.get((begin, end, v, u))
+            if datadict is None:
+                iedge = self._get_iedge(u, v, begin, end)
+                if iedge is not None:
+                    datadict = self._adj[u][v][iedge]
+                else:
+                    datadict = new_iedges[(begin, end, u, v)] = {}
+
+            datadict.update(attr)
+            datadict.update(dd)
+
+        iedges = []
+        for (begin, end, u, v), datadict in new_iedges.items():
+            pair_iedges = self._pair_iedges(u, v)
+            iedge = Interval(begin, end, pair_iedges.pair(u, v))
+            pair_iedges[iedge] = datadict or None
+            iedges.append(iedge)
+            self._dirty_nodes.update(iedge.data)
+
+        if self._ends is not None:
+            for iedge in iedges:
+                self._ends.setdefault(iedge.end, set()).add(iedge)
+
+        if len(iedges) > len(self.tree):
+            iedges.extend(self.tree.all_intervals)
+            self.tree = _build_tree(iedges)
+        else:
+            self.tree.update(iedges)
+        if iedges:
+            self._version += 1
 
-            self.add_edge(e[0], e[1], e[2], e[3], **attr)
+        self._expire_retention()
 
     def has_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Return True if there exists an edge between u and v
@@ -726,19 +964,21 @@ class IntervalGraph(object):
         True
         >>> G.has_edge(2, 4, begin=2, end=11)
         False
+
+        Nodes which are not in the interval graph have no edges:
+
+        >>> G.has_edge(1, 5)
+        False
         """
 
         if begin is None and end is None:
-            for iv in self._adj[u].keys():
-                if iv.data[0] == v or iv.data[1] == v:
-                    return True
-            return False
+            return u in self._adj and v in self._adj[u]
 
         if not overlapping:
             if begin is None or end is None:
                 raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
 
-            return self.__get_iedge_in_tree(u, v, begin, end) is not None
+            return self._get_iedge(u, v, begin, end) is not None
 
         if begin is None:
             begin = self.tree.begin()
@@ -746,13 +986,11 @@ class IntervalGraph(object):
         if end is None:
             end = self.tree.end() + 1
 
-        for iv in self._adj[u].keys():
-            if (iv.data[0] == v or iv.data[1] == v) and iv.overlaps(begin=begin, end=end):
-                return True
-        return False
+        iedges = self._adj[u].get(v) if u in self._adj else None
+        return iedges is not None and iedges.overlaps(begin, end)
 
     def edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
-        """A list of Interval objects of the IntervalGraph edges.
+        """A view of the Interval objects of the IntervalGraph edges.
 
         All edges which are present within the given interval.
 
@@ -784,58 +1022,89 @@ class IntervalGraph(object):
 
         Returns
         -------
-        List of Interval objects
+        IntervalEdgeView or IntervalEdgeDataView
             An interval object has the following format: (begin, end, (u, v))
 
-            When called, if `data` is False, a list of interval objects.
-            If `data` is True, a list of 2-tuples: (Interval, dict of attribute(s) with values),
-            If `data` is a string, a list of 2-tuples (Interval, attribute value).
+            When called, if `data` is False, a set-like view of interval objects,
+            which also maps them to their attribute dicts.
+            If `data` is True, a view of 2-tuples: (Interval, dict of attribute(s) with values),
+            If `data` is a string, a view of 2-tuples (Interval, attribute value).
+
+        Notes
+        -----
+        The views are lazy: edges are looked up on every iteration, and
+        reflect changes to the graph. Use `list(G.edges())` to get a list of the edges.
+        Counting the edges with `len` is O(1) if no nodes or interval are given.
+
+        With `data=True`, the edges without attributes report a shared read-only
+        empty mapping, rather than a new dict for each edge. Set edge attributes
+        with `add_edge`, or through `G.edges[iedge]`.
 
         Examples
         --------
-        To get a list of all edges:
+        To get all edges:
 
         >>> G = dnx.IntervalGraph()
         >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
         >>> G.edges()
-        [Interval(8, 15, (2, 4)), Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4)), Interval(12, 19, (6, 4))]
+        IntervalEdgeView([Interval(8, 15, (2, 4)), Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4)), Interval(12, 19, (6, 4))])
 
         To get edges which appear in a specific interval:
 
         >>> G.edges(begin=10)
-        [Interval(12, 19, (6, 4)), Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))]
+        IntervalEdgeView([Interval(12, 19, (6, 4)), Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))])
         >>> G.edges(end=5)
-        [Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4))]
+        IntervalEdgeView([Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4))])
         >>> G.edges(begin=2, end=4)
-        [Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4))]
+        IntervalEdgeView([Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4))])
 
         To get edges with either of the two nodes being defined:
 
         >>> G.edges(u=2)
-        [Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))]
+        IntervalEdgeView([Interval(3, 10, (1, 2)), Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))])
         >>> G.edges(u=2, begin=11)
-        [Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))]
+        IntervalEdgeView([Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4))])
         >>> G.edges(u=2, v=4, end=8)
-        [Interval(1, 11, (2, 4))]
+        IntervalEdgeView([Interval(1, 11, (2, 4))])
         >>> G.edges(u=1, v=6)
-        []
+        IntervalEdgeView([])
 
-        To get a list of edges with data:
+        To get edges with data:
 
         >>> G = dnx.IntervalGraph()
         >>> G.add_edge(1, 3, 1, 4, weight=8, height=18)
         >>> G.add_edge(1, 2, 3, 10, weight=10)
         >>> G.add_edge(2, 6, 2, 10)
         >>> G.edges(data="weight")
-        [(Interval(2, 8, (2, 3)), None), (Interval(3, 10, (1, 2)), 10), (Interval(1, 4, (1, 3)), 8)]
+        IntervalEdgeDataView([(Interval(2, 8, (2, 3)), None), (Interval(3, 10, (1, 2)), 10), (Interval(1, 4, (1, 3)), 8)])
         >>> G.edges(data="weight", default=5)
-        [(Interval(2, 8, (2, 3)), 5), (Interval(3, 10, (1, 2)), 10), (Interval(1, 4, (1, 3)), 8)]
+        IntervalEdgeDataView([(Interval(2, 8, (2, 3)), 5), (Interval(3, 10, (1, 2)), 10), (Interval(1, 4, (1, 3)), 8)])
         >>> G.edges(data=True)
-        [(Interval(2, 8, (2, 3)), {}), (Interval(3, 10, (1, 2)), {'weight': 10}), (Interval(1, 4, (1, 3)), {'height': 18, 'weight': 8})]
+        IntervalEdgeDataView([(Interval(2, 8, (2, 3)), {}), (Interval(3, 10, (1, 2)), {'weight': 10}), (Interval(1, 4, (1, 3)), {'height': 18, 'weight': 8})])
         >>> G.edges(u=1, begin=5, end=9, data="weight")
-        [(Interval(3, 10, (1, 2)), 10)]
+        IntervalEdgeDataView([(Interval(3, 10, (1, 2)), 10)])
+
+        To access the attributes of an edge, or count edges without listing them:
+
+        >>> from intervaltree import Interval
+        >>> G.edges()[Interval(1, 4, (1, 3))]
+        {'weight': 8, 'height': 18}
+        >>> len(G.edges(u=1))
+        2
         """
 
+        # raise a KeyError for an unknown node right away, rather than once iterated
+        n = u if u is not None else v
+        if n is not None and n not in self._node:
+            raise KeyError(n)
+
+        if data is False:
+            return IntervalEdgeView(self, u, v, begin, end)
+
+        return IntervalEdgeDataView(self, u, v, begin, end, data, default)
+
+    def _iter_edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
+        """Return an iterator of the edges reported by `edges`, for edge views."""
         # If non of the nodes are defined the interval tree is queried for the list of edges,
         # otherwise the edges are returned based on the nodes in the self._adj.o
         if u is None and v is None:
@@ -848,34 +1117,64 @@ class IntervalGraph(object):
                 if end is None:
                     end = self.tree.end() + 1
 
-                iedges = self.tree[begin:end]
+                iedges = self.__window_iedges(begin, end)
 
         else:
             # Node filtering
             if u is not None and v is not None:
-               iedges = [iv for iv in self._adj[u].keys() if iv.data[0] == v or iv.data[1] == v]
+                iedges_dicts = [self._adj[u][v]] if v in self._adj[u] else []
             elif u is not None:
-                iedges = self._adj[u].keys()
+                iedges_dicts = self._node_iedges(u, predecessors=False)
             else:
-                iedges = self._adj[v].keys()
+                iedges_dicts = self._node_iedges(v, successors=False)
 
             # Interval filtering
-            if begin is not None and end is not None:
-                iedges = [iv for iv in iedges if iv.end >= begin and iv.begin < end]
-            elif begin is not None:
-                iedges = [iv for iv in iedges if iv.end >= begin]
-            elif end is not None:
-                iedges = [iv for iv in iedges if iv.begin < end]
+            if begin is None and end is None:
+                iedges = (iv for iedges in iedges_dicts for iv in iedges)
+            else:
+                if begin is None:
+                    begin = self.tree.begin()
+                if end is None:
+                    end = self.tree.end() + 1
+
+                iedges = (iv for iedges in iedges_dicts for iv in iedges.overlap(begin, end, inclusive_begin=True))
 
         # Appending attribute data if needed
         if data is False:
-            return iedges if isinstance(iedges, list) else list(iedges)
+            return iter(iedges)
 
         if data is True:
-            return [(iv, self._adj[iv.data[0]][iv]) for iv in iedges]
+            return ((iv, self._adj[iv.data[0]][iv.data[1]].peek(iv) or _EMPTY_ATTR) for iv in iedges)
 
-        return [(iv, self._adj[iv.data[0]][iv][data]) if data in self._adj[iv.data[0]][iv].keys() else
-                (iv, default) for iv in iedges]
+        return ((iv, (self._adj[iv.data[0]][iv.data[1]].peek(iv) or {}).get(data, default)) for iv in iedges)
+
+    def _iter_edge_attrs(self):
+        """Return an iterator of (Interval, attribute dict or None) 2-tuples of all the edges.
+
+        Unlike `edges(data=True)`, the edges without attributes are reported as None,
+        which is meant for internal read-only use. The edges are read from the
+        edge dicts of the node pairs, without looking each one up.
+        """
+        for iedges in self._iter_pair_iedges():
+            for item in dict.items(iedges):
+                yield item
+
+    def _iter_pair_iedges(self):
+        """Return an iterator of the edge dicts of all the node pairs with edges, each once."""
+        # the edge dict of a node pair is shared by both of its nodes in undirected graphs
+        seen = set()
+        for nbrs in self._adj.values():
+            for iedges in nbrs.values():
+                if id(iedges) not in seen:
+                    seen.add(id(iedges))
+                    yield iedges
+
+    def _count_edges(self, u=None, v=None, begin=None, end=None):
+        """Return the number of edges reported by `edges`, for edge views."""
+        if u is None and v is None and begin is None and end is None:
+            return len(self.tree.all_intervals)
+
+        return sum(1 for iv in self._iter_edges(u, v, begin, end))
 
     def remove_edge(self, u, v, begin=None, end=None, overlapping=True):
         """Remove the edge between u and v in the interval graph,
@@ -935,36 +1234,97 @@ class IntervalGraph(object):
             if begin is None or end is None:
                 raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
 
-            iedge = self.__get_iedge_in_tree(u, v, begin, end)
+            iedge = self._get_iedge(u, v, begin, end)
             if iedge is None:
                 return
-            self.__remove_iedge(iedge)
+            self._remove_iedge(iedge)
             return
 
-        iedges_to_remove = []
+        if u not in self._adj or v not in self._adj[u]:
+            return
 
         # remove every edge between u and v
         if begin is None and end is None:
-            for iv in self._adj[u].keys():
-                if iv.data[0] == v or iv.data[1] == v:
-                    iedges_to_remove.append(iv)
+            iedges_to_remove = list(self._adj[u][v])
 
         # remove edge between u and v with overlapping interval with the given interval
-        if begin is None:
-            begin = self.tree.begin()
+        else:
+            if begin is None:
+                begin = self.tree.begin()
 
-        if end is None:
-            end = self.tree.end() + 1
+            if end is None:
+                end = self.tree.end() + 1
 
-        for iv in self._adj[u].keys():
-            if (iv.data[0] == v or iv.data[1] == v) and iv.overlaps(begin=begin, end=end):
-                iedges_to_remove.append(iv)
+            iedges_to_remove = self._adj[u][v].overlap(begin, end)
 
         # removing found iedges
         for iv in iedges_to_remove:
-            self.__remove_iedge(iv)
+            self._remove_iedge(iv)
+
+    def expire_before(self, t):
+        """Remove all the edges which end at or before t, and the nodes left without edges.
+
+        Meant for interval graphs kept as a rolling store of a stream of edges,
+        where old edges are expired periodically, or automatically by setting `retention`.
+
+        Parameters
+        ----------
+        t : integer
+            Edges which end at or before t are removed. Since end is non-inclusive,
+            these are all the edges which are not present at t or later.
+
+        See Also
+        --------
+        retention
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12), (3, 4, 14, 20)])
+        >>> G.expire_before(12)
+        >>> G.edges()
+        IntervalEdgeView([Interval(14, 20, (3, 4))])
+        >>> list(G.nodes())
+        [3, 4]
+
+        Notes
+        -----
+        The first call indexes the edges by end, which later additions and
+        removals keep up to date. Then removing edges takes time proportional
+        to their number, or to the number of edges left if most of them are removed,
+        in which case the interval tree is rebuilt at once.
+
+        Node attributes of the removed nodes are removed as well.
+        """
+        if self._ends is None:
+            self._ends = SortedDict()
+            for iedge in self.tree.all_intervals:
+                self._ends.setdefault(iedge.end, set()).add(iedge)
+
+        expired = []
+        for end in list(self._ends.irange(maximum=t)):
+            expired.extend(self._ends.pop(end))
+
+        if not expired:
+            return
+
+        if 2 * len(expired) > len(self.tree):
+            self.tree = _build_tree([iv for iv in self.tree.all_intervals if iv.end > t])
+
+        for iedge in expired:
+            self._remove_iedge(iedge)
 
-    def __remove_iedge(self, iedge):
+        # delete the nodes and their attributes if no edge left
+        for iedge in expired:
+            for n in iedge.data:
+                self._remove_isolated(n)
+
+    def _expire_retention(self):
+        """Remove the edges which ended before the retention window, if one is set."""
+        if self._retention is not None and len(self.tree) > 0:
+            self.expire_before(self.interval()[1] - self._retention)
+
+    def _remove_iedge(self, iedge):
         """Remove the interval edge from the interval graph.
 
         Quiet if the specified edge is not present.
@@ -979,13 +1339,148 @@ class IntervalGraph(object):
         >>> G = dnx.IntervalGraph()
         >>> G.add_edge(1, 2, 3, 10)
         >>> iedge = Interval(3, 10, (1, 2))   # Interval(begin, end, (u, v))
-        >>> G.__remove_iedge(iedge)
+        >>> G._remove_iedge(iedge)
         """
         self.tree.discard(iedge)
-        self._adj[iedge.data[0]].pop(iedge, None)
-        self._adj[iedge.data[1]].pop(iedge, None)
 
-    def __get_iedge_in_tree(self, u, v, begin, end):
+        u, v = iedge.data
+        iedges = self._adj[u].get(v)
+        if iedges is None:
+            return
+
+        iedges.pop(iedge, None)
+        self._dirty_nodes.update(iedge.data)
+        self._version += 1
+
+        if self._ends is not None:
+            ends = self._ends.get(iedge.end)
+            if ends is not None:
+                ends.discard(iedge)
+                if not ends:
+                    del self._ends[iedge.end]
+
+        # drop the neighbors once there are no edges left between them
+        if len(iedges) == 0:
+            self._remove_pair(u, v)
+
+    def _pair_iedges(self, u, v):
+        """Return the dict of the interval edges between u and v, adding the nodes and the dict if needed."""
+        # add nodes
+        if u not in self._node:
+            self._adj[u] = {}
+            self._node[u] = {}
+        if v not in self._node:
+            self._adj[v] = {}
+            self._node[v] = {}
+
+        iedges = self._adj[u].get(v)
+        if iedges is None:
+            # both nodes share the same dict of interval edges, and the data tuples of its intervals
+            u, v = self._label(u), self._label(v)
+            iedges = self._adj[u][v] = self._adj[v][u] = _IntervalEdgeDict((u, v))
+
+        return iedges
+
+    def _label(self, n):
+        """Return the node label equal to n used by the interval edges of n, or n if it has no edges.
+
+        Interns the node labels of new edges, e.g. strings parsed from a file,
+        so that only one copy of each label is kept.
+        """
+        for iedges in self._adj.get(n, {}).values():
+            return iedges._pair[0] if iedges._pair[0] == n else iedges._pair[1]
+        return n
+
+    def _remove_pair(self, u, v):
+        """Remove u and v from the neighbors of each other."""
+        del self._adj[u][v]
+        self._adj[v].pop(u, None)
+
+    def _node_iedges(self, n, successors=True, predecessors=True):
+        """Return the dicts of the interval edges of node n, to each of its neighbors.
+
+        For directed graphs, only the dicts of its outgoing edges if predecessors=False,
+        and of its incoming edges if successors=False.
+        """
+        return self._adj[n].values()
+
+    def _remove_isolated(self, n):
+        """Remove node n and its attributes if it has no edges left."""
+        if n in self._adj and len(self._adj[n]) == 0:
+            del self._adj[n]
+            del self._node[n]
+
+    def __active_nodes(self, begin, end):
+        """Return the set of nodes with an edge overlapping [begin, end), from the node activity index."""
+        def active_nodes():
+            self.__update_node_index()
+            return frozenset(iv.data for iv in _tree_overlap(self._node_tree, begin, end))
+
+        return self.__cached_window('nodes', begin, end, active_nodes)
+
+    def __window_iedges(self, begin, end):
+        """Return a list of the interval edges overlapping [begin, end)."""
+        return self.__cached_window('edges', begin, end, lambda: _tree_overlap(self.tree, begin, end))
+
+    def __cached_window(self, query, begin, end, compute):
+        """Return the result of the window query from the cache if enabled, computing it if needed.
+
+        Results are shared by every caller and must not be modified.
+        """
+        if self._window_cache_size is None:
+            return compute()
+
+        cache = self._window_cache
+        if cache is None:
+            cache = self._window_cache = _WindowCache(self._window_cache_size)
+        if cache.version != self._version:
+            cache.clear(self._version)
+
+        key = (query, begin, end)
+        result = cache.get(key)
+        if result is None:
+            result = compute()
+            cache.put(key, result)
+        return result
+
+    def __update_node_index(self):
+        """Update the node activity index for the nodes whose edges changed since the last update.
+
+        If most of the nodes changed, e.g. after adding edges in bulk,
+        the tree of node intervals is rebuilt at once.
+        """
+        if not self._dirty_nodes:
+            return
+
+        dirty = self._dirty_nodes
+        self._dirty_nodes = set()
+        rebuild = 2 * len(dirty) > len(self._node_segments)
+
+        for n in dirty:
+            segments = self._node_segments.pop(n, None)
+            if segments is not None and not rebuild:
+                for begin, end in zip(*segments):
+                    self._node_tree.discard(Interval(begin, end, n))
+
+            if n in self._node and any(self._node_iedges(n)):
+                segments = self._node_segments[n] = _merge_intervals(
+                    iv for iedges in self._node_iedges(n) for iv in iedges)
+                if not rebuild:
+                    self._node_tree.update(Interval(begin, end, n) for begin, end in zip(*segments))
+
+        if rebuild:
+            self._node_tree = _build_tree([Interval(begin, end, n) for n, segments in self._node_segments.items()
+                                           for begin, end in zip(*segments)])
+
+    def _edge_attr_dict(self, iedge):
+        """Return the attribute dict of an edge of the graph, creating it if the edge has none.
+
+        Used to set attributes through `G.edges[iedge]`, while iterating the edges
+        reports a shared read-only mapping for the edges without attributes.
+        """
+        return self._adj[iedge.data[0]][iedge.data[1]][iedge]
+
+    def _get_iedge(self, u, v, begin, end):
         """Return interval edge if found in the interval graph with the exact interval,
         otherwise return None.
 
@@ -1004,18 +1499,22 @@ class IntervalGraph(object):
         --------
         >>> G = dnx.IntervalGraph()
         >>> G.add_edge(1, 2, 3, 10)
-        >>> G.__get_iedge_in_tree(2, 1, 3, 10)
+        >>> G._get_iedge(2, 1, 3, 10)
         Interval(3, 10, (1, 2))
-        >>> G.__get_iedge_in_tree(2, 1, 4, 10)
+        >>> G._get_iedge(2, 1, 4, 10)
         None
         """
+        try:
+            iedges = self._adj[u][v]
+        except KeyError:
+            return None
 
         temp_iedge = Interval(begin, end, (u, v))
-        if temp_iedge in self.tree:
+        if temp_iedge in iedges:
             return temp_iedge
 
         temp_iedge = Interval(begin, end, (v, u))
-        if temp_iedge in self.tree:
+        if temp_iedge in iedges:
             return temp_iedge
 
         return None
@@ -1045,6 +1544,7 @@ class IntervalGraph(object):
         See Also
         --------
         to_snapshots : divide the interval graph to snapshots
+        window_view : read-only graph view of the interval graph during an interval
 
         Notes
         -----
@@ -1080,19 +1580,17 @@ class IntervalGraph(object):
             raise NetworkXError("IntervalGraph: subgraph duration must be strictly bigger than zero: "
                                 "begin: {}, end: {}.".format(begin, end))
 
-        iedges = self.tree[begin:end]
+        iedges = self.__window_iedges(begin, end)
 
-        if multigraph:
-            G = MultiGraph()
-        else:
-            G = Graph()
+        G = self._graph_class(multigraph)()
 
         if edge_data and edge_interval_data:
             G.add_edges_from((iedge.data[0], iedge.data[1],
-                              dict(self._adj[iedge.data[0]][iedge], begin=iedge.begin, end=iedge.end))
+                              dict(self._adj[iedge.data[0]][iedge.data[1]].peek(iedge) or {},
+                                   begin=iedge.begin, end=iedge.end))
                              for iedge in iedges)
         elif edge_data:
-            G.add_edges_from((iedge.data[0], iedge.data[1], self._adj[iedge.data[0]][iedge].copy())
+            G.add_edges_from((iedge.data[0], iedge.data[1], dict(self._adj[iedge.data[0]][iedge.data[1]].peek(iedge) or {}))
                              for iedge in iedges)
         elif edge_interval_data:
             G.add_edges_from((iedge.data[0], iedge.data[1], {'begin': iedge.begin, 'end': iedge.end})
@@ -1107,7 +1605,7 @@ class IntervalGraph(object):
         return G
 
     def to_snapshots(self, number_of_snapshots, multigraph=False, edge_data=False, edge_interval_data=False,
-                     node_data=False, return_length=False):
+                     node_data=False, return_length=False, return_snapshot_graph=False):
         """Return a list of networkx Graph or MultiGraph objects as snapshots
         of the interval graph in consecutive order.
 
@@ -1128,6 +1626,8 @@ class IntervalGraph(object):
             if True, each node's attributes will be included.
         return_length : bool, optional (default= False)
             If true, the length of snapshots will be returned as the second argument.
+        return_snapshot_graph : bool, optional (default= False)
+            If True, the snapshots will be returned as a SnapshotGraph instead of a list.
 
         See Also
         --------
@@ -1140,6 +1640,11 @@ class IntervalGraph(object):
         If multigraph= False, and edge_data=True or edge_interval_data=True,
         in case there are multiple edges, only one will show with one of the edge's attributes.
 
+        Snapshots are built with a sweep line over the begin and end of the edges:
+        from one snapshot to the next, only the node pairs with edges which enter
+        or leave its interval are updated. Every snapshot has its own copies of
+        the node and edge attribute dicts.
+
         Examples
         --------
         Snapshots of NetworkX Graph
@@ -1168,6 +1673,12 @@ class IntervalGraph(object):
         [(1, 2, {'end': 10, 'begin': 3}), (2, 4, {'end': 11, 'begin': 1})]
         [(1, 2, {'end': 10, 'begin': 3}), (2, 4, {'end': 11, 'begin': 1}), (2, 4, {'end': 15, 'begin': 8}), (4, 6, {'end': 19, 'begin': 12})]
         [(2, 4, {'end': 15, 'begin': 8}), (4, 6, {'end': 19, 'begin': 12})]
+
+        Snapshots as a SnapshotGraph
+
+        >>> S = G.to_snapshots(2, return_snapshot_graph=True)
+        >>> len(S)
+        2
         """
 
         if number_of_snapshots < 2 or type(number_of_snapshots) is not int:
@@ -1177,89 +1688,1769 @@ class IntervalGraph(object):
         begin, end = self.interval()
         snapshot_len = (end - begin) / number_of_snapshots
 
-        snapshots = []
-        end_inclusive_addition = 0
-        for i in range(number_of_snapshots):
-            # since to_subgraph is end non-inclusive, shift the end up by 1 to include end in the last snapshot.
-            if i == number_of_snapshots - 1:
-                end_inclusive_addition = 1
-
-            snapshots.append(
-                self.to_subgraph(begin + snapshot_len * i, begin + snapshot_len * (i + 1) + end_inclusive_addition,
-                                 multigraph=multigraph, edge_data=edge_data, edge_interval_data=edge_interval_data,
-                                 node_data=node_data))
+        snapshots = list(self.iter_snapshots(number_of_snapshots, multigraph=multigraph, edge_data=edge_data,
+                                             edge_interval_data=edge_interval_data, node_data=node_data))
+
+        if return_snapshot_graph:
+            snapshot_graph = SnapshotGraph()
+            for snapshot in snapshots:
+                snapshot_graph.add_snapshot(graph=snapshot)
+            snapshots = snapshot_graph
+
         if return_length:
             return snapshots, snapshot_len
 
         return snapshots
 
-    @staticmethod
-    def load_from_txt(path, delimiter=" ", nodetype=None, comments="#"):
-        """Read interval graph in from path.
-           Every line in the file must be an edge in the following format: "node node begin end".
-           Both interval times must be integers. Nodes can be any hashable objects.
+    def iter_snapshots(self, number_of_snapshots=None, width=None, step=None, multigraph=False, edge_data=False,
+                       edge_interval_data=False, node_data=False):
+        """Return a generator of networkx Graph or MultiGraph objects as snapshots
+        of the interval graph in consecutive order, one at a time.
+
+        Either divide the interval graph into `number_of_snapshots` equal snapshots, as in `to_snapshots`,
+        or slide a window of length `width` by `step` from the beginning of the interval graph.
 
         Parameters
         ----------
-        path : string or file
-           Filename to read.
+        number_of_snapshots : integer, optional (default= None)
+            Number of snapshots to divide the interval graph into. If `width` is given,
+            the maximum number of snapshots to generate.
+        width : number, optional (default= None)
+            Length of the interval of each snapshot.
+        step : number, optional (default= width)
+            Distance between the beginning of consecutive snapshots.
+            If smaller than `width`, consecutive snapshots overlap.
+        multigraph : bool, optional (default= False)
+            If True, networkx MultiGraph objects will be generated. If False, networkx Graph.
+        edge_data: bool, optional (default= False)
+            If True, edges will keep their attributes.
+        edge_interval_data : bool, optional (default= False)
+            If True, each edge's attribute will also include its begin and end interval data.
+            If `edge_data= True` and there already exist edge attributes with names begin and end,
+            they will be overwritten.
+        node_data : bool, optional (default= False)
+            if True, each node's attributes will be included.
 
-        nodetype : Python type, optional
-           Convert nodes to this type.
+        See Also
+        --------
+        to_snapshots : list of snapshots of the interval graph
 
-        comments : string, optional
-           Marker for comment lines
+        Notes
+        -----
+        Snapshots are built with the same sweep line as `to_snapshots`, and only the
+        state of the sweep is kept in memory while generating. Each snapshot is
+        independent, with its own copies of the node and edge attribute dicts.
 
-        delimiter : string, optional
-           Separator for node labels.  The default is whitespace.
+        Windows of length `width` are generated until one begins at or after the end of the interval graph.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> for g in G.iter_snapshots(width=10, step=5):
+        ...     print(sorted(g.edges()))
+        [(2, 1), (2, 4)]
+        [(2, 1), (2, 4), (4, 6)]
+        [(2, 4), (4, 6)]
+        [(4, 6)]
+        """
+        if width is None:
+            if number_of_snapshots is None:
+                raise NetworkXError("IntervalGraph: either number_of_snapshots or width must be given.")
+            if step is not None:
+                raise NetworkXError("IntervalGraph: step can only be given along with width.")
+        elif width <= 0 or (step is not None and step <= 0):
+            raise NetworkXError("IntervalGraph: width and step must be bigger than zero.")
+
+        if number_of_snapshots is not None and (number_of_snapshots < 1 or type(number_of_snapshots) is not int):
+            raise NetworkXError("IntervalGraph: number of snapshots must be an integer and 1 or bigger. "
+                                "{0} was passed.".format(number_of_snapshots))
+
+        return self._sweep_snapshots(self.__snapshot_windows(number_of_snapshots, width, step),
+                                     multigraph=multigraph, edge_data=edge_data,
+                                     edge_interval_data=edge_interval_data, node_data=node_data)
+
+    def __snapshot_windows(self, number_of_snapshots, width, step):
+        """Generate the (begin, end) intervals of the snapshots of `iter_snapshots`."""
+        begin, end = self.interval()
+
+        if width is None:
+            snapshot_len = (end - begin) / number_of_snapshots
+            end_inclusive_addition = 0
+            for i in range(number_of_snapshots):
+                # since to_subgraph is end non-inclusive, shift the end up by 1 to include end in the last snapshot.
+                if i == number_of_snapshots - 1:
+                    end_inclusive_addition = 1
+
+                yield begin + snapshot_len * i, begin + snapshot_len * (i + 1) + end_inclusive_addition
+            return
+
+        if step is None:
+            step = width
+
+        i = 0
+        while begin + step * i < end and (number_of_snapshots is None or i < number_of_snapshots):
+            yield begin + step * i, begin + step * i + width
+            i += 1
+
+    def map_windows(self, func, windows, processes=None, chunksize=None, multigraph=False, edge_data=False,
+                    edge_interval_data=False, node_data=False):
+        """Return a generator of `func` applied to the subgraph of each window, computed in parallel.
+
+        Parameters
+        ----------
+        func : callable
+            Function called with the networkx Graph or MultiGraph of each window,
+            the same as `to_subgraph(begin, end)`. It must be picklable,
+            e.g. defined at the top level of a module, and not modify the graph.
+        windows : iterable of 2-tuples
+            (begin, end) intervals of the windows.
+        processes : integer, optional (default= number of CPUs)
+            Number of worker processes. If 1, windows are computed in this process.
+        chunksize : integer, optional (default= None)
+            Number of consecutive windows computed by a worker at once.
+            By default, the windows are divided into one chunk per process.
+        multigraph, edge_data, edge_interval_data, node_data : bool, optional (default= False)
+            Same as in `to_subgraph`.
 
         Returns
         -------
-        G: IntervalGraph
-            The graph corresponding to the lines in edge list.
+        results : generator
+            The result of `func` for each window, in the order of `windows`.
+
+        Raises
+        ------
+        NetworkXError
+            If a window does not end after it begins.
+
+        See Also
+        --------
+        iter_snapshots : generator of the snapshots of the interval graph
 
         Examples
         --------
-        >>> G=dnx.IntervalGraph.load_from_txt("my_dygraph.txt")
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> list(G.map_windows(len, [(0, 5), (5, 10), (10, 15), (15, 20)], processes=2))
+        [3, 3, 3, 2]
 
-        The optional nodetype is a function to convert node strings to nodetype.
+        Notes
+        -----
+        The interval graph is sent once to each worker, as flat edge columns,
+        and each worker builds the subgraphs of a chunk of consecutive windows
+        itself. Chunks of windows sorted by begin and end are built with the sweep
+        line of `iter_snapshots`, from one window to the next, which sorts the edges
+        once per chunk. Thus smaller chunks balance the load better, at the cost of
+        more sorting. Results are sent back a chunk at a time, and yielded as soon
+        as all the previous ones are.
+
+        With the 'fork' start method of multiprocessing, the workers inherit
+        the interval graph without pickling it.
+        """
+        windows = windows.tolist() if hasattr(windows, 'tolist') else windows
+        windows = [(begin, end) for begin, end in windows]
+        for begin, end in windows:
+            if end <= begin:
+                raise NetworkXError("IntervalGraph: window duration must be strictly bigger than zero: "
+                                    "begin: {}, end: {}.".format(begin, end))
 
-        For example
+        options = {'multigraph': multigraph, 'edge_data': edge_data, 'edge_interval_data': edge_interval_data,
+                   'node_data': node_data}
 
-        >>> G=dnx.IntervalGraph.load_from_txt("my_dygraph.txt", nodetype=int)
+        if processes == 1:
+            return (func(G) for G in _window_subgraphs(self, windows, options))
 
-        will attempt to convert all nodes to integer type.
+        return self.__map_windows_pool(func, windows, processes, chunksize, options)
 
-        Since nodes must be hashable, the function nodetype must return hashable
-        types (e.g. int, float, str, frozenset - or tuples of those, etc.)
-        """
+    def __map_windows_pool(self, func, windows, processes, chunksize, options):
+        """Generate the results of `map_windows` from a pool of worker processes."""
+        from multiprocessing import Pool, cpu_count
 
-        ig = IntervalGraph()
+        if processes is None:
+            processes = cpu_count()
+        if chunksize is None:
+            chunksize = max(1, -(-len(windows) // processes))
+        chunks = [windows[i:i + chunksize] for i in range(0, len(windows), chunksize)]
 
-        with open(path, 'r') as file:
-            for line in file:
-                p = line.find(comments)
-                if p >= 0:
-                    line = line[:p]
-                if not len(line):
-                    continue
+        pool = Pool(processes, initializer=_init_window_worker, initargs=(self, func, options))
+        try:
+            for results in pool.imap(_map_window_chunk, chunks):
+                for result in results:
+                    yield result
+        finally:
+            pool.terminate()
 
-                line = line.rstrip().split(delimiter)
-                u, v, begin, end = line
+    def activity_series(self, bins):
+        """Return the number of active nodes and edges in each window of `bins`.
 
-                if nodetype is not None:
-                    try:
-                        u = nodetype(u)
-                        v = nodetype(v)
-                    except:
-                        raise TypeError("Failed to convert node to type {0}".format(nodetype))
+        Parameters
+        ----------
+        bins : sequence of numbers
+            Strictly increasing window boundaries. Window i is the interval
+            [bins[i], bins[i+1]), thus there is one window less than boundaries.
 
-                try:
-                    begin = int(begin)
-                    end = nodetype(end)
-                except:
-                    raise TypeError("Failed to convert time to type int")
+        Returns
+        -------
+        nnodes, nedges : NumPy arrays
+            The number of nodes and edges in each window, the same as
+            `number_of_nodes(begin, end)` and `len(edges(begin=begin, end=end))`.
 
-                ig.add_edge(u, v, begin, end)
+        See Also
+        --------
+        degree_series
 
-        return ig
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> nnodes, nedges = G.activity_series([0, 5, 10, 15, 20])
+        >>> nnodes
+        array([3, 3, 3, 2])
+        >>> nedges
+        array([2, 3, 3, 1])
+
+        Notes
+        -----
+        All windows are counted at once from the sorted begin and end of the edges,
+        with binary searches, in O((m + k) log m) for m edges and k windows,
+        instead of querying each window.
+        """
+        import numpy as np
+
+        bins = _series_bins(bins)
+        k = len(bins) - 1
+        begin, end, u, v, labels, eattr = self._edge_columns()
+
+        # edges overlapping [lo, hi) are the ones beginning before hi, except the ones ending at or before lo
+        nedges = np.searchsorted(begin, bins[1:], side='left') - \
+            np.searchsorted(np.sort(end), bins[:-1], side='right')
+
+        node, first, last = _window_ranges(np.concatenate((u, v)), np.concatenate((begin, begin)),
+                                           np.concatenate((end, end)), bins)
+        nnodes = _count_ranges(first, last, k)
+
+        return nnodes, nedges
+
+    def degree_series(self, nodes, bins, multigraph=False):
+        """Return the degree of each node of `nodes` in each window of `bins`.
+
+        Parameters
+        ----------
+        nodes : container of nodes
+            Nodes to return the degrees of. If None, all the nodes of the interval graph.
+        bins : sequence of numbers
+            Strictly increasing window boundaries. Window i is the interval
+            [bins[i], bins[i+1]), thus there is one window less than boundaries.
+        multigraph : bool, optional (default= False)
+            If True, the degree is the number of edges of a node overlapping the window.
+            If False, the number of its neighbors during the window.
+            A self-loop counts twice, as in networkx. For directed graphs,
+            the sum of the numbers of successors and predecessors.
+
+        Returns
+        -------
+        degrees : NumPy array
+            Array of shape (number of nodes, number of windows), where degrees[j, i]
+            is the degree of the j-th node in `to_subgraph(bins[i], bins[i+1], multigraph)`.
+
+        Raises
+        ------
+        NetworkXError
+            If a node is not in the interval graph.
+
+        See Also
+        --------
+        activity_series
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.degree_series([2, 4], [0, 5, 10, 15, 20])
+        array([[2, 2, 1, 0],
+               [1, 1, 2, 1]])
+        >>> G.degree_series([2, 4], [0, 5, 10, 15, 20], multigraph=True)
+        array([[2, 3, 2, 0],
+               [1, 2, 3, 1]])
+        """
+        import numpy as np
+
+        bins = _series_bins(bins)
+        k = len(bins) - 1
+        begin, end, u, v, labels, eattr = self._edge_columns()
+
+        if nodes is None:
+            nodes = list(self._node)
+        ids = {n: i for i, n in enumerate(labels)}
+        try:
+            nodes = np.array([ids[n] for n in nodes], dtype=np.int64)
+        except KeyError as err:
+            raise NetworkXError("The node {0} is not in the interval graph.".format(err.args[0]))
+
+        # the row of the result of each node id, or -1 for the nodes not asked for
+        row = np.full(len(labels), -1, dtype=np.int64)
+        row[nodes] = np.arange(len(nodes))
+
+        # each edge counts once from each of its ends, which counts a self-loop twice
+        node = np.concatenate((u, v))
+        nbr = np.concatenate((v, u))
+        keep = row[node] >= 0
+        node, nbr = node[keep], nbr[keep]
+        begin = np.concatenate((begin, begin))[keep]
+        end = np.concatenate((end, end))[keep]
+
+        if multigraph:
+            group, first, last = _window_ranges(np.arange(len(node)), begin, end, bins)
+            node = node[group]
+        elif self.is_directed():
+            # a successor and a predecessor are different neighbors, as in the degree of a DiGraph
+            side = np.repeat(np.array([0, 1], dtype=np.int64), len(u))[keep]
+            group, first, last = _window_ranges((node * len(labels) + nbr) * 2 + side, begin, end, bins)
+            node = group // 2 // len(labels)
+        else:
+            group, first, last = _window_ranges(node * len(labels) + nbr, begin, end, bins)
+            node, nbr = group // len(labels), group % len(labels)
+            loops = node == nbr
+            node = np.concatenate((node, node[loops]))
+            first = np.concatenate((first, first[loops]))
+            last = np.concatenate((last, last[loops]))
+
+        degrees = _count_ranges(first, last, k, rows=row[node], nrows=len(nodes))
+        return degrees[row[nodes]]
+
+    def memory_usage(self):
+        """Return the memory used by the interval graph, in bytes, by part.
+
+        Returns
+        -------
+        usage : dict
+            Number of bytes used by each part of the interval graph:
+
+            - 'nodes': node dict, node labels and node attribute dicts.
+            - 'edges': Interval objects of the edges, their begin, end and data tuples.
+            - 'edge_attrs': edge attribute dicts, with their keys and values.
+            - 'adjacency': adjacency dicts, holding the interval edges of each pair of nodes.
+            - 'index': interval tree, node activity index and any other structure of the graph.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (1, 2, 8, 15, {'weight': 2})])
+        >>> usage = G.memory_usage()
+        >>> sorted(usage)
+        ['adjacency', 'edge_attrs', 'edges', 'index', 'nodes']
+        >>> bytes_per_edge = sum(usage.values()) / len(G.edges())
+
+        Notes
+        -----
+        Sizes are measured with `sys.getsizeof`, following the references of each part.
+        An object shared by several parts, e.g. a node label, is only counted in the
+        first part it appears in, thus the parts add up to the total memory used.
+
+        Edges without attributes share no attribute dict until their attributes
+        are accessed, and the edges between the same two nodes share their data tuple.
+        """
+        seen = set()
+        iedges = self.tree.all_intervals
+        adj = self._adj
+        return {'nodes': _deep_sizeof([self._node], seen),
+                'edges': _deep_sizeof(iedges, seen),
+                'edge_attrs': _deep_sizeof([self._adj[iv.data[0]][iv.data[1]].peek(iv) for iv in iedges], seen),
+                # the predecessors of directed graphs, which is the same adjacency for undirected ones
+                'adjacency': _deep_sizeof([adj, self._window_adjacency(None, None, predecessors=True)], seen),
+                'index': _deep_sizeof(list(vars(self).values()), seen)}
+
+    def to_sparse_tensor(self, bins, multigraph=False, supra=False, coupling=None):
+        """Return the adjacency matrices of the windows of `bins` as one sparse matrix, over a global node index.
+
+        Parameters
+        ----------
+        bins : sequence of numbers
+            Strictly increasing window boundaries. Window t is the interval
+            [bins[t], bins[t+1]), thus there is one window less than boundaries.
+        multigraph : bool, optional (default= False)
+            If True, entries are the number of edges between two nodes overlapping
+            the window. If False, 1 if there is any.
+        supra : bool, optional (default= False)
+            If False, the adjacency matrices of the T windows, of the N nodes of the
+            interval graph, are stacked into a matrix of shape (T * N, N), where window t
+            is rows t * N up to (t + 1) * N. If True, they are the diagonal blocks of a
+            supra-adjacency matrix of shape (T * N, T * N).
+        coupling : number, optional (default= None)
+            If given with supra=True, weight of the edges between each node and
+            itself in the previous and next windows.
+
+        Returns
+        -------
+        nodes : list
+            Global node index, the node of row and column i of each adjacency matrix is nodes[i].
+        A : SciPy COO matrix
+            Adjacency matrix of window t is the adjacency matrix of `to_subgraph(bins[t], bins[t+1], multigraph)`
+            over `nodes`. For undirected graphs, each edge is in both directions.
+
+        See Also
+        --------
+        to_snapshots
+        SnapshotGraph.to_sparse_tensor
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> nodes, A = G.to_sparse_tensor([0, 10, 20])
+        >>> nodes
+        [1, 2, 4, 6]
+        >>> A.toarray()[4:]
+        array([[0, 0, 0, 0],
+               [0, 0, 1, 0],
+               [0, 1, 0, 1],
+               [0, 0, 1, 0]])
+        >>> nodes, S = G.to_sparse_tensor([0, 10, 20], supra=True, coupling=1)
+        >>> S.shape
+        (8, 8)
+
+        Notes
+        -----
+        All windows are built at once from the sorted begin and end of the edges,
+        instead of one snapshot at a time, and in the same node order.
+        """
+        import numpy as np
+
+        bins = _series_bins(bins)
+        begin, end, u, v, labels, eattr = self._edge_columns()
+        n = len(labels)
+
+        if multigraph:
+            group = np.arange(len(u))
+        elif self.is_directed():
+            group = u * n + v
+        else:
+            group = np.minimum(u, v) * n + np.maximum(u, v)
+
+        group, first, last = _window_ranges(group, begin, end, bins)
+        group, t = _expand_ranges(group, first, last)
+        if multigraph:
+            i, j = u[group], v[group]
+        else:
+            i, j = group // n, group % n
+
+        return labels, _sparse_tensor(t, i, j, len(bins) - 1, n, directed=self.is_directed(),
+                                      supra=supra, coupling=coupling)
+
+    def aggregate(self, begin=None, end=None, weight='duration', bins=None):
+        """Return a weighted networkx Graph of the edges overlapping [begin, end),
+        or one for each window of `bins`.
+
+        Each pair of nodes is one edge, whose attribute 'weight' sums over the edges
+        between them how long or how often they overlap the window.
+
+        Parameters
+        ----------
+        begin : integer, optional (default= None)
+            Inclusive beginning time of the window. If None, the beginning of the interval graph.
+        end : integer, optional (default= None)
+            Non-inclusive ending time of the window. If None, the end of the interval graph.
+        weight : 'duration', 'count' or function, optional (default= 'duration')
+            If 'duration', the weight is the total time the edges overlap the window,
+            with their intervals clipped to it. If 'count', the number of edges overlapping
+            the window. If a function, it is called with the NumPy arrays of the clipped
+            begin and end of all the overlaps and returns an array of their weights, which are summed.
+        bins : sequence of numbers, optional (default= None)
+            Strictly increasing window boundaries. If given, `begin` and `end` are ignored
+            and a list of graphs is returned, where window i is the interval [bins[i], bins[i+1]).
+
+        Returns
+        -------
+        networkx Graph or list of networkx Graphs
+            Graph (DiGraph for directed interval graphs) with the same nodes and
+            edges as `to_subgraph` of the window, with weights.
+
+        See Also
+        --------
+        to_subgraph
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> H = G.aggregate(4, 12)
+        >>> list(H.edges(data=True))
+        [(1, 2, {'weight': 6}), (2, 4, {'weight': 11})]
+        >>> [list(H.edges(data='weight')) for H in G.aggregate(bins=[0, 10, 20], weight='count')]
+        [[(1, 2, 1), (2, 4, 2)], [(2, 4, 2), (4, 6, 1)]]
+
+        Notes
+        -----
+        All windows are aggregated at once from the edge columns: each overlap of an
+        edge and a window is weighted, and the weights are summed by window and pair of nodes.
+        """
+        import numpy as np
+
+        if bins is None:
+            if begin is None or end is None:
+                first, last = self.interval()
+                begin = first if begin is None else begin
+                end = last if end is None else end
+                if end <= begin:
+                    return self._graph_class()()
+            elif end <= begin:
+                raise NetworkXError("IntervalGraph: aggregate duration must be strictly bigger than zero: "
+                                    "begin: {}, end: {}.".format(begin, end))
+            return self.aggregate(weight=weight, bins=[begin, end])[0]
+
+        if not callable(weight) and weight not in ('duration', 'count'):
+            raise NetworkXError("IntervalGraph: weight must be 'duration', 'count' or a function, "
+                                "{0} was passed.".format(weight))
+
+        bins = _series_bins(bins)
+        k = len(bins) - 1
+        begin, end, u, v, labels, eattr = self._edge_columns()
+        n = len(labels)
+
+        # one overlap for each edge and window it overlaps
+        edge, first, last = _window_ranges(np.arange(len(u)), begin, end, bins)
+        edge, t = _expand_ranges(edge, first, last)
+
+        if weight == 'count':
+            values = np.ones(len(edge), dtype=np.int64)
+        else:
+            lo = np.maximum(begin[edge], bins[t])
+            hi = np.minimum(end[edge], bins[t + 1])
+            values = hi - lo if weight == 'duration' else np.asarray(weight(lo, hi))
+
+        u, v = u[edge], v[edge]
+        if self.is_directed():
+            pair = u * n + v
+        else:
+            pair = np.minimum(u, v) * n + np.maximum(u, v)
+
+        # sum the weights of the runs of overlaps of the same window and pair
+        order = np.lexsort((pair, t))
+        t, pair, values = t[order], pair[order], values[order]
+        starts = np.flatnonzero(np.concatenate(([True], (t[1:] != t[:-1]) | (pair[1:] != pair[:-1])))) \
+            if len(t) else t
+        sums = np.add.reduceat(values, starts).tolist() if len(t) else []
+        t, pair = t[starts], pair[starts]
+
+        graphs = []
+        bounds = np.searchsorted(t, np.arange(k + 1)).tolist()
+        for i in range(k):
+            lo, hi = bounds[i], bounds[i + 1]
+            G = self._graph_class()()
+            G.add_weighted_edges_from((labels[a], labels[b], w) for a, b, w in
+                                      zip((pair[lo:hi] // n).tolist(), (pair[lo:hi] % n).tolist(), sums[lo:hi]))
+            graphs.append(G)
+
+        return graphs
+
+    def edges_at(self, times):
+        """Return the edges present at each of the time points `times`.
+
+        Parameters
+        ----------
+        times : sequence of numbers
+            Sorted time points. An edge is present at t if begin <= t < end.
+
+        Returns
+        -------
+        offsets, indices : NumPy arrays
+            The edges present at times[i] are edges[j] for j in indices[offsets[i]:offsets[i+1]],
+            in order of their begin. `offsets` has one element more than `times`.
+        edges : list
+            Interval objects of all the edges, sorted by begin.
+
+        Raises
+        ------
+        NetworkXError
+            If `times` are not sorted.
+
+        See Also
+        --------
+        nodes_at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+        >>> offsets, indices, edges = G.edges_at([0, 3, 11, 12])
+        >>> offsets
+        array([0, 0, 2, 2, 3])
+        >>> [edges[j] for j in indices[offsets[1]:offsets[2]]]
+        [Interval(1, 11, (2, 4)), Interval(3, 10, (1, 2))]
+
+        Notes
+        -----
+        All time points are answered at once, from the sorted begin and end of the
+        edges, with binary searches, in O(m log k + r) for m edges, k time points
+        and r edges in the result, instead of querying each time point.
+        """
+        import numpy as np
+
+        times = _series_times(times)
+        begin, end, u, v, labels, eattr = self._edge_columns()
+
+        group, first, last = _point_ranges(np.arange(len(begin)), begin, end, times)
+        offsets, indices = _csr_ranges(group, first, last, len(times))
+
+        edges = [Interval(b, e, (labels[i], labels[j]))
+                 for b, e, i, j in zip(begin.tolist(), end.tolist(), u.tolist(), v.tolist())]
+        return offsets, indices, edges
+
+    def nodes_at(self, times):
+        """Return the nodes present at each of the time points `times`.
+
+        A node is present at t if it has an edge present at t, as in `edges_at`.
+
+        Parameters
+        ----------
+        times : sequence of numbers
+            Sorted time points.
+
+        Returns
+        -------
+        offsets, indices : NumPy arrays
+            The nodes present at times[i] are nodes[j] for j in indices[offsets[i]:offsets[i+1]].
+            `offsets` has one element more than `times`.
+        nodes : list
+            All the nodes of the interval graph.
+
+        Raises
+        ------
+        NetworkXError
+            If `times` are not sorted.
+
+        See Also
+        --------
+        edges_at
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+        >>> offsets, indices, nodes = G.nodes_at([0, 3, 11, 12])
+        >>> [[nodes[j] for j in indices[offsets[i]:offsets[i + 1]]] for i in range(4)]
+        [[], [1, 2, 4], [], [4, 6]]
+        """
+        import numpy as np
+
+        times = _series_times(times)
+        begin, end, u, v, labels, eattr = self._edge_columns()
+
+        group, first, last = _point_ranges(np.concatenate((u, v)), np.concatenate((begin, begin)),
+                                           np.concatenate((end, end)), times)
+        offsets, indices = _csr_ranges(group, first, last, len(times))
+
+        return offsets, indices, labels
+
+    def _window_adjacency(self, begin, end, predecessors=False):
+        """Return the adjacency of the edges overlapping [begin, end), for window views.
+
+        A dict of nodes to dicts of neighbors to dicts of the edges between them,
+        which support `overlaps` and `overlap` interval queries. It must hold
+        at least the edges overlapping the window. IntervalGraph returns its own adjacency.
+        For directed graphs, the neighbors are the successors, or the predecessors
+        if predecessors=True.
+        """
+        return self._adj
+
+    def _graph_class(self, multigraph=False):
+        """Return the networkx graph class of the subgraphs and snapshots of the interval graph."""
+        return MultiGraph if multigraph else Graph
+
+    def _sweep(self, windows):
+        """Sweep the edges through a sequence of windows.
+
+        Parameters
+        ----------
+        windows : iterable of 2-tuples
+            (begin, end) windows, with non-decreasing begin and end.
+
+        Yields
+        ------
+        entering, leaving : lists
+            For each window, the (Interval, attribute dict or None) 2-tuples of the edges
+            which overlap it but not the previous window, and of the edges
+            which overlap the previous window but not this one.
+        """
+        iedges = list(self._iter_edge_attrs())
+        by_begin = sorted(iedges, key=lambda e: e[0].begin)
+        by_end = sorted(iedges, key=lambda e: e[0].end)
+
+        # edges overlapping the current window, and the edges which ended before entering any window
+        active = set()
+        passed = set()
+
+        nb = ne = 0
+        for begin, end in windows:
+            leaving = []
+            while ne < len(by_end) and by_end[ne][0].end <= begin:
+                iedge = by_end[ne][0]
+                if iedge in active:
+                    active.remove(iedge)
+                    leaving.append(by_end[ne])
+                else:
+                    passed.add(iedge)
+                ne += 1
+
+            entering = []
+            while nb < len(by_begin) and by_begin[nb][0].begin < end:
+                iedge = by_begin[nb][0]
+                if iedge not in passed:
+                    active.add(iedge)
+                    entering.append(by_begin[nb])
+                nb += 1
+
+            yield entering, leaving
+
+    def _sweep_snapshots(self, windows, multigraph=False, edge_data=False, edge_interval_data=False,
+                         node_data=False):
+        """Yield a networkx Graph or MultiGraph for each window, the same as `to_subgraph`.
+
+        The active edges of each node pair, and the attributes of the pair in the snapshot,
+        are updated only for the node pairs with edges entering or leaving the window.
+        Each snapshot is then built from them with its own copies of the attribute dicts,
+        so that the snapshots are independent of each other and of the interval graph.
+        """
+        graph_class = self._graph_class(multigraph)
+        directed = graph_class().is_directed()
+
+        # active edges of each node pair, keys of the active edges in a MultiGraph,
+        # attributes of each node pair in the snapshot as (u, v, attr),
+        # and number of node pairs with active edges of each node
+        pair_iedges = {}
+        iedge_keys = {}
+        pair_attr = {}
+        node_pairs = Counter()
+
+        def edge_attr(iedge, d):
+            if edge_data and d:
+                attr = d.copy()
+            else:
+                attr = {}
+            if edge_interval_data:
+                attr['begin'] = iedge.begin
+                attr['end'] = iedge.end
+            return attr
+
+        for entering, leaving in self._sweep(windows):
+            changed = {}
+            for iedge, d in leaving:
+                pair = iedge.data if directed else frozenset(iedge.data)
+                del pair_iedges[pair][iedge]
+                iedge_keys.pop(iedge, None)
+                changed[pair] = iedge.data
+            for iedge, d in entering:
+                pair = iedge.data if directed else frozenset(iedge.data)
+                pair_iedges.setdefault(pair, {})[iedge] = d
+                changed[pair] = iedge.data
+
+            for pair, (u, v) in changed.items():
+                iedges = pair_iedges[pair]
+
+                if not iedges:
+                    del pair_iedges[pair]
+                    del pair_attr[pair]
+                    for n in pair:
+                        node_pairs[n] -= 1
+                        if not node_pairs[n]:
+                            del node_pairs[n]
+                    continue
+
+                if pair not in pair_attr:
+                    for n in pair:
+                        node_pairs[n] += 1
+
+                if multigraph:
+                    previous = pair_attr[pair][2] if pair in pair_attr else {}
+                    attr = {}
+                    for iedge in iedges:
+                        if iedge in iedge_keys:
+                            attr[iedge_keys[iedge]] = previous[iedge_keys[iedge]]
+                    for iedge, d in iedges.items():
+                        if iedge not in iedge_keys:
+                            key = len(attr)
+                            while key in attr:
+                                key += 1
+                            iedge_keys[iedge] = key
+                            attr[key] = edge_attr(iedge, d)
+                else:
+                    attr = {}
+                    for iedge, d in iedges.items():
+                        attr.update(edge_attr(iedge, d))
+
+                pair_attr[pair] = (u, v, attr)
+
+            H = graph_class()
+            if node_data:
+                H._node = {n: self._node[n].copy() for n in node_pairs}
+            else:
+                H._node = {n: {} for n in node_pairs}
+            adj = H._adj = {n: {} for n in node_pairs}
+            # the adjacency of the reverse direction, which is the same for undirected graphs
+            pred = adj
+            if directed:
+                H._succ = adj
+                pred = H._pred = {n: {} for n in node_pairs}
+
+            if multigraph:
+                for u, v, attr in pair_attr.values():
+                    adj[u][v] = pred[v][u] = {key: d.copy() for key, d in attr.items()}
+            else:
+                for u, v, attr in pair_attr.values():
+                    adj[u][v] = pred[v][u] = attr.copy()
+
+            yield H
+
+    def _add_edge_columns(self, u, v, begin, end, attr=None):
+        """Add the edges given as columns through the bulk-build path.
+
+        Parameters
+        ----------
+        u, v, begin, end : sequences or NumPy arrays of equal length
+            Nodes and intervals of the edges.
+        attr : dict, optional (default= None)
+            Edge attribute columns, keyed by attribute name.
+        """
+        u, v, begin, end = (c.tolist() if hasattr(c, 'tolist') else c for c in (u, v, begin, end))
+
+        if attr:
+            names = list(attr)
+            values = zip(*(attr[name].tolist() if hasattr(attr[name], 'tolist') else attr[name] for name in names))
+            self.add_edges_from(zip(u, v, begin, end, (dict(zip(names, row)) for row in values)))
+        else:
+            self.add_edges_from(zip(u, v, begin, end))
+
+    @classmethod
+    @open_file(1, mode='rb')
+    def load_from_txt(cls, path, delimiter=" ", nodetype=None, comments="#", columns=None, dtype=None,
+                      chunksize=100000, encoding='utf-8'):
+        """Read interval graph in from path.
+           Every line in the file must be an edge in the following format: "node node begin end".
+           Both interval times must be integers. Nodes can be any hashable objects.
+
+        Parameters
+        ----------
+        path : string or file
+           Filename to read. Filenames ending in .gz or .bz2 will be uncompressed.
+
+        nodetype : Python type, optional
+           Convert nodes to this type.
+
+        comments : string, optional
+           Marker for comment lines
+
+        delimiter : string, optional
+           Separator for node labels.  The default is whitespace.
+           If None or whitespace, any run of whitespace separates the fields.
+
+        columns : dict, optional (default= {'u': 0, 'v': 1, 'begin': 2, 'end': 3})
+           Mapping of 'u', 'v', 'begin' and 'end' to the index of their column in each line.
+           Any other key is read as an edge attribute from the given column.
+
+        dtype : dict, optional (default= None)
+           Mapping of column names (as in `columns`) to the NumPy dtype or Python type
+           to read them as. By default, nodes are read as strings (or `nodetype`),
+           begin and end as integers and attributes are inferred.
+
+        chunksize : integer, optional (default= 100000)
+           Number of lines parsed at once.
+
+        encoding : string, optional
+           Specify which encoding to use when reading file.
+
+        Returns
+        -------
+        G: IntervalGraph
+            The graph corresponding to the lines in edge list.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "my_dygraph.txt")
+        >>> with open(path, "w") as f:
+        ...     _ = f.write("1 2 3 10\\n2 4 1 11\\n")
+        >>> G=dnx.IntervalGraph.load_from_txt(path)
+        >>> sorted(G.edges())
+        [Interval(1, 11, ('2', '4')), Interval(3, 10, ('1', '2'))]
+
+        The optional nodetype is a function to convert node strings to nodetype.
+
+        For example
+
+        >>> G=dnx.IntervalGraph.load_from_txt(path, nodetype=int)
+
+        will attempt to convert all nodes to integer type.
+
+        Since nodes must be hashable, the function nodetype must return hashable
+        types (e.g. int, float, str, frozenset - or tuples of those, etc.)
+
+        Columns can be mapped in any order, and extra columns read as edge attributes:
+
+        >>> path = os.path.join(tempfile.mkdtemp(), "contacts.csv")
+        >>> with open(path, "w") as f:
+        ...     _ = f.write("3,10,1,2,0.5\\n1,11,2,4,1.5\\n")
+        >>> G=dnx.IntervalGraph.load_from_txt(path, delimiter=",",
+        ...                                   columns={'begin': 0, 'end': 1, 'u': 2, 'v': 3, 'weight': 4},
+        ...                                   dtype={'u': 'int32', 'v': 'int32', 'weight': float})
+        >>> sorted(G.edges(data='weight'))
+        [(Interval(1, 11, (2, 4)), 1.5), (Interval(3, 10, (1, 2)), 0.5)]
+
+        Notes
+        -----
+        The file is parsed in chunks of `chunksize` lines with pandas, when it is
+        available, and each chunk is added through the bulk-build path of
+        `add_edges_from` as it is read, so that the parsed lines are not all kept
+        in memory. Without pandas, or with a `comments` marker longer than one
+        character, which pandas does not support, lines are parsed in Python.
+        Both parsers read the same fields, where only empty fields are missing values,
+        and raise a NetworkXError if a node of an edge is missing.
+        """
+        if columns is None:
+            columns = {'u': 0, 'v': 1, 'begin': 2, 'end': 3}
+
+        for name in ('u', 'v', 'begin', 'end'):
+            if name not in columns:
+                raise NetworkXError("IntervalGraph: columns must include '{0}'.".format(name))
+
+        dtypes = {'u': str, 'v': str, 'begin': int, 'end': int}
+        if nodetype is not None:
+            dtypes['u'] = dtypes['v'] = nodetype
+        if dtype is not None:
+            dtypes.update(dtype)
+
+        try:
+            import pandas
+        except ImportError:
+            pandas = None
+
+        if pandas is None or (comments is not None and len(comments) != 1):
+            chunks = _parse_txt_chunks(path, delimiter, comments, columns, dtypes, chunksize, encoding)
+        else:
+            chunks = _read_txt_chunks(path, delimiter, comments, columns, dtypes, chunksize, encoding)
+
+        ig = cls()
+        for chunk in chunks:
+            data = {name: chunk[name] for name in columns}
+            ig._add_edge_columns(data.pop('u'), data.pop('v'), data.pop('begin'), data.pop('end'), attr=data)
+
+        return ig
+
+    def _edge_columns(self):
+        """Return all the edges as columns, sorted by begin, then end and endpoints.
+
+        Returns
+        -------
+        begin, end, u, v : NumPy arrays
+            Intervals of the edges, and the integer ids of their nodes in `labels`.
+        labels : list
+            Node label table, the node of id i is labels[i].
+        eattr : list or None
+            Attribute dict (or None) of each edge, None if no edge has attributes.
+        """
+        import numpy as np
+
+        labels = list(self._node)
+        ids = {n: i for i, n in enumerate(labels)}
+
+        # gather the intervals and attributes as flat lists, without a tuple for each edge
+        iedges = []
+        attrs = []
+        for pair_iedges in self._iter_pair_iedges():
+            iedges.extend(dict.keys(pair_iedges))
+            attrs.extend(dict.values(pair_iedges))
+
+        begin = np.array([iv.begin for iv in iedges])
+        end = np.array([iv.end for iv in iedges])
+        u = np.array([ids[iv.data[0]] for iv in iedges], dtype=np.int64)
+        v = np.array([ids[iv.data[1]] for iv in iedges], dtype=np.int64)
+
+        order = np.lexsort((np.maximum(u, v), np.minimum(u, v), end, begin)) if len(iedges) else u
+        eattr = [attrs[r] for r in order.tolist()] if any(attrs) else None
+
+        return begin[order], end[order], u[order], v[order], labels, eattr
+
+    def _load_edge_columns(self, begin, end, u, v, labels, eattr=None, max_end=None):
+        """Add the edges given as sorted columns of node ids, as returned by `_edge_columns`.
+
+        `max_end`, the running maximum of `end`, may be given to avoid computing it again.
+        """
+        u = [labels[i] for i in u.tolist()]
+        v = [labels[i] for i in v.tolist()]
+
+        if eattr is None:
+            self.add_edges_from(zip(u, v, begin.tolist(), end.tolist()))
+        else:
+            self.add_edges_from(zip(u, v, begin.tolist(), end.tolist(), (d or {} for d in eattr)))
+
+    def save(self, path):
+        """Write interval graph to a directory of binary files.
+
+        The edges are written as NumPy arrays of begin, end and node ids,
+        sorted by begin, along with the node label table and edge attribute
+        columns. Use `load` to read the interval graph back.
+
+        Parameters
+        ----------
+        path : string
+           Directory to write to. It is created if it does not exist, and
+           files of a previously saved interval graph are overwritten.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "contacts.dnx")
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2.5})])
+        >>> G.save(path)
+
+        Notes
+        -----
+        The layout of the directory is:
+
+        - `begin.npy`, `end.npy`, `u.npy`, `v.npy` and `max_end.npy`: edge columns, with
+          u and v as integer node ids and max_end the running maximum of end.
+        - `attr.<i>.npy`: values of the i-th edge attribute, and `attr.<i>.rows.npy`: rows of
+          the edges which have it, if not all of them.
+        - `meta.pkl`: graph attributes, node label table, node attributes and names of edge attributes.
+
+        Node labels, attributes and non-numeric columns are pickled.
+        """
+        import os
+        import pickle
+        import numpy as np
+
+        if not os.path.isdir(path):
+            os.makedirs(path)
+
+        begin, end, u, v, labels, eattr = self._edge_columns()
+
+        names = []
+        if eattr is not None:
+            seen = set()
+            for d in eattr:
+                if d:
+                    for name in d:
+                        if name not in seen:
+                            seen.add(name)
+                            names.append(name)
+
+        for name, values in (('begin', begin), ('end', end), ('u', u), ('v', v),
+                             ('max_end', np.maximum.accumulate(end) if len(end) else end)):
+            np.save(os.path.join(path, name + '.npy'), values)
+
+        for i, name in enumerate(names):
+            rows = [r for r, d in enumerate(eattr) if d and name in d]
+            values = [eattr[r][name] for r in rows]
+
+            types = set(map(type, values))
+            if len(types) == 1 and types.pop() in (bool, int, float, complex, str):
+                column = np.asarray(values)
+            else:
+                column = np.empty(len(values), dtype=object)
+                column[:] = values
+
+            np.save(os.path.join(path, 'attr.{0}.npy'.format(i)), column)
+            rows_path = os.path.join(path, 'attr.{0}.rows.npy'.format(i))
+            if len(rows) < len(begin):
+                np.save(rows_path, np.array(rows, dtype=np.int64))
+            elif os.path.exists(rows_path):
+                os.remove(rows_path)
+
+        meta = {'version': 1,
+                'graph': self.graph,
+                'labels': labels,
+                'nodes': list(self._node.items()),
+                'edge_attrs': names}
+
+        with open(os.path.join(path, 'meta.pkl'), 'wb') as file:
+            pickle.dump(meta, file, pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def load(cls, path, mmap=True):
+        """Read interval graph from a directory written by `save`.
+
+        Parameters
+        ----------
+        path : string
+           Directory to read from.
+
+        mmap : bool, optional (default= True)
+           If True, the edge columns are memory-mapped read-only instead of
+           read into memory. Pages of the files are then loaded on access
+           and shared by all the processes which load the same interval graph.
+           Begin and end columns of Python objects, such as datetimes, are
+           always read into memory.
+
+        Returns
+        -------
+        G: IntervalGraph
+            The graph corresponding to the directory, of the class `load` was called on.
+
+        Examples
+        --------
+        >>> import os, tempfile
+        >>> path = os.path.join(tempfile.mkdtemp(), "contacts.dnx")
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2.5})])
+        >>> G.save(path)
+        >>> H = dnx.IntervalGraph.load(path)
+        >>> sorted(H.edges(data=True))
+        [(Interval(1, 11, (2, 4)), {'weight': 2.5}), (Interval(3, 10, (1, 2)), {})]
+
+        Notes
+        -----
+        IntervalGraph builds its interval tree from the memory-mapped columns, while
+        ArrayIntervalGraph uses them in place, which makes loading a large
+        ArrayIntervalGraph almost instant. Edges added or removed afterwards are
+        kept in memory and never written back to the files.
+
+        Only load interval graphs from trusted sources, since parts of the files are pickled.
+        """
+        import os
+        import pickle
+        import numpy as np
+
+        with open(os.path.join(path, 'meta.pkl'), 'rb') as file:
+            meta = pickle.load(file)
+
+        def load_column(name):
+            filename = os.path.join(path, name + '.npy')
+            try:
+                return np.load(filename, mmap_mode='r' if mmap else None)
+            except ValueError:
+                # columns of Python objects, such as datetime bounds, are pickled and cannot be memory-mapped
+                return np.load(filename, allow_pickle=True)
+
+        begin, end, u, v, max_end = (load_column(name) for name in ('begin', 'end', 'u', 'v', 'max_end'))
+
+        eattr = None
+        if meta['edge_attrs']:
+            eattr = [None] * len(begin)
+            for i, name in enumerate(meta['edge_attrs']):
+                values = np.load(os.path.join(path, 'attr.{0}.npy'.format(i)), allow_pickle=True).tolist()
+                rows_path = os.path.join(path, 'attr.{0}.rows.npy'.format(i))
+                rows = np.load(rows_path).tolist() if os.path.exists(rows_path) else range(len(begin))
+
+                for r, value in zip(rows, values):
+                    if eattr[r] is None:
+                        eattr[r] = {}
+                    eattr[r][name] = value
+
+        G = cls(**meta['graph'])
+        G.add_nodes_from(meta['nodes'])
+        G._load_edge_columns(begin, end, u, v, meta['labels'], eattr=eattr, max_end=max_end)
+
+        return G
+
+    @classmethod
+    def from_pandas_edgelist(cls, df, source='source', target='target', begin='begin', end='end', edge_attr=None):
+        """Return an interval graph with the edges of a pandas DataFrame, one edge per row.
+
+        Parameters
+        ----------
+        df : pandas DataFrame
+            Edge list, with a column for each node, begin and end of the edges, and
+            possibly edge attributes. Any mapping of column names to columns, such as a dict
+            of NumPy arrays or a NumPy structured array, is accepted as well.
+        source, target : string, optional (default= 'source', 'target')
+            Names of the columns of the nodes of the edges.
+        begin, end : string, optional (default= 'begin', 'end')
+            Names of the columns of the inclusive begin and non-inclusive end of the edges.
+        edge_attr : string, list of strings or True, optional (default= None)
+            Names of the columns added as edge attributes, with the same names.
+            If True, all the other columns. If None, edges have no attributes.
+
+        Returns
+        -------
+        G : IntervalGraph
+            The graph of the edge list, of the class `from_pandas_edgelist` was called on.
+
+        See Also
+        --------
+        from_numpy_edgelist
+        to_pandas_edgelist
+
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> df = pd.DataFrame({'source': [1, 2, 6], 'target': [2, 4, 4],
+        ...                    'begin': [3, 1, 12], 'end': [10, 11, 19], 'weight': [0.5, 2, 1]})
+        >>> G = dnx.IntervalGraph.from_pandas_edgelist(df, edge_attr='weight')
+        >>> G.edges(begin=10, data=True)
+        IntervalEdgeDataView([(Interval(1, 11, (2, 4)), {'weight': 2.0}), (Interval(12, 19, (6, 4)), {'weight': 1.0})])
+
+        Notes
+        -----
+        Whole columns are passed to the bulk-build path of the interval graph, thus
+        this is much faster than adding the rows of the DataFrame one by one. Edges
+        are validated at once, and ArrayIntervalGraph keeps the columns as they are.
+        """
+        if edge_attr is True:
+            names = df.dtype.names if hasattr(df, 'dtype') else list(df.keys())
+            edge_attr = [name for name in names if name not in (source, target, begin, end)]
+        elif edge_attr is None or edge_attr is False:
+            edge_attr = []
+        elif isinstance(edge_attr, str):
+            edge_attr = [edge_attr]
+
+        return cls.from_numpy_edgelist(df[source], df[target], df[begin], df[end],
+                                       edge_attr={name: df[name] for name in edge_attr})
+
+    @classmethod
+    def from_numpy_edgelist(cls, source, target, begin, end, edge_attr=None):
+        """Return an interval graph with the edges given as NumPy arrays, one edge per element.
+
+        Parameters
+        ----------
+        source, target : NumPy arrays or sequences
+            Nodes of the edges.
+        begin, end : NumPy arrays or sequences
+            Inclusive begin and non-inclusive end of the edges.
+        edge_attr : dict, optional (default= None)
+            Mapping of edge attribute names to the array of their values.
+
+        Returns
+        -------
+        G : IntervalGraph
+            The graph of the edge list, of the class `from_numpy_edgelist` was called on.
+
+        Raises
+        ------
+        NetworkXError
+            If the arrays do not have the same length, or any edge has a duration of zero or less.
+
+        See Also
+        --------
+        from_pandas_edgelist
+        to_numpy_edgelist
+
+        Examples
+        --------
+        >>> import numpy as np
+        >>> G = dnx.IntervalGraph.from_numpy_edgelist(np.array([1, 2, 6]), np.array([2, 4, 4]),
+        ...                                           np.array([3, 1, 12]), np.array([10, 11, 19]))
+        >>> G.edges(begin=10)
+        IntervalEdgeView([Interval(1, 11, (2, 4)), Interval(12, 19, (6, 4))])
+        """
+        import numpy as np
+
+        columns = [np.asarray(c) for c in (source, target, begin, end)]
+        edge_attr = {name: np.asarray(values) for name, values in (edge_attr or {}).items()}
+
+        n = len(columns[0])
+        if any(len(c) != n for c in columns) or any(len(values) != n for values in edge_attr.values()):
+            raise NetworkXError("IntervalGraph: edge list columns must have the same length.")
+
+        G = cls()
+        G._add_edge_columns(*columns, attr=edge_attr)
+
+        return G
+
+    def to_pandas_edgelist(self, source='source', target='target', begin='begin', end='end', edge_attr=True):
+        """Return the edges of the interval graph as a pandas DataFrame, one edge per row.
+
+        Parameters
+        ----------
+        source, target, begin, end : string, optional (default= 'source', 'target', 'begin', 'end')
+            Names of the columns of the nodes, begin and end of the edges.
+        edge_attr : string, list of strings or bool, optional (default= True)
+            Names of the edge attributes added as columns. If True, all the edge
+            attributes. Values of edges without an attribute are NaN.
+
+        Returns
+        -------
+        df : pandas DataFrame
+            Edge list, with edges sorted by begin, then end.
+
+        See Also
+        --------
+        to_numpy_edgelist
+        from_pandas_edgelist
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2})])
+        >>> G.to_pandas_edgelist()
+           source  target  begin  end  weight
+        0       2       4      1   11     2.0
+        1       1       2      3   10     NaN
+        """
+        import pandas as pd
+
+        columns = self.to_numpy_edgelist(source, target, begin, end, edge_attr=edge_attr)
+        return pd.DataFrame(columns, columns=list(columns))
+
+    def to_numpy_edgelist(self, source='source', target='target', begin='begin', end='end', edge_attr=True):
+        """Return the edges of the interval graph as a dict of NumPy arrays.
+
+        See `to_pandas_edgelist` for details.
+
+        Returns
+        -------
+        columns : dict
+            Mapping of column names to NumPy arrays, in the order of the parameters,
+            then of the edge attributes. Nodes are of the dtype NumPy infers from them
+            if they are all of the same type, of object dtype otherwise,
+            and attributes of edges without one are NaN.
+
+        Examples
+        --------
+        >>> G = dnx.IntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2})])
+        >>> columns = G.to_numpy_edgelist(edge_attr=False)
+        >>> columns['source'], columns['begin']
+        (array([2, 1]), array([1, 3]))
+
+        Notes
+        -----
+        Nodes, begin and end are gathered as whole columns, from the node ids
+        of the edges. Only edge attributes are read edge by edge.
+        """
+        import numpy as np
+
+        b, e, u, v, labels, eattr = self._edge_columns()
+
+        nodes = np.empty(len(labels), dtype=object)
+        nodes[:] = labels
+        # a typed array only when it keeps the nodes, NumPy would convert mixed types to a common one
+        if len(labels) and len(set(type(n) for n in labels)) == 1:
+            try:
+                typed = np.array(labels)
+            except ValueError:
+                pass
+            else:
+                if typed.ndim == 1 and typed.dtype != object:
+                    nodes = typed
+
+        columns = OrderedDict([(source, nodes[u]), (target, nodes[v]), (begin, b), (end, e)])
+
+        eattr = eattr if eattr is not None else []
+        if edge_attr is True:
+            edge_attr = []
+            for d in eattr:
+                if d:
+                    edge_attr.extend(name for name in d if name not in edge_attr)
+        elif edge_attr is None or edge_attr is False:
+            edge_attr = []
+        elif isinstance(edge_attr, str):
+            edge_attr = [edge_attr]
+
+        nan = float('nan')
+        for name in edge_attr:
+            columns[name] = np.array([d.get(name, nan) if d else nan for d in eattr] if eattr else
+                                     [nan] * len(b))
+
+        return columns
+
+
+def _window_subgraphs(G, windows, options):
+    """Yield the subgraph of each window, the same as `G.to_subgraph(begin, end, **options)`.
+
+    If the windows are sorted by begin and end, the subgraphs are built with the sweep line of `iter_snapshots`.
+    """
+    if all(b1 <= b2 and e1 <= e2 for (b1, e1), (b2, e2) in zip(windows, windows[1:])):
+        return G._sweep_snapshots(windows, **options)
+
+    return (G.to_subgraph(begin, end, **options) for begin, end in windows)
+
+
+# interval graph, function and subgraph options of the map_windows worker process
+_window_worker = None
+
+
+def _init_window_worker(G, func, options):
+    """Initialize a map_windows worker process."""
+    global _window_worker
+    _window_worker = (G, func, options)
+
+
+def _map_window_chunk(windows):
+    """Return the list of the results of the function of a map_windows worker for a chunk of windows."""
+    G, func, options = _window_worker
+    return [func(H) for H in _window_subgraphs(G, windows, options)]
+
+
+# attributes of IntervalGraph which are rebuilt from the edges after unpickling
+_INDEX_ATTRS = frozenset(['tree', '_tree', '_tree_iedges', '_adj', '_succ', '_pred',
+                          '_node_segments', '_node_tree', '_dirty_nodes', '_ends', '_window_cache'])
+
+
+def _read_txt_chunks(path, delimiter, comments, columns, dtypes, chunksize, encoding):
+    """Yield dicts of columns (NumPy arrays or lists) parsed with pandas from chunks of lines of an edge list file."""
+    import pandas as pd
+
+    # types pandas can parse with, other node types and converter functions are applied afterwards
+    read_dtypes = {}
+    converters = {}
+    casts = {}
+    for name, index in columns.items():
+        column_type = dtypes.get(name)
+        if column_type is None:
+            continue
+        if callable(column_type) and column_type not in (int, float, str, bool):
+            read_dtypes[index] = str
+            converters[name] = column_type
+        elif read_dtypes.setdefault(index, column_type) != column_type:
+            # a column read under several names with different types
+            read_dtypes[index] = str
+    for name, index in columns.items():
+        if name not in converters and read_dtypes.get(index) is str and dtypes.get(name) not in (None, str):
+            casts[name] = dtypes[name]
+
+    # runs of whitespace are one separator, same as str.split()
+    sep = r'\s+' if delimiter is None or not delimiter.strip() else delimiter
+
+    try:
+        reader = pd.read_csv(path, sep=sep, comment=comments, header=None, usecols=sorted(columns.values()),
+                             dtype=read_dtypes, chunksize=chunksize, encoding=encoding, skipinitialspace=True,
+                             keep_default_na=False, na_values={index: [''] for index in columns.values()})
+
+        for frame in reader:
+            for name in ('u', 'v'):
+                if frame[columns[name]].isnull().any():
+                    raise NetworkXError("IntervalGraph: an edge of the file has no {0} node.".format(name))
+
+            chunk = {}
+            for name, index in columns.items():
+                if name in converters:
+                    try:
+                        chunk[name] = [converters[name](value) for value in frame[index].tolist()]
+                    except:
+                        raise TypeError("Failed to convert {0} to type {1}".format(name, converters[name]))
+                elif name in casts:
+                    chunk[name] = frame[index].to_numpy().astype(casts[name])
+                else:
+                    chunk[name] = frame[index].to_numpy()
+            yield chunk
+
+    except pd.errors.EmptyDataError:
+        return
+    except ValueError as err:
+        raise TypeError("Failed to convert columns to types {0}: {1}".format(dtypes, err))
+
+
+def _parse_txt_chunks(path, delimiter, comments, columns, dtypes, chunksize, encoding):
+    """Yield dicts of columns parsed in Python from chunks of lines of an edge list file.
+
+    Columns with a NumPy dtype are yielded as NumPy arrays, same as pandas, and the others as lists.
+    """
+    converters = {}
+    arrays = {}
+    for name in columns:
+        column_type = dtypes.get(name)
+        if column_type is None or callable(column_type):
+            converters[name] = column_type
+        else:
+            import numpy as np
+            arrays[name] = np.dtype(column_type)
+            converters[name] = arrays[name].type
+
+    def typed(chunk):
+        for name, dtype in arrays.items():
+            chunk[name] = np.array(chunk[name], dtype=dtype)
+        return chunk
+
+    # runs of whitespace are one separator, same as str.split()
+    if delimiter is not None and not delimiter.strip():
+        delimiter = None
+
+    chunk = {name: [] for name in columns}
+    for line in path:
+        line = line.decode(encoding)
+        p = line.find(comments) if comments else -1
+        if p >= 0:
+            line = line[:p]
+        line = line.strip()
+        if not len(line):
+            continue
+
+        line = [field.strip() for field in line.split(delimiter)]
+        for name, index in columns.items():
+            value = line[index] if index < len(line) else ''
+            if not value and name in ('u', 'v'):
+                raise NetworkXError("IntervalGraph: an edge of the file has no {0} node.".format(name))
+            if converters[name] is not None:
+                try:
+                    value = converters[name](value)
+                except:
+                    raise TypeError("Failed to convert {0} to type {1}".format(name, converters[name]))
+            chunk[name].append(value)
+
+        if len(chunk['u']) == chunksize:
+            yield typed(chunk)
+            chunk = {name: [] for name in columns}
+
+    yield typed(chunk)
+
+
+def _merge_intervals(intervals):
+    """Return the begins and ends of the union of the intervals, as two sorted lists of disjoint intervals."""
+    begins = []
+    ends = []
+    for iv in sorted(intervals, key=itemgetter(0, 1)):
+        if ends and iv.begin <= ends[-1]:
+            if iv.end > ends[-1]:
+                ends[-1] = iv.end
+        else:
+            begins.append(iv.begin)
+            ends.append(iv.end)
+
+    return begins, ends
+
+
+def _tree_overlap(tree, begin, end):
+    """Return a list of the intervals of the IntervalTree overlapping [begin, end).
+
+    Same as `tree[begin:end]`, but it walks down the tree once instead of searching
+    for every boundary inside the interval, which is much faster for long intervals.
+    """
+    result = []
+    if begin >= end:
+        return result
+
+    # intervals in the center of a node contain its center point, the ones on the left
+    # end at or before it and the ones on the right begin after it
+    nodes = [tree.top_node] if tree.top_node is not None else []
+    while nodes:
+        node = nodes.pop()
+        center = node.x_center
+        if center < begin:
+            result.extend(iv for iv in node.s_center if iv.end > begin)
+        elif center >= end:
+            result.extend(iv for iv in node.s_center if iv.begin < end)
+        else:
+            result.extend(node.s_center)
+
+        if node.left_node is not None and center > begin:
+            nodes.append(node.left_node)
+        if node.right_node is not None and center < end:
+            nodes.append(node.right_node)
+
+    return result
+
+
+def _deep_sizeof(objs, seen):
+    """Return the number of bytes used by the objects and everything they reference, not in `seen`.
+
+    Containers, instance dicts and slots are followed, while callables are skipped.
+    The ids of the objects counted are added to `seen`.
+    """
+    import sys
+
+    size = 0
+    stack = list(objs)
+    while stack:
+        obj = stack.pop()
+        if obj is None or id(obj) in seen or callable(obj):
+            continue
+        seen.add(id(obj))
+        size += sys.getsizeof(obj)
+
+        if isinstance(obj, dict):
+            stack.extend(obj.keys())
+            stack.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            stack.extend(obj)
+
+        if hasattr(obj, '__dict__'):
+            stack.extend(vars(obj).values())
+        for cls in type(obj).__mro__:
+            slots = cls.__dict__.get('__slots__', ())
+            for name in ([slots] if isinstance(slots, str) else slots):
+                stack.append(getattr(obj, name, None))
+
+    return size
+
+
+def _build_tree(iedges):
+    """Return an IntervalTree of the list of unique intervals `iedges`, built in one pass.
+
+    Unlike IntervalTree(iedges), the intervals are sorted by (begin, end) without comparing
+    their data, and the boundary table is counted at once instead of one interval at a time.
+    Note that `iedges` is sorted in place.
+    """
+    iedges.sort(key=itemgetter(0, 1))
+
+    tree = IntervalTree()
+    tree.all_intervals = set(iedges)
+    tree.top_node = Node.from_sorted_intervals(iedges)
+    tree.boundary_table = SortedDict(Counter(chain((iv.begin for iv in iedges), (iv.end for iv in iedges))))
+
+    return tree
+
+
+class _WindowCache(object):
+    """LRU cache of window query results of an interval graph, limited to `max_size` bytes.
+
+    Results are only valid for the `version` of the interval graph they were computed for.
+    """
+
+    __slots__ = ('max_size', 'size', 'hits', 'misses', 'version', 'entries')
+
+    def __init__(self, max_size):
+        self.max_size = max_size
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.version = None
+        self.entries = OrderedDict()
+
+    def clear(self, version):
+        """Drop all the results, which are computed for `version` from now on."""
+        self.entries.clear()
+        self.size = 0
+        self.version = version
+
+    def get(self, key):
+        """Return the result cached for key, or None."""
+        entry = self.entries.pop(key, None)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        # re-insert as the most recently used, OrderedDict.move_to_end is not in Python 2
+        self.hits += 1
+        self.entries[key] = entry
+        return entry[0]
+
+    def put(self, key, result):
+        """Cache the result for key, dropping the least recently used results if needed."""
+        import sys
+
+        nbytes = sys.getsizeof(result) + sys.getsizeof(key)
+        if nbytes > self.max_size:
+            return
+
+        self.entries[key] = (result, nbytes)
+        self.size += nbytes
+        self.shrink()
+
+    def shrink(self):
+        """Drop the least recently used results until the cache fits in max_size."""
+        while self.size > self.max_size:
+            key, (result, nbytes) = self.entries.popitem(last=False)
+            self.size -= nbytes
+
+
+class _IntervalEdgeDict(dict):
+    """Dict of the interval edges between two nodes, mapped to their attribute dicts.
+
+    Keeps a begin-sorted index of its intervals, along with the running maximum of
+    their ends, so that interval queries are binary searches. The index is
+    rebuilt lazily on the first query after a change.
+
+    Edges without attributes are mapped to None, and their attribute dict is
+    created on first access with `d[iedge]` or `d.get(iedge)`. Use `peek` to read
+    the attributes without creating a dict. The intervals share the data tuple
+    of each direction, returned by `pair`.
+    """
+
+    __slots__ = ('_iedges', '_begins', '_max_ends', '_pair', '_rpair')
+
+    def __init__(self, pair=None):
+        self._iedges = None
+        self._pair = pair
+        self._rpair = None
+
+    def __getitem__(self, iedge):
+        attr = super(_IntervalEdgeDict, self).__getitem__(iedge)
+        if attr is None:
+            # set without resetting the index, since the intervals did not change
+            attr = {}
+            super(_IntervalEdgeDict, self).__setitem__(iedge, attr)
+        return attr
+
+    def get(self, iedge, default=None):
+        return self[iedge] if iedge in self else default
+
+    def peek(self, iedge):
+        """Return the attribute dict of the interval, or None if it has no attributes and no dict yet."""
+        return super(_IntervalEdgeDict, self).__getitem__(iedge)
+
+    def pair(self, u, v):
+        """Return the (u, v) data tuple shared by the intervals from u to v."""
+        pair = self._pair
+        if pair is None:
+            pair = self._pair = (u, v)
+        if pair[0] == u and pair[1] == v:
+            return pair
+
+        if self._rpair is None:
+            self._rpair = (pair[1], pair[0])
+        return self._rpair
+
+    def __setitem__(self, iedge, attr):
+        self._iedges = None
+        super(_IntervalEdgeDict, self).__setitem__(iedge, attr)
+
+    def __delitem__(self, iedge):
+        self._iedges = None
+        super(_IntervalEdgeDict, self).__delitem__(iedge)
+
+    def pop(self, *args):
+        self._iedges = None
+        return super(_IntervalEdgeDict, self).pop(*args)
+
+    def popitem(self):
+        self._iedges = None
+        return super(_IntervalEdgeDict, self).popitem()
+
+    def setdefault(self, *args):
+        self._iedges = None
+        return super(_IntervalEdgeDict, self).setdefault(*args)
+
+    def update(self, *args, **kwargs):
+        self._iedges = None
+        super(_IntervalEdgeDict, self).update(*args, **kwargs)
+
+    def clear(self):
+        self._iedges = None
+        super(_IntervalEdgeDict, self).clear()
+
+    def __index(self):
+        if self._iedges is None and len(self) == 1:
+            for iv in self:
+                self._iedges, self._begins, self._max_ends = [iv], [iv.begin], [iv.end]
+        elif self._iedges is None:
+            self._iedges = sorted(self, key=lambda iv: iv.begin)
+            self._begins = [iv.begin for iv in self._iedges]
+            self._max_ends = []
+            max_end = None
+            for iv in self._iedges:
+                if max_end is None or iv.end > max_end:
+                    max_end = iv.end
+                self._max_ends.append(max_end)
+
+    def overlaps(self, begin, end):
+        """Return True if any of the intervals overlaps [begin, end)."""
+        self.__index()
+        hi = bisect_left(self._begins, end)
+        return hi > 0 and self._max_ends[hi - 1] > begin
+
+    def first_overlap(self, begin, end):
+        """Return the interval with the smallest begin overlapping [begin, end), or None."""
+        self.__index()
+        hi = bisect_left(self._begins, end)
+        lo = bisect_right(self._max_ends, begin, 0, hi)
+        return self._iedges[lo] if lo < hi else None
+
+    def latest_end(self, end):
+        """Return the largest end of the intervals beginning before end, or None."""
+        self.__index()
+        hi = bisect_left(self._begins, end)
+        return self._max_ends[hi - 1] if hi > 0 else None
+
+    def overlap(self, begin, end, inclusive_begin=False):
+        """Return a list of the intervals overlapping [begin, end).
+
+        If `inclusive_begin` is True, intervals which end exactly at begin are included as well.
+        """
+        self.__index()
+        hi = bisect_left(self._begins, end)
+        if inclusive_begin:
+            lo = bisect_left(self._max_ends, begin, 0, hi)
+            return [iv for iv in self._iedges[lo:hi] if iv.end >= begin]
+
+        lo = bisect_right(self._max_ends, begin, 0, hi)
+        return [iv for iv in self._iedges[lo:hi] if iv.end > begin]
@@ -0,0 +1,208 @@
+"""
+View classes of the edges of interval graphs.
+
+An edge view reports the edges of an interval graph, optionally restricted to
+edges of given nodes and overlapping a given interval, without building a list
+of them. The edges are looked up again on every iteration, so changes to
+the interval graph show in its views.
+We provide an attribute V._graph which points to the interval graph object.
+"""
+from collections import Mapping, Set
+
+from networkx.exception import NetworkXError
+
+__all__ = ['IntervalEdgeView', 'IntervalEdgeDataView']
+
+
+class _ReadOnlyDict(dict):
+    """A dict which cannot be modified, reported by views for the edges without attributes."""
+
+    __slots__ = ()
+
+    def _read_only(self, *args, **kwargs):
+        raise NetworkXError("IntervalGraph: the edge has no attributes, set them with add_edge or G.edges[iedge].")
+
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = _read_only
+
+
+# attribute dict shared by all the edges without attributes in read-only views
+_EMPTY_ATTR = _ReadOnlyDict()
+
+
+class IntervalEdgeDataView(object):
+    """A view of the (Interval, data) 2-tuples of the edges of an interval graph.
+
+    Iterating reports (Interval, attribute dict) 2-tuples if data is True,
+    or (Interval, attribute value) 2-tuples if data is the name of an attribute.
+
+    Examples
+    --------
+    >>> from intervaltree import Interval
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edge(1, 2, 3, 10, weight=10)
+    >>> G.add_edge(2, 4, 1, 11)
+    >>> V = G.edges(data='weight', default=1)
+    >>> (Interval(3, 10, (1, 2)), 10) in V
+    True
+    >>> sum(w for iv, w in V)
+    11
+    """
+
+    __slots__ = ('_graph', '_u', '_v', '_begin', '_end', '_data', '_default')
+
+    def __getstate__(self):
+        return {'_graph': self._graph, '_u': self._u, '_v': self._v, '_begin': self._begin,
+                '_end': self._end, '_data': self._data, '_default': self._default}
+
+    def __setstate__(self, state):
+        for name in self.__slots__:
+            setattr(self, name, state[name])
+
+    def __init__(self, G, u=None, v=None, begin=None, end=None, data=True, default=None):
+        self._graph = G
+        self._u = u
+        self._v = v
+        self._begin = begin
+        self._end = end
+        self._data = data
+        self._default = default
+
+    def __len__(self):
+        return self._graph._count_edges(self._u, self._v, self._begin, self._end)
+
+    def __iter__(self):
+        return self._graph._iter_edges(self._u, self._v, self._begin, self._end, self._data, self._default)
+
+    def __contains__(self, e):
+        try:
+            iv, d = e
+        except (TypeError, ValueError):
+            return False
+
+        view = IntervalEdgeView(self._graph, self._u, self._v, self._begin, self._end)
+        if iv not in view:
+            return False
+
+        return any(iv2.begin == iv.begin and iv2.end == iv.end and d2 == d
+                   for iv2, d2 in self._graph._iter_edges(iv.data[0], iv.data[1], iv.begin, iv.end,
+                                                          self._data, self._default))
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
+
+
+class IntervalEdgeView(Set, Mapping):
+    """A set-like view of the Interval objects of the edges of an interval graph.
+
+    The view is also a Mapping of the Interval objects to their attribute dicts.
+
+    Examples
+    --------
+    >>> from intervaltree import Interval
+    >>> G = dnx.IntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19)])
+    >>> V = G.edges(begin=10)
+    >>> len(V)
+    2
+    >>> Interval(1, 11, (2, 4)) in V
+    True
+    >>> V[Interval(1, 11, (2, 4))]
+    {}
+    >>> for iv, d in V.data('weight', default=1):
+    ...     print(iv, d)
+    Interval(1, 11, (2, 4)) 1
+    Interval(12, 19, (6, 4)) 1
+    """
+
+    __slots__ = ('_graph', '_u', '_v', '_begin', '_end')
+
+    def __getstate__(self):
+        return {'_graph': self._graph, '_u': self._u, '_v': self._v, '_begin': self._begin, '_end': self._end}
+
+    def __setstate__(self, state):
+        for name in self.__slots__:
+            setattr(self, name, state[name])
+
+    @classmethod
+    def _from_iterable(cls, it):
+        return set(it)
+
+    def __init__(self, G, u=None, v=None, begin=None, end=None):
+        self._graph = G
+        self._u = u
+        self._v = v
+        self._begin = begin
+        self._end = end
+
+    def __len__(self):
+        return self._graph._count_edges(self._u, self._v, self._begin, self._end)
+
+    def __iter__(self):
+        return self._graph._iter_edges(self._u, self._v, self._begin, self._end)
+
+    def __contains__(self, iv):
+        try:
+            a, b = iv.data
+            begin, end = iv.begin, iv.end
+        except (AttributeError, TypeError, ValueError):
+            return False
+
+        # same filters as the edge queries of the interval graph, which
+        # include the edges ending at begin when filtering by node
+        directed = self._graph.is_directed()
+        if self._u is not None and self._v is not None:
+            if (a, b) != (self._u, self._v) and (directed or (a, b) != (self._v, self._u)):
+                return False
+        elif self._u is not None:
+            if self._u != a and (directed or self._u != b):
+                return False
+        elif self._v is not None:
+            if self._v != b and (directed or self._v != a):
+                return False
+
+        if self._begin is not None:
+            by_node = self._u is not None or self._v is not None
+            if end < self._begin or (end == self._begin and not by_node):
+                return False
+        if self._end is not None and begin >= self._end:
+            return False
+
+        try:
+            return a in self._graph and self._graph.has_edge(a, b, begin, end, overlapping=False)
+        except TypeError:
+            return False
+
+    def __getitem__(self, iv):
+        if iv in self:
+            for iv2, d in self._graph._iter_edges(iv.data[0], iv.data[1], iv.begin, iv.end, True):
+                if iv2.begin == iv.begin and iv2.end == iv.end:
+                    return d if d is not _EMPTY_ATTR else self._graph._edge_attr_dict(iv2)
+        raise KeyError("Edge {} not found".format(iv))
+
+    def data(self, data=True, default=None):
+        """Return a view of the edges of this view along with their data.
+
+        Parameters
+        ----------
+        data : bool or string, optional (default= True)
+            If True, report (Interval, attribute dict) 2-tuples.
+            If a string (name of an attribute), report (Interval, attribute value) 2-tuples.
+        default : value, optional (default= None)
+            Value used for edges that don't have the requested attribute.
+
+        Returns
+        -------
+        IntervalEdgeDataView
+        """
+        if data is False:
+            return self
+        return IntervalEdgeDataView(self._graph, self._u, self._v, self._begin, self._end, data, default)
+
+    def __str__(self):
+        return str(list(self))
+
+    def __repr__(self):
+        return '{0}({1!r})'.format(self.__class__.__name__, list(self))
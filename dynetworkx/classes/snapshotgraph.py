@@ -1,4 +1,5 @@
 from networkx.classes.graph import Graph
+from networkx.exception import NetworkXError
 
 
 class SnapshotGraph(object):
@@ -154,7 +155,7 @@ class SnapshotGraph(object):
         >>> G.add_snapshot([(1, 4), (1, 3)])
 
         """
-        if not graph:
+        if graph is None:
             g = Graph()
             g.add_edges_from(ebunch)
         else:
@@ -761,3 +762,374 @@ class SnapshotGraph(object):
 
         for g in graph_list:
                 g.add_edges_from(ebunch, **attrs)
+
+    def activity_series(self, bins=None):
+        """Return the number of nodes and edges in each window of snapshots.
+
+        Parameters
+        ----------
+        bins : sequence of integers, optional (default= None)
+            Strictly increasing window boundaries, as snapshot indexes. Window i holds
+            the snapshots from index bins[i] up to, but not including, bins[i+1].
+            If None, each snapshot is a window of its own.
+
+        Returns
+        -------
+        nnodes, nedges : NumPy arrays
+            The number of distinct nodes and edges in the snapshots of each window.
+
+        Examples
+        --------
+        >>> G = dnx.SnapshotGraph()
+        >>> G.add_snapshot([(1, 2), (1, 3)])
+        >>> G.add_snapshot([(1, 4), (1, 3)])
+        >>> G.activity_series()
+        (array([3, 3]), array([2, 2]))
+        >>> G.activity_series([0, 2])
+        (array([4]), array([3]))
+        """
+        bins = self.__series_bins(bins)
+        k = len(bins) - 1
+        node_ids, edge_ids, node, nsnapshot, edge, esnapshot = self.__presence()[:6]
+
+        nnodes = _count_ranges(*_window_ranges(node, nsnapshot, nsnapshot + 1, bins)[1:], k=k)
+        nedges = _count_ranges(*_window_ranges(edge, esnapshot, esnapshot + 1, bins)[1:], k=k)
+
+        return nnodes, nedges
+
+    def degree_series(self, nodes, bins=None):
+        """Return the degree of each node of `nodes` in each window of snapshots.
+
+        Parameters
+        ----------
+        nodes : container of nodes
+            Nodes to return the degrees of. If None, all the nodes of all the snapshots.
+        bins : sequence of integers, optional (default= None)
+            Strictly increasing window boundaries, as snapshot indexes. Window i holds
+            the snapshots from index bins[i] up to, but not including, bins[i+1].
+            If None, each snapshot is a window of its own.
+
+        Returns
+        -------
+        degrees : NumPy array
+            Array of shape (number of nodes, number of windows), where degrees[j, i]
+            is the degree of the j-th node in the union of the snapshots of window i,
+            or 0 if it is in none of them.
+
+        Raises
+        ------
+        NetworkXError
+            If a node is not in any snapshot.
+
+        Examples
+        --------
+        >>> G = dnx.SnapshotGraph()
+        >>> G.add_snapshot([(1, 2), (1, 3)])
+        >>> G.add_snapshot([(1, 4), (1, 3)])
+        >>> G.degree_series([1, 2])
+        array([[2, 2],
+               [1, 0]])
+        >>> G.degree_series([1, 2], [0, 2])
+        array([[3],
+               [1]])
+        """
+        import numpy as np
+
+        bins = self.__series_bins(bins)
+        k = len(bins) - 1
+        node_ids, edge_ids, node, nsnapshot, edge, esnapshot, u, v = self.__presence()
+
+        if nodes is None:
+            nodes = list(node_ids)
+        try:
+            nodes = np.array([node_ids[n] for n in nodes], dtype=np.int64)
+        except KeyError as err:
+            raise NetworkXError("The node {0} is not in any snapshot.".format(err.args[0]))
+
+        # the row of the result of each node id, or -1 for the nodes not asked for
+        row = np.full(len(node_ids), -1, dtype=np.int64)
+        row[nodes] = np.arange(len(nodes))
+
+        # each edge counts once from each of its ends, which counts a self-loop twice
+        end_node = np.concatenate((u[edge], v[edge]))
+        group = np.concatenate((2 * edge, 2 * edge + 1))
+        snapshot = np.concatenate((esnapshot, esnapshot))
+        keep = row[end_node] >= 0
+
+        group, first, last = _window_ranges(group[keep], snapshot[keep], snapshot[keep] + 1, bins)
+        end_node = np.where(group % 2, v[group // 2], u[group // 2])
+        degrees = _count_ranges(first, last, k, rows=row[end_node], nrows=len(nodes))
+
+        return degrees[row[nodes]]
+
+    def to_sparse_tensor(self, supra=False, coupling=None):
+        """Return the adjacency matrices of all the snapshots as one sparse matrix, over a global node index.
+
+        Parameters
+        ----------
+        supra : bool, optional (default= False)
+            If False, the adjacency matrices of the T snapshots, of the N nodes of all
+            the snapshots, are stacked into a matrix of shape (T * N, N), where snapshot t
+            is rows t * N up to (t + 1) * N. If True, they are the diagonal blocks of a
+            supra-adjacency matrix of shape (T * N, T * N).
+        coupling : number, optional (default= None)
+            If given with supra=True, weight of the edges between each node and
+            itself in the previous and next snapshots.
+
+        Returns
+        -------
+        nodes : list
+            Global node index, the node of row and column i of each adjacency matrix is nodes[i].
+        A : SciPy COO matrix
+            Entries are the number of edges between two nodes in a snapshot, 1 for simple graphs.
+            For undirected snapshots, each edge is in both directions.
+
+        Examples
+        --------
+        >>> G = dnx.SnapshotGraph()
+        >>> G.add_snapshot([(1, 2), (1, 3)])
+        >>> G.add_snapshot([(1, 4), (1, 3)])
+        >>> nodes, A = G.to_sparse_tensor()
+        >>> nodes
+        [1, 2, 3, 4]
+        >>> A.shape
+        (8, 4)
+        >>> A.toarray()[4:]
+        array([[0, 0, 1, 1],
+               [0, 0, 0, 0],
+               [1, 0, 0, 0],
+               [1, 0, 0, 0]])
+        """
+        node_ids, edge_ids, node, nsnapshot, edge, esnapshot, u, v = self.__presence()
+        directed = bool(self.snapshots) and self.snapshots[0].is_directed()
+
+        return list(node_ids), _sparse_tensor(esnapshot, u[edge], v[edge], len(self.snapshots), len(node_ids),
+                                              directed=directed, supra=supra, coupling=coupling)
+
+    def __series_bins(self, bins):
+        """Return the window boundaries of the series methods, one window per snapshot by default."""
+        import numpy as np
+
+        if bins is None:
+            bins = np.arange(len(self.snapshots) + 1)
+        return _series_bins(bins)
+
+    def __presence(self):
+        """Return the presence of the nodes and edges in the snapshots, as arrays of integer ids.
+
+        Returns
+        -------
+        node_ids, edge_ids : dict
+            Integer ids of the nodes and of the edges, keyed by node and by
+            edge, an unordered pair of nodes for undirected snapshots, along
+            with its key for multigraph snapshots.
+        node, nsnapshot : NumPy arrays
+            Node id and snapshot index of each node of each snapshot.
+        edge, esnapshot : NumPy arrays
+            Edge id and snapshot index of each edge of each snapshot.
+        u, v : NumPy arrays
+            Node ids of the ends of each edge id.
+        """
+        import numpy as np
+
+        node_ids = {}
+        edge_ids = {}
+        node = []
+        nsnapshot = []
+        edge = []
+        esnapshot = []
+        ends = []
+
+        for s, g in enumerate(self.snapshots):
+            for n in g:
+                node.append(node_ids.setdefault(n, len(node_ids)))
+            nsnapshot.extend([s] * len(g))
+
+            edges = g.edges(keys=True) if g.is_multigraph() else g.edges()
+            for e in edges:
+                key = e if g.is_directed() else (frozenset(e[:2]),) + tuple(e[2:])
+                i = edge_ids.get(key)
+                if i is None:
+                    i = edge_ids[key] = len(edge_ids)
+                    ends.append((node_ids[e[0]], node_ids[e[1]]))
+                edge.append(i)
+            esnapshot.extend([s] * (len(edge) - len(esnapshot)))
+
+        ends = np.array(ends, dtype=np.int64).reshape(-1, 2)
+        return (node_ids, edge_ids,
+                np.array(node, dtype=np.int64), np.array(nsnapshot, dtype=np.int64),
+                np.array(edge, dtype=np.int64), np.array(esnapshot, dtype=np.int64),
+                ends[:, 0], ends[:, 1])
+
+
+def _series_bins(bins):
+    """Return the window boundaries `bins` as a NumPy array, checking they are strictly increasing."""
+    import numpy as np
+
+    bins = np.asarray(bins)
+    if bins.ndim != 1 or len(bins) < 2:
+        raise NetworkXError("bins must be a 1-dimensional sequence of at least 2 window boundaries.")
+    if not np.all(bins[1:] > bins[:-1]):
+        raise NetworkXError("bins must be strictly increasing.")
+
+    return bins
+
+
+def _series_times(times):
+    """Return the time points `times` as a NumPy array, checking they are sorted."""
+    import numpy as np
+
+    times = np.asarray(times)
+    if times.ndim != 1:
+        raise NetworkXError("times must be a 1-dimensional sequence of time points.")
+    if not np.all(times[1:] >= times[:-1]):
+        raise NetworkXError("times must be sorted.")
+
+    return times
+
+
+def _window_ranges(group, begin, end, bins):
+    """Return the windows [bins[i], bins[i+1]) overlapped by groups of intervals.
+
+    Each interval [begin[j], end[j]) belongs to the integer group[j]. The windows
+    overlapped by each group are returned as ranges of window indexes, which
+    do not overlap within a group, so that a group is counted once per window.
+
+    Returns
+    -------
+    group, first, last : NumPy arrays
+        The group of each range and its first and last window index, inclusive.
+    """
+    import numpy as np
+
+    k = len(bins) - 1
+    order = np.lexsort((begin, group))
+    group = group[order]
+
+    # window i overlaps [b, e) if bins[i] < e and bins[i+1] > b
+    first = np.maximum(np.searchsorted(bins, begin[order], side='right') - 1, 0)
+    last = np.minimum(np.searchsorted(bins, end[order], side='left') - 1, k - 1)
+
+    return _disjoint_ranges(group, first, last, k)
+
+
+def _point_ranges(group, begin, end, times):
+    """Return the sorted time points `times` inside groups of intervals.
+
+    Same as `_window_ranges`, with the points instead of windows, where point i
+    is inside [b, e) if b <= times[i] < e.
+    """
+    import numpy as np
+
+    order = np.lexsort((begin, group))
+    group = group[order]
+
+    first = np.searchsorted(times, begin[order], side='left')
+    last = np.searchsorted(times, end[order], side='left') - 1
+
+    return _disjoint_ranges(group, first, last, len(times))
+
+
+def _disjoint_ranges(group, first, last, k):
+    """Return the ranges [first, last] of indexes of each group, sorted by group and first,
+    cut so that they do not overlap within a group, and without the empty ones."""
+    import numpy as np
+
+    if not len(group):
+        return group, first, last
+
+    # skip the windows already counted by the earlier intervals of the same group,
+    # from a running maximum of last kept within each group by an offset per group
+    starts = np.empty(len(group), dtype=bool)
+    starts[0] = True
+    np.not_equal(group[1:], group[:-1], out=starts[1:])
+    offset = np.cumsum(starts) * (k + 2)
+    counted = np.maximum.accumulate(last + offset) - offset
+    previous = np.empty_like(counted)
+    previous[0] = -1
+    previous[1:] = counted[:-1]
+    previous[starts] = -1
+    first = np.maximum(first, previous + 1)
+
+    keep = first <= last
+    return group[keep], first[keep], last[keep]
+
+
+def _csr_ranges(group, first, last, k):
+    """Return the groups of the ranges [first, last] over each of k indexes, in CSR format.
+
+    Returns
+    -------
+    offsets, indices : NumPy arrays
+        The groups over index i are indices[offsets[i]:offsets[i+1]], sorted
+        in the order of the ranges.
+    """
+    import numpy as np
+
+    offsets = np.zeros(k + 1, dtype=np.int64)
+    np.cumsum(_count_ranges(first, last, k), out=offsets[1:])
+
+    group, index = _expand_ranges(group, first, last)
+    order = np.argsort(index, kind='stable')
+    return offsets, group[order]
+
+
+def _expand_ranges(group, first, last):
+    """Return the group and the index of every element of the ranges [first, last], range by range."""
+    import numpy as np
+
+    # index of each element, as a running count from the start of its range
+    lengths = last - first + 1
+    starts = np.cumsum(lengths) - lengths
+    index = np.repeat(first - starts, lengths) + np.arange(lengths.sum())
+
+    return np.repeat(group, lengths), index
+
+
+def _sparse_tensor(t, i, j, k, n, directed=False, supra=False, coupling=None):
+    """Return the adjacency matrices of k layers of n nodes, from the entries (t, i, j) of value 1.
+
+    Duplicate entries are summed. Unless directed, every entry (t, i, j) with i != j is mirrored
+    as (t, j, i). The layers are stacked into a SciPy COO matrix of shape (k * n, n),
+    or placed along the diagonal of a supra-adjacency matrix of shape (k * n, k * n) if supra is True,
+    where `coupling` links each node to itself in the next and previous layers.
+    """
+    import numpy as np
+    from scipy.sparse import coo_matrix
+
+    if not directed:
+        loops = i == j
+        t, i, j = np.concatenate((t, t[~loops])), np.concatenate((i, j[~loops])), np.concatenate((j, i[~loops]))
+
+    rows = t * n + i
+    if not supra:
+        A = coo_matrix((np.ones(len(rows), dtype=np.int64), (rows, j)), shape=(k * n, n))
+        A.sum_duplicates()
+        return A
+
+    cols = t * n + j
+    data = np.ones(len(rows), dtype=np.int64)
+    if coupling is not None and k > 1:
+        layer = np.arange((k - 1) * n)
+        rows = np.concatenate((rows, layer, layer + n))
+        cols = np.concatenate((cols, layer + n, layer))
+        data = np.concatenate((data, np.full(2 * len(layer), coupling)))
+
+    A = coo_matrix((data, (rows, cols)), shape=(k * n, k * n))
+    A.sum_duplicates()
+    return A
+
+
+def _count_ranges(first, last, k, rows=None, nrows=1):
+    """Return the number of ranges [first, last] over each of k windows,
+    as an array of shape (nrows, k) if the row of each range is given."""
+    import numpy as np
+
+    if rows is None:
+        counts = np.bincount(first, minlength=k + 1) - np.bincount(last + 1, minlength=k + 1)
+        return np.cumsum(counts[:k])
+
+    size = nrows * (k + 1)
+    counts = np.bincount(rows * (k + 1) + first, minlength=size) - \
+        np.bincount(rows * (k + 1) + last + 1, minlength=size)
+    return np.cumsum(counts.reshape(nrows, k + 1), axis=1)[:, :k]
@@ -0,0 +1,870 @@
+import pickle
+import sqlite3
+from networkx.classes.graph import Graph
+from networkx.exception import NetworkXError
+from intervaltree import Interval, IntervalTree
+from networkx.classes.multigraph import MultiGraph
+from networkx.classes.reportviews import NodeDataView
+from dynetworkx.classes.intervalgraph import IntervalGraph, _IntervalEdgeDict, _deep_sizeof
+
+
+class SQLiteIntervalGraph(IntervalGraph):
+    """Undirected interval graph stored in a SQLite database file.
+
+    SQLiteIntervalGraph has the same public API as IntervalGraph, but the
+    edges are kept on disk, in a SQLite table indexed by an R*Tree on their
+    (begin, end) intervals, and by B-trees on their nodes and on begin and end.
+    Window queries only read the edges overlapping the window from the file,
+    which lets edge histories much larger than memory be queried and paged
+    through, window by window, with `iter_snapshots` or `to_subgraph`.
+
+    Nodes and their attributes are kept in memory, as well as in the file.
+    Both begin and end of every edge must be numbers. Edges are reported in order of their begin.
+
+    Parameters
+    ----------
+    path : string, optional (default= ':memory:')
+        Path of the SQLite database file, created if it does not exist.
+        If it holds an interval graph already, its nodes and edges are loaded
+        on demand. If ':memory:', the database is in memory, and is lost once closed.
+    attr : keyword arguments, optional (default= no attributes)
+        Attributes to add to graph as key=value pairs.
+
+    Examples
+    --------
+    >>> G = dnx.SQLiteIntervalGraph()
+    >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+    >>> G.edges(begin=10)
+    IntervalEdgeView([Interval(1, 11, (2, 4)), Interval(8, 15, (2, 4)), Interval(12, 19, (6, 4))])
+    >>> G.number_of_nodes(begin=5, end=8)
+    3
+
+    Notes
+    -----
+    Each call to a method adding or removing edges runs in a single transaction,
+    thus adding edges in large batches (e.g. with `add_edges_from`, which streams
+    its edges to the database) is much faster than adding them one by one.
+    Queries are run as prepared statements, which are reused between calls.
+
+    Edge attribute dicts returned by the graph are copies read from the file,
+    update them with `add_edge` instead. Graph attributes are not stored in the file.
+
+    Methods computing over all the edges at once (e.g. `degree_series`,
+    `activity_series` or `save`) read all of them into memory.
+
+    SQLite 3.9 or later, built with the R*Tree module, is required. Before SQLite 3.24,
+    which added upserts, added edges are merged with existing ones one by one.
+    """
+
+    def __init__(self, path=':memory:', **attr):
+        """Initialize a SQLite interval graph with a database file, name, or graph attributes.
+
+        Parameters
+        ----------
+        path : string, optional (default= ':memory:')
+            Path of the SQLite database file, created if it does not exist.
+        attr : keyword arguments, optional (default= no attributes)
+            Attributes to add to graph as key=value pairs.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G = dnx.SQLiteIntervalGraph(name='my graph')
+        >>> G.graph
+        {'name': 'my graph'}
+        """
+        self.graph = {}  # dictionary for graph attributes
+        self._node = {}
+
+        # node label table, by integer id
+        self._labels = {}
+        self._ids = {}
+        self._next_id = 0
+
+        self._path = path
+        self._retention = None
+
+        self.__connect()
+        for i, label, nattr in self._db.execute(_SELECT_NODES):
+            n = _loads(label)
+            self._labels[i] = n
+            self._ids[n] = i
+            self._node[n] = _loads(nattr) if nattr is not None else {}
+            self._next_id = max(self._next_id, i + 1)
+
+        self.graph.update(attr)
+
+    def __connect(self):
+        """Open the database, creating the tables and indexes if needed."""
+        if sqlite3.sqlite_version_info < (3, 9, 0):
+            raise NetworkXError("SQLiteIntervalGraph: SQLite 3.9 or later is required, found {0}."
+                                .format(sqlite3.sqlite_version))
+
+        self._db = sqlite3.connect(self._path)
+        self._db.create_function('merge_attr', 2, _merge_attr)
+        if self._path != ':memory:':
+            self._db.execute('PRAGMA journal_mode=WAL')
+            self._db.execute('PRAGMA synchronous=NORMAL')
+
+        with self._db:
+            for statement in _SCHEMA:
+                self._db.execute(statement)
+
+    def __getstate__(self):
+        """Return the state of the SQLite interval graph for pickling.
+
+        The database connection is not pickled, but reopened from the file when unpickled.
+        The edges of an in-memory database are pickled as rows.
+        """
+        state = self.__dict__.copy()
+        del state['_db']
+        if self._path == ':memory:':
+            state['_edges'] = self._db.execute(_SELECT_EDGE_ROWS).fetchall()
+        return state
+
+    def __setstate__(self, state):
+        """Restore the SQLite interval graph from the state returned by `__getstate__`."""
+        edges = state.pop('_edges', None)
+        self.__dict__.update(state)
+        self.__connect()
+
+        if edges is not None:
+            with self._db:
+                self.__write_nodes(self._node)
+                self.__insert_edges(edges)
+
+    def close(self):
+        """Close the database. The interval graph cannot be used anymore.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edge(1, 2, 3, 10)
+        >>> G.close()
+        """
+        self._db.close()
+
+    @property
+    def path(self):
+        """Path of the SQLite database file, or ':memory:'."""
+        return self._path
+
+    @property
+    def tree(self):
+        """An IntervalTree of all the edges, built on every access.
+
+        Only provided for compatibility with IntervalGraph, use the
+        methods of the graph to query edges.
+        """
+        return IntervalTree(self.edges())
+
+    @property
+    def window_cache_size(self):
+        """Always None, window queries are not cached.
+
+        The window queries of SQLiteIntervalGraph are indexed queries of the database, which are not cached.
+        Setting window_cache_size to anything but None raises NetworkXError.
+        """
+        return None
+
+    @window_cache_size.setter
+    def window_cache_size(self, size):
+        if size is not None:
+            raise NetworkXError("SQLiteIntervalGraph: window queries are not cached, window_cache_size can only be None.")
+
+    def window_cache_info(self):
+        """Return the statistics of the window query cache, which is always empty.
+
+        See IntervalGraph.window_cache_info for details.
+        """
+        return {'hits': 0, 'misses': 0, 'entries': 0, 'size': 0, 'max_size': None}
+
+    def interval(self):
+        """Return a 2-tuple as (begin, end) interval of the entire
+         interval graph.
+
+         Note that end is non-inclusive.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 10), (3, 7, 9, 16)])
+        >>> G.interval()
+        (0, 16)
+        """
+        begin = self._db.execute(_SELECT_BEGIN).fetchone()[0]
+        if begin is None:
+            return 0, 0
+
+        return begin, self._db.execute(_SELECT_END).fetchone()[0]
+
+    def add_node(self, node_for_adding, **attr):
+        """Add a single node `node_for_adding`  and update node attributes.
+
+        See IntervalGraph.add_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_node(1)
+        >>> G.add_node('Hello', size=10)
+        >>> G.number_of_nodes()
+        2
+        """
+        if node_for_adding not in self._node:
+            self._node[node_for_adding] = attr
+        else:  # update attr even if node already exists
+            self._node[node_for_adding].update(attr)
+
+        with self._db:
+            self.__write_nodes([node_for_adding])
+
+    def add_nodes_from(self, nodes_for_adding, **attr):
+        """Add multiple nodes.
+
+        See IntervalGraph.add_nodes_from for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_nodes_from('Hello')
+        >>> G.add_nodes_from([(1, dict(size=11)), (2, {'color':'blue'})])
+        >>> G.has_node('e')
+        True
+        """
+        added = []
+        for n in nodes_for_adding:
+            try:
+                if n not in self._node:
+                    self._node[n] = attr.copy()
+                else:
+                    self._node[n].update(attr)
+            except TypeError:
+                nn, ndict = n
+                if nn not in self._node:
+                    self._node[nn] = attr.copy()
+                    self._node[nn].update(ndict)
+                else:
+                    self._node[nn].update(attr)
+                    self._node[nn].update(ndict)
+                n = nn
+            added.append(n)
+
+        with self._db:
+            self.__write_nodes(added)
+
+    def number_of_nodes(self, begin=None, end=None):
+        """Return the number of nodes in the interval graph between the given interval.
+
+        See IntervalGraph.number_of_nodes for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (3, 4, 8, 11)])
+        >>> G.number_of_nodes()
+        4
+        >>> G.number_of_nodes(begin=5, end=8) # end is non-inclusive
+        0
+        >>> G.number_of_nodes(begin=5, end=9)
+        2
+        """
+        if begin is None and end is None:
+            return len(self._node)
+
+        return len(self.__window_node_ids(begin, end))
+
+    def has_node(self, n, begin=None, end=None):
+        """Return True if the interval graph contains the node n, during the given interval.
+
+        See IntervalGraph.has_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edge(3, 4, 2, 5)
+        >>> G.has_node(3, begin=2)
+        True
+        >>> G.has_node(3, end=2) # end is non-inclusive
+        False
+        """
+        try:
+            exists_node = n in self._node
+        except TypeError:
+            exists_node = False
+
+        if (begin is None and end is None) or not exists_node:
+            return exists_node
+
+        i = self._ids[n]
+        begin, end = self.__fill_interval(begin, end)
+        return self._db.execute(_SELECT_NODE_OVERLAP, (i, i, end, begin)).fetchone() is not None
+
+    def nodes(self, begin=None, end=None, data=False, default=None):
+        """A NodeDataView of the SQLiteIntervalGraph nodes.
+
+        See IntervalGraph.nodes for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> list(G.nodes(begin=4, end=12)) # non-inclusive end
+        [1, 2, 4]
+        """
+        if begin is None and end is None:
+            return NodeDataView(self._node, data=data, default=default)
+
+        labels = [self._labels[i] for i in sorted(self.__window_node_ids(begin, end))]
+        node_dict = {n: self._node[n] for n in labels}
+
+        return NodeDataView(node_dict, data=data, default=default)
+
+    def remove_node(self, n, begin=None, end=None):
+        """Remove the presence of a node n within the given interval.
+
+        See IntervalGraph.remove_node for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> G.remove_node(2, begin=4, end=6)
+        >>> list(G.nodes(begin=4, end=6))
+        []
+        >>> list(G.nodes(begin=4, end=16))
+        [2, 4, 6]
+        """
+        if n not in self._node:
+            return
+
+        i = self._ids[n]
+        with self._db:
+            if begin is None and end is None:
+                self._db.execute(_DELETE_NODE_EDGES, (i, i))
+            else:
+                begin, end = self.__fill_interval(begin, end)
+                self._db.execute(_DELETE_NODE_EDGES + _AND_OVERLAP, (i, i, end, begin))
+
+            # delete the node and its attributes if no edge left
+            self.__remove_isolated([i])
+
+    def add_edge(self, u, v, begin, end, **attr):
+        """Add an edge between u and v, during interval [begin, end).
+
+        See IntervalGraph.add_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edge(1, 2, 3, 10)
+        >>> G.add_edge(1, 3, 4, 9, weight=7, capacity=15, length=342.7)
+        """
+        self.__add_edges([(u, v, begin, end, attr)])
+
+    def add_edges_from(self, ebunch_to_add, **attr):
+        """Add all the edges in ebunch_to_add.
+
+        See IntervalGraph.add_edges_from for details. The edges are streamed
+        to the database in a single transaction, thus if any edge is invalid,
+        none is added.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'label': 'WN2898'})], weight=3)
+        """
+        def edges():
+            for e in ebunch_to_add:
+                ne = len(e)
+                if ne == 5:
+                    u, v, begin, end, dd = e
+                elif ne == 4:
+                    u, v, begin, end = e
+                    dd = {}
+                else:
+                    raise NetworkXError("Edge tuple {0} must be a 4-tuple or 5-tuple.".format(e))
+
+                datadict = attr.copy()
+                datadict.update(dd)
+                yield u, v, begin, end, datadict
+
+        self.__add_edges(edges())
+
+    def __add_edges(self, edges):
+        """Insert the (u, v, begin, end, attr) edges in one transaction, adding their new nodes.
+
+        If an edge with the same nodes, in either order, and interval exists already,
+        its attributes are updated instead.
+        """
+        added = []
+
+        def rows():
+            for u, v, begin, end, attr in edges:
+                begin, end = _scalar(begin), _scalar(end)
+                if not begin < end:
+                    raise NetworkXError("IntervalGraph: edge duration must be strictly bigger than zero {0}."
+                                        .format(Interval(begin, end, (u, v))))
+
+                # add nodes
+                for n in (u, v):
+                    if n not in self._node:
+                        self._node[n] = {}
+                        added.append(n)
+
+                yield self.__node_id(u), self.__node_id(v), begin, end, _dumps(attr) if attr else None
+
+        try:
+            with self._db:
+                self.__insert_edges(rows())
+                self.__write_nodes(added)
+        except Exception:
+            for n in added:
+                del self._node[n]
+                del self._labels[self._ids.pop(n)]
+            raise
+
+        self._expire_retention()
+
+    def has_edge(self, u, v, begin=None, end=None, overlapping=True):
+        """Return True if there exists an edge between u and v
+        in the interval graph, during the given interval.
+
+        See IntervalGraph.has_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        >>> G.has_edge(1, 2)
+        True
+        >>> G.has_edge(2, 4, begin=12)
+        False
+        >>> G.has_edge(2, 4, begin=1, end=11, overlapping=False)
+        True
+        """
+        if not overlapping and (begin is None or end is None):
+            raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
+
+        pair = self.__pair(u, v)
+        if pair is None:
+            return False
+
+        if begin is None and end is None:
+            row = self._db.execute(_SELECT_PAIR, pair).fetchone()
+        elif not overlapping:
+            row = self._db.execute(_SELECT_PAIR + _AND_EXACT, pair + (begin, end)).fetchone()
+        else:
+            begin, end = self.__fill_interval(begin, end)
+            row = self._db.execute(_SELECT_PAIR + _AND_OVERLAP, pair + (end, begin)).fetchone()
+
+        return row is not None
+
+    def _iter_edges(self, u=None, v=None, begin=None, end=None, data=False, default=None):
+        """Return an iterator of the edges reported by `edges`, for edge views.
+
+        The edges are read from a cursor while iterating.
+        """
+        query = self.__edge_query(u, v, begin, end)
+        if query is None:
+            return
+
+        sql, params = query
+        labels = self._labels
+        for b, e, i, j, attr in self._db.execute(_SELECT_EDGES + sql + _ORDER_BY_TIME, params):
+            iv = Interval(b, e, (labels[i], labels[j]))
+
+            # Appending attribute data if needed
+            if data is False:
+                yield iv
+            elif data is True:
+                yield iv, _loads(attr) if attr is not None else {}
+            elif attr is None:
+                yield iv, default
+            else:
+                yield iv, _loads(attr).get(data, default)
+
+    def _iter_edge_attrs(self):
+        """Return an iterator of (Interval, attribute dict or None) 2-tuples of all the edges.
+
+        See IntervalGraph._iter_edge_attrs for details.
+        """
+        return self.__iter_rows(self._db.execute(_SELECT_EDGES + _FROM_EDGES + _ORDER_BY_TIME))
+
+    def _count_edges(self, u=None, v=None, begin=None, end=None):
+        """Return the number of edges reported by `edges`, for edge views."""
+        query = self.__edge_query(u, v, begin, end)
+        if query is None:
+            return 0
+
+        sql, params = query
+        return self._db.execute(_COUNT_EDGES + sql, params).fetchone()[0]
+
+    def remove_edge(self, u, v, begin=None, end=None, overlapping=True):
+        """Remove the edge between u and v in the interval graph,
+        during the given interval.
+
+        See IntervalGraph.remove_edge for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 5, 9), (1, 2, 8, 15)])
+        >>> G.remove_edge(1, 2, begin=2, end=4)
+        >>> G.has_edge(1, 2)
+        True
+        """
+        if not overlapping and (begin is None or end is None):
+            raise NetworkXError("For exact interval match (overlapping=False), both begin and end must be defined.")
+
+        pair = self.__pair(u, v)
+        if pair is None:
+            return
+
+        with self._db:
+            if not overlapping:
+                self._db.execute(_DELETE_PAIR + _AND_EXACT, pair + (begin, end))
+            elif begin is not None or end is not None:
+                begin, end = self.__fill_interval(begin, end)
+                self._db.execute(_DELETE_PAIR + _AND_OVERLAP, pair + (end, begin))
+            else:
+                self._db.execute(_DELETE_PAIR, pair)
+
+    def expire_before(self, t):
+        """Remove all the edges which end at or before t, and the nodes left without edges.
+
+        See IntervalGraph.expire_before for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12), (3, 4, 14, 20)])
+        >>> G.expire_before(12)
+        >>> list(G.nodes())
+        [3, 4]
+
+        Notes
+        -----
+        Only the edges which end at or before t are read, through the index on end.
+        """
+        with self._db:
+            ids = set()
+            for i, j in self._db.execute(_SELECT_EXPIRED, (t,)):
+                ids.add(i)
+                ids.add(j)
+            if not ids:
+                return
+
+            self._db.execute(_DELETE_EXPIRED, (t,))
+
+            # delete the nodes and their attributes if no edge left
+            self.__remove_isolated(ids)
+
+    def _expire_retention(self):
+        """Remove the edges which ended before the retention window, if one is set."""
+        if self._retention is not None:
+            end = self._db.execute(_SELECT_END).fetchone()[0]
+            if end is not None:
+                self.expire_before(end - self._retention)
+
+    def to_subgraph(self, begin, end, multigraph=False, edge_data=False, edge_interval_data=False, node_data=False):
+        """Return a networkx Graph or MultiGraph which includes all the nodes and
+        edges which have overlapping intervals with the given interval.
+
+        See IntervalGraph.to_subgraph for details.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (6, 4, 12, 19), (2, 4, 8, 15)])
+        >>> H = G.to_subgraph(4, 12)
+        >>> list(H.edges(data=True))
+        [(2, 4, {}), (2, 1, {})]
+        """
+        if end <= begin:
+            raise NetworkXError("IntervalGraph: subgraph duration must be strictly bigger than zero: "
+                                "begin: {}, end: {}.".format(begin, end))
+
+        if multigraph:
+            G = MultiGraph()
+        else:
+            G = Graph()
+
+        labels = self._labels
+        edges = self._db.execute(_SELECT_EDGES + _WHERE_OVERLAP + _ORDER_BY_TIME, (end, begin, end, begin))
+
+        if edge_data and edge_interval_data:
+            G.add_edges_from((labels[i], labels[j], dict(_loads(attr) if attr is not None else {}, begin=b, end=e))
+                             for b, e, i, j, attr in edges)
+        elif edge_data:
+            G.add_edges_from((labels[i], labels[j], _loads(attr) if attr is not None else {})
+                             for b, e, i, j, attr in edges)
+        elif edge_interval_data:
+            G.add_edges_from((labels[i], labels[j], {'begin': b, 'end': e})
+                             for b, e, i, j, attr in edges)
+        else:
+            G.add_edges_from((labels[i], labels[j]) for b, e, i, j, attr in edges)
+
+        # include node attributes
+        if node_data:
+            G.add_nodes_from((n, self._node[n].copy()) for n in G.nodes)
+
+        return G
+
+    def _edge_columns(self):
+        """Return all the edges as columns, sorted by begin, then end and endpoints.
+
+        See IntervalGraph._edge_columns for details. All the edges are read into memory.
+        """
+        import numpy as np
+
+        ids = sorted(self._labels)
+        labels = [self._labels[i] for i in ids]
+
+        rows = self._db.execute(_SELECT_EDGES + _FROM_EDGES + _ORDER_BY_TIME).fetchall()
+        begin = np.array([r[0] for r in rows])
+        end = np.array([r[1] for r in rows])
+        u = np.searchsorted(ids, np.array([r[2] for r in rows], dtype=np.int64)).astype(np.int64)
+        v = np.searchsorted(ids, np.array([r[3] for r in rows], dtype=np.int64)).astype(np.int64)
+        eattr = [_loads(r[4]) if r[4] is not None else None for r in rows]
+
+        order = np.lexsort((np.maximum(u, v), np.minimum(u, v), end, begin)) if len(rows) else u
+        eattr = [eattr[r] for r in order.tolist()] if any(d is not None for d in eattr) else None
+
+        return begin[order], end[order], u[order], v[order], labels, eattr
+
+    def memory_usage(self):
+        """Return the memory used by the interval graph, in bytes, by part.
+
+        See IntervalGraph.memory_usage for details. Only the 'nodes', with the
+        node label table, are in memory, the edges and their indexes are in the
+        database, and not counted.
+
+        Examples
+        --------
+        >>> G = dnx.SQLiteIntervalGraph()
+        >>> G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11), (1, 2, 8, 15, {'weight': 2})])
+        >>> G.memory_usage()['edges']
+        0
+        """
+        return {'nodes': _deep_sizeof([self._node, self._labels, self._ids], set()),
+                'edges': 0,
+                'edge_attrs': 0,
+                'adjacency': 0,
+                'index': 0}
+
+    def _window_adjacency(self, begin, end, predecessors=False):
+        """Return the adjacency of the edges overlapping [begin, end), for window views.
+
+        See IntervalGraph._window_adjacency for details. The adjacency is built
+        from the edges in the window, read from the database.
+        """
+        adj = {}
+        begin, end = self.__fill_interval(begin, end)
+        for iv, attr in self.__iter_rows(self._db.execute(_SELECT_EDGES + _WHERE_OVERLAP + _ORDER_BY_TIME,
+                                                          (end, begin, end, begin))):
+            u, v = iv.data
+            iedges = adj.setdefault(u, {}).get(v)
+            if iedges is None:
+                iedges = adj[u][v] = adj.setdefault(v, {})[u] = _IntervalEdgeDict()
+            iedges[iv] = attr if attr is not None else {}
+
+        return adj
+
+    def _sweep(self, windows):
+        """Sweep the edges through a sequence of windows.
+
+        See IntervalGraph._sweep for details. Only the edges overlapping each window
+        are read from the database, and kept in memory until the next window.
+        """
+        active = {}
+        for begin, end in windows:
+            window = dict(self.__iter_rows(self._db.execute(_SELECT_EDGES + _WHERE_OVERLAP + _ORDER_BY_TIME,
+                                                            (end, begin, end, begin))))
+
+            entering = [(iedge, d) for iedge, d in window.items() if iedge not in active]
+            leaving = [(iedge, d) for iedge, d in active.items() if iedge not in window]
+            active = window
+
+            yield entering, leaving
+
+    def __iter_rows(self, rows):
+        """Return an iterator of (Interval, attribute dict or None) 2-tuples of edge rows."""
+        labels = self._labels
+        for b, e, i, j, attr in rows:
+            yield Interval(b, e, (labels[i], labels[j])), _loads(attr) if attr is not None else None
+
+    def __edge_query(self, u, v, begin, end):
+        """Return the WHERE clause and parameters of the edges reported by `edges`,
+        or None if there are none."""
+        if u is None and v is None:
+            if begin is None and end is None:
+                return _FROM_EDGES, ()
+            begin, end = self.__fill_interval(begin, end)
+            return _WHERE_OVERLAP, (end, begin, end, begin)
+
+        if u is not None and v is not None:
+            params = self.__pair(u, v)
+            if params is None:
+                return None
+            sql = _WHERE_PAIR
+        else:
+            n = u if u is not None else v
+            if n not in self._node:
+                raise KeyError(n)
+            params = (self._ids[n], self._ids[n])
+            sql = _WHERE_NODE
+
+        if begin is not None:
+            sql += ' AND e.end_time >= ?'
+            params += (begin,)
+        if end is not None:
+            sql += ' AND e.begin_time < ?'
+            params += (end,)
+
+        return sql, params
+
+    def __fill_interval(self, begin, end):
+        """Replace undefined begin or end with the interval of the entire graph.
+
+        Same as IntervalGraph, the default end is shifted up by 1 to make it inclusive.
+        """
+        graph_begin, graph_end = self.interval()
+        if begin is None:
+            begin = graph_begin
+        if end is None:
+            end = graph_end + 1
+        return begin, end
+
+    def __window_node_ids(self, begin, end):
+        """Return the set of ids of all nodes with an edge overlapping [begin, end)."""
+        begin, end = self.__fill_interval(begin, end)
+        return set(i for i, in self._db.execute(_SELECT_WINDOW_NODES, (end, begin, end, begin) * 2))
+
+    def __node_id(self, n):
+        """Return the integer id of node n in the label table, assigning one if needed."""
+        i = self._ids.get(n)
+        if i is None:
+            i = self._ids[n] = self._next_id
+            self._labels[i] = n
+            self._next_id += 1
+        return i
+
+    def __pair(self, u, v):
+        """Return the (lower, higher) ids of nodes u and v, or None if one is not in the graph."""
+        i = self._ids.get(u)
+        j = self._ids.get(v)
+        if i is None or j is None:
+            return None
+        return min(i, j), max(i, j)
+
+    def __insert_edges(self, rows):
+        """Insert the (u, v, begin, end, attr) rows of edges, and index the new ones in the R*Tree.
+
+        The R*Tree is filled once for all the rows, which is much faster than a trigger for each row.
+        """
+        last = self._db.execute(_SELECT_LAST_ID).fetchone()[0]
+        if _UPSERT:
+            self._db.executemany(_INSERT_EDGE, rows)
+        else:
+            for u, v, begin, end, attr in rows:
+                pair = (u, v) if u <= v else (v, u)
+                if not self._db.execute(_UPDATE_EDGE_ATTR, (attr,) + pair + (begin, end)).rowcount:
+                    self._db.execute(_INSERT_EDGE_ROW, (u, v, begin, end, attr))
+        self._db.execute(_INDEX_EDGES, (last if last is not None else 0,))
+
+    def __write_nodes(self, nodes):
+        """Write the label and attributes of the nodes to the database."""
+        self._db.executemany(_INSERT_NODE, ((self.__node_id(n), _dumps(n), _dumps(self._node[n]) if self._node[n]
+                                             else None) for n in nodes))
+
+    def __remove_isolated(self, ids):
+        """Delete the nodes of `ids` which have no edges left, with their attributes."""
+        for i in ids:
+            if self._db.execute(_SELECT_NODE_EDGE, (i, i)).fetchone() is None:
+                self._db.execute(_DELETE_NODE, (i,))
+                n = self._labels.pop(i)
+                del self._ids[n]
+                del self._node[n]
+
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS nodes (id INTEGER PRIMARY KEY, label BLOB NOT NULL, attr BLOB)',
+    'CREATE TABLE IF NOT EXISTS edges (id INTEGER PRIMARY KEY, u INTEGER NOT NULL, v INTEGER NOT NULL, '
+    'begin_time NOT NULL, end_time NOT NULL, attr BLOB)',
+    # undirected edges are identified regardless of the order of their nodes
+    'CREATE UNIQUE INDEX IF NOT EXISTS edges_pair ON edges (min(u, v), max(u, v), begin_time, end_time)',
+    'CREATE INDEX IF NOT EXISTS edges_u ON edges (u)',
+    'CREATE INDEX IF NOT EXISTS edges_v ON edges (v)',
+    'CREATE INDEX IF NOT EXISTS edges_time ON edges (begin_time, end_time)',
+    'CREATE INDEX IF NOT EXISTS edges_end ON edges (end_time)',
+    # the R*Tree holds 32-bit float bounds containing the intervals, thus window queries check the exact ones
+    'CREATE VIRTUAL TABLE IF NOT EXISTS edges_rtree USING rtree(id, begin_time, end_time)',
+    'CREATE TRIGGER IF NOT EXISTS edges_delete AFTER DELETE ON edges BEGIN '
+    'DELETE FROM edges_rtree WHERE id = old.id; END',
+)
+
+_INSERT_NODE = 'INSERT OR REPLACE INTO nodes (id, label, attr) VALUES (?, ?, ?)'
+_SELECT_NODES = 'SELECT id, label, attr FROM nodes'
+_DELETE_NODE = 'DELETE FROM nodes WHERE id = ?'
+
+# upserts are only supported from SQLite 3.24, before it edges are updated, or else inserted, one by one
+_UPSERT = sqlite3.sqlite_version_info >= (3, 24, 0)
+_INSERT_EDGE_ROW = 'INSERT INTO edges (u, v, begin_time, end_time, attr) VALUES (?, ?, ?, ?, ?)'
+_INSERT_EDGE = (_INSERT_EDGE_ROW + ' ON CONFLICT (min(u, v), max(u, v), begin_time, end_time) '
+                'DO UPDATE SET attr = merge_attr(attr, excluded.attr)')
+_UPDATE_EDGE_ATTR = ('UPDATE edges SET attr = merge_attr(attr, ?) '
+                     'WHERE min(u, v) = ? AND max(u, v) = ? AND begin_time = ? AND end_time = ?')
+_SELECT_EDGE_ROWS = 'SELECT u, v, begin_time, end_time, attr FROM edges'
+# new edges have ids above all the previous ones
+_SELECT_LAST_ID = 'SELECT max(id) FROM edges'
+_INDEX_EDGES = 'INSERT INTO edges_rtree SELECT id, begin_time, end_time FROM edges WHERE id > ?'
+_SELECT_BEGIN = 'SELECT min(begin_time) FROM edges'
+_SELECT_END = 'SELECT max(end_time) FROM edges'
+
+_SELECT_EDGES = 'SELECT e.begin_time, e.end_time, e.u, e.v, e.attr '
+_COUNT_EDGES = 'SELECT count(*) '
+_ORDER_BY_TIME = ' ORDER BY e.begin_time, e.end_time'
+_FROM_EDGES = 'FROM edges e'
+_WHERE_OVERLAP = ('FROM edges_rtree r CROSS JOIN edges e ON e.id = r.id '
+                  'WHERE r.begin_time < ? AND r.end_time > ? AND e.begin_time < ? AND e.end_time > ?')
+_WHERE_PAIR = 'FROM edges e WHERE min(e.u, e.v) = ? AND max(e.u, e.v) = ?'
+_WHERE_NODE = 'FROM edges e WHERE (e.u = ? OR e.v = ?)'
+_AND_OVERLAP = ' AND begin_time < ? AND end_time > ?'
+_AND_EXACT = ' AND begin_time = ? AND end_time = ?'
+
+_SELECT_PAIR = 'SELECT 1 FROM edges WHERE min(u, v) = ? AND max(u, v) = ?'
+_DELETE_PAIR = 'DELETE FROM edges WHERE min(u, v) = ? AND max(u, v) = ?'
+_SELECT_NODE_EDGE = 'SELECT 1 FROM edges WHERE u = ? OR v = ? LIMIT 1'
+_SELECT_NODE_OVERLAP = 'SELECT 1 FROM edges WHERE (u = ? OR v = ?) AND begin_time < ? AND end_time > ? LIMIT 1'
+_DELETE_NODE_EDGES = 'DELETE FROM edges WHERE (u = ? OR v = ?)'
+_SELECT_WINDOW_NODES = 'SELECT e.u ' + _WHERE_OVERLAP + ' UNION SELECT e.v ' + _WHERE_OVERLAP
+_SELECT_EXPIRED = 'SELECT u, v FROM edges WHERE end_time <= ?'
+_DELETE_EXPIRED = 'DELETE FROM edges WHERE end_time <= ?'
+
+
+def _dumps(obj):
+    """Return the pickle of a node label or attribute dict, as a SQLite blob."""
+    return sqlite3.Binary(pickle.dumps(obj, 2))
+
+
+def _loads(blob):
+    """Return the node label or attribute dict pickled in a SQLite blob."""
+    return pickle.loads(bytes(blob))
+
+
+def _merge_attr(old, new):
+    """SQLite function updating the pickled attribute dict `old` with `new`, either may be NULL."""
+    if old is None:
+        return new
+    if new is None:
+        return old
+
+    attr = _loads(old)
+    attr.update(_loads(new))
+    return _dumps(attr)
+
+
+def _scalar(x):
+    """Return NumPy scalars as Python numbers, which SQLite can store."""
+    return x.item() if hasattr(x, 'item') else x
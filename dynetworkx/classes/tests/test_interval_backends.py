@@ -0,0 +1,429 @@
+from nose import SkipTest
+from nose.tools import assert_equal, assert_true, assert_false, assert_raises
+import pickle
+
+import networkx as nx
+import numpy as np
+from networkx.testing import assert_edges_equal, assert_nodes_equal
+
+import dynetworkx as dnx
+
+EDGES = [(1, 2, 0, 100, {'weight': 1}),
+         (2, 3, 4, 12),
+         (3, 2, 4, 12, {'weight': 2}),  # same edge, nodes in the other order
+         (3, 4, 14, 20),
+         (4, 5, 10, 30, {'weight': 3}),
+         (5, 5, 22, 40),  # self-loop
+         (2, 4, 1, 11),
+         (2, 4, 8, 15, {'weight': 4}),
+         (6, 1, 50, 60),
+         (6, 7, 70, 80)]
+
+
+def edge_weights(H):
+    """Return the sorted (pair, weight) 2-tuples of the edges of a networkx graph, with unordered pairs if undirected."""
+    pairs = (((u, v) if H.is_directed() else tuple(sorted((u, v))), w) for u, v, w in H.edges(data='weight'))
+    return sorted(pairs, key=repr)
+
+
+def total_weight(H):
+    """Return the sum of the weights of the edges of a networkx graph, for map_windows workers."""
+    return sum(w for u, v, w in H.edges(data='weight', default=0))
+
+
+def assert_same_graph(G, H):
+    """Check that two networkx graphs have the same nodes and edges, with their data."""
+    assert_equal(G.is_directed(), H.is_directed())
+    assert_nodes_equal(G.nodes(data=True), H.nodes(data=True))
+    if G.is_directed():
+        assert_equal(sorted(G.edges(data='weight')), sorted(H.edges(data='weight')))
+    else:
+        assert_edges_equal(G.edges(data=True), H.edges(data=True))
+
+
+class BaseIntervalGraphTester(object):
+    """Tests of the features shared by all the interval graph classes."""
+
+    # whether the class caches window queries
+    window_cache = True
+
+    def setup(self):
+        self.G = self.Graph()
+        self.G.add_edges_from(EDGES)
+        self.G.add_node('isolated', color='red')
+        self.G.add_node(1, color='blue')
+
+    def windows(self, width, step):
+        begin, end = self.G.interval()
+        windows = []
+        while begin < end:
+            windows.append((begin, begin + width))
+            begin += step
+        return windows
+
+    def test_snapshots_match_subgraphs(self):
+        G = self.G
+        for width, step in ((7, 7), (10, 4), (25, 30)):
+            snapshots = list(G.iter_snapshots(width=width, step=step, edge_data=True, node_data=True))
+            windows = self.windows(width, step)
+            assert_equal(len(snapshots), len(windows))
+            for S, (begin, end) in zip(snapshots, windows):
+                assert_same_graph(S, G.to_subgraph(begin, end, edge_data=True, node_data=True))
+
+    def test_to_snapshots_match_subgraphs(self):
+        G = self.G
+        begin, end = G.interval()
+        snapshots = G.to_snapshots(4, edge_data=True, node_data=True)
+        assert_equal(len(snapshots), 4)
+        width = (end - begin) / 4.0
+        for i, S in enumerate(snapshots):
+            H = G.to_subgraph(begin + i * width, begin + (i + 1) * width, edge_data=True, node_data=True)
+            assert_same_graph(S, H)
+
+    def test_snapshot_attributes_are_copies(self):
+        G = self.G
+        first, second = G.to_snapshots(2, edge_data=True, node_data=True)
+        first.edges[1, 2]['weight'] = 10
+        first.nodes[1]['color'] = 'green'
+        assert_equal(second.edges[1, 2]['weight'], 1)
+        assert_equal(second.nodes[1]['color'], 'blue')
+        assert_equal(list(dict(G.edges(u=1, v=2, data='weight')).values()), [1])
+        assert_equal(dict(G.nodes(data='color'))[1], 'blue')
+
+        first, second = list(G.iter_snapshots(2, edge_data=True, node_data=True))
+        first.edges[1, 2]['weight'] = 10
+        first.nodes[1]['color'] = 'green'
+        assert_equal(second.edges[1, 2]['weight'], 1)
+        assert_equal(second.nodes[1]['color'], 'blue')
+        assert_equal(dict(G.nodes(data='color'))[1], 'blue')
+
+    def test_degree_series_isolated_node(self):
+        G = self.G
+        bins = [0, 10, 20, 50, 100]
+        degrees = G.degree_series([1, 'isolated'], bins)
+        assert_equal(degrees.tolist()[1], [0, 0, 0, 0])
+        for i, (begin, end) in enumerate(zip(bins[:-1], bins[1:])):
+            H = G.to_subgraph(begin, end)
+            assert_equal(degrees[0, i], H.degree(1) if 1 in H else 0)
+
+        all_degrees = G.degree_series(None, bins)
+        assert_equal(all_degrees.shape, (len(G), len(bins) - 1))
+        nodes = list(G.nodes())
+        assert_equal(all_degrees[nodes.index('isolated')].tolist(), [0, 0, 0, 0])
+        assert_raises(nx.NetworkXError, G.degree_series, [1, 'missing'], bins)
+
+    def test_has_edge_unknown_node(self):
+        G = self.G
+        for u, v in ((1, 'missing'), ('missing', 1), ('missing', 'other'), ('isolated', 1)):
+            assert_false(G.has_edge(u, v))
+            assert_false(G.has_edge(u, v, 0, 50))
+            assert_false(G.has_edge(u, v, 0, 100, overlapping=False))
+
+    def test_window_cache_api(self):
+        G = self.G
+        info = G.window_cache_info()
+        assert_equal(sorted(info), ['entries', 'hits', 'max_size', 'misses', 'size'])
+        assert_equal(info['max_size'], None)
+        G.window_cache_size = None
+        assert_equal(G.window_cache_size, None)
+
+        if self.window_cache:
+            G.window_cache_size = 2 ** 20
+            assert_equal(G.number_of_nodes(begin=0, end=5), G.number_of_nodes(begin=0, end=5))
+            assert_equal(G.window_cache_info()['hits'], 1)
+        else:
+            assert_raises(nx.NetworkXError, setattr, G, 'window_cache_size', 2 ** 20)
+            assert_equal(G.window_cache_size, None)
+
+    def test_window_view_matches_subgraphs(self):
+        G = self.G
+        for begin, end in self.windows(6, 5) + [(0, 200), (100, 101)]:
+            H = dnx.window_view(G, begin, end)
+            S = G.to_subgraph(begin, end, node_data=True)
+            assert_equal(H.is_directed(), G.is_directed())
+            assert_nodes_equal(H.nodes(data=True), S.nodes(data=True))
+            assert_equal(H.number_of_edges(), S.number_of_edges())
+            assert_equal([pair for pair, w in edge_weights(H)], [pair for pair, w in edge_weights(S)])
+            assert_equal(sorted(H.degree()), sorted(S.degree()))
+
+            M = dnx.window_view(G, begin, end, multigraph=True)
+            S = G.to_subgraph(begin, end, multigraph=True, edge_data=True)
+            assert_true(M.is_multigraph())
+            assert_equal(M.number_of_edges(), S.number_of_edges())
+            assert_equal(edge_weights(M), edge_weights(S))
+
+        assert_raises(nx.NetworkXError, dnx.window_view, G, 5, 5)
+
+    def test_map_windows_match_subgraphs(self):
+        G = self.G
+        windows = self.windows(6, 5) + [(0, 200), (3, 4)]
+        edges = [G.to_subgraph(begin, end).number_of_edges() for begin, end in windows]
+        weights = [total_weight(G.to_subgraph(begin, end, multigraph=True, edge_data=True))
+                   for begin, end in windows]
+        for processes, chunksize in ((1, None), (2, None), (2, 1), (3, 4)):
+            assert_equal(list(G.map_windows(nx.number_of_edges, windows, processes, chunksize)), edges)
+            assert_equal(list(G.map_windows(total_weight, windows, processes, chunksize,
+                                            multigraph=True, edge_data=True)), weights)
+
+        assert_equal(list(G.map_windows(len, [], processes=2)), [])
+        assert_raises(nx.NetworkXError, G.map_windows, len, [(0, 5), (5, 5)])
+
+    def test_edges_and_nodes_at_times(self):
+        G = self.G
+        times = [-1, 0, 3, 4, 11.5, 12, 14, 40, 99, 100, 200]
+        offsets, indices, edges = G.edges_at(times)
+        assert_equal(sorted(edges), sorted(G.edges()))
+        assert_equal(len(offsets), len(times) + 1)
+        for i, t in enumerate(times):
+            present = [edges[j] for j in indices[offsets[i]:offsets[i + 1]]]
+            assert_equal(sorted(present), sorted(iv for iv in G.edges() if iv.begin <= t < iv.end))
+            assert_equal([iv.begin for iv in present], sorted(iv.begin for iv in present))
+
+        offsets, indices, nodes = G.nodes_at(times)
+        assert_equal(sorted(nodes, key=repr), sorted(G.nodes(), key=repr))
+        for i, t in enumerate(times):
+            present = [nodes[j] for j in indices[offsets[i]:offsets[i + 1]]]
+            expected = set(n for iv in G.edges() if iv.begin <= t < iv.end for n in iv.data)
+            assert_equal(len(present), len(expected))
+            assert_equal(set(present), expected)
+
+        assert_raises(nx.NetworkXError, G.edges_at, [5, 3])
+        assert_raises(nx.NetworkXError, G.nodes_at, [5, 3])
+
+    def test_sparse_tensor_matches_subgraphs(self):
+        G = self.G
+        bins = [0, 10, 25, 50, 101]
+        k = len(bins) - 1
+        for multigraph in (False, True):
+            nodes, A = G.to_sparse_tensor(bins, multigraph=multigraph)
+            n = len(nodes)
+            assert_equal(sorted(nodes, key=repr), sorted(G.nodes(), key=repr))
+            assert_equal(A.shape, (k * n, n))
+
+            blocks = []
+            for t in range(k):
+                S = G.to_subgraph(bins[t], bins[t + 1], multigraph=multigraph)
+                S.add_nodes_from(nodes)
+                blocks.append(nx.to_numpy_array(S, nodelist=nodes, weight=None))
+                assert_equal(A.toarray()[t * n:(t + 1) * n].tolist(), blocks[t].tolist())
+
+            _, S = G.to_sparse_tensor(bins, multigraph=multigraph, supra=True, coupling=0.5)
+            S = S.toarray()
+            assert_equal(S.shape, (k * n, k * n))
+            for t in range(k):
+                for r in range(k):
+                    block = S[t * n:(t + 1) * n, r * n:(r + 1) * n].tolist()
+                    if r == t:
+                        assert_equal(block, blocks[t].tolist())
+                    elif abs(r - t) == 1:
+                        assert_equal(block, (0.5 * np.eye(n)).tolist())
+                    else:
+                        assert_equal(block, np.zeros((n, n)).tolist())
+
+    def test_aggregate_matches_overlaps(self):
+        G = self.G
+        bins = [0, 10, 25, 50, 101]
+        squared = lambda lo, hi: (hi - lo) ** 2
+        for weight, func in (('duration', lambda lo, hi: hi - lo), ('count', lambda lo, hi: 1), (squared, squared)):
+            graphs = G.aggregate(weight=weight, bins=bins)
+            assert_equal(len(graphs), len(bins) - 1)
+            for H, begin, end in zip(graphs, bins[:-1], bins[1:]):
+                expected = {}
+                for iv in (iv for iv in G.edges() if iv.begin < end and iv.end > begin):
+                    pair = iv.data if G.is_directed() else tuple(sorted(iv.data))
+                    expected[pair] = expected.get(pair, 0) + func(max(iv.begin, begin), min(iv.end, end))
+                assert_equal(H.is_directed(), G.is_directed())
+                assert_equal(edge_weights(H), sorted(expected.items(), key=repr))
+                assert_equal(edge_weights(G.aggregate(begin, end, weight=weight)), edge_weights(H))
+
+        first, last = G.interval()
+        assert_equal(edge_weights(G.aggregate()), edge_weights(G.aggregate(first, last)))
+        assert_raises(nx.NetworkXError, G.aggregate, 5, 5)
+        assert_raises(nx.NetworkXError, G.aggregate, weight='weight')
+
+    def test_numpy_edgelist_labels(self):
+        G = self.Graph()
+        G.add_edges_from([(1, 2, 0, 5), (2, 3, 4, 12)])
+        columns = G.to_numpy_edgelist(edge_attr=False)
+        assert_true(columns['source'].dtype.kind in 'iu')
+        assert_equal(sorted(zip(columns['source'].tolist(), columns['target'].tolist())), [(1, 2), (2, 3)])
+
+        G = self.Graph()
+        G.add_edges_from([(1, '1', 0, 5), ('1', 2.5, 4, 12)])
+        columns = G.to_numpy_edgelist(edge_attr=False)
+        assert_equal(columns['source'].dtype, object)
+        pairs = set(zip(columns['source'].tolist(), columns['target'].tolist()))
+        assert_equal(set(frozenset(pair) for pair in pairs), {frozenset([1, '1']), frozenset(['1', 2.5])})
+        assert_equal(set(type(n) for pair in pairs for n in pair), {int, str, float})
+
+    def test_reads_create_no_attribute_dicts(self):
+        G = self.G
+        bare = sorted(iv for iv, d in G._iter_edge_attrs() if d is None)
+        assert_true(bare)
+
+        assert_equal(len([d for iv, d in G.edges(data=True) if not d]), len(bare))
+        for multigraph in (False, True):
+            H = dnx.window_view(G, 0, 100, multigraph=multigraph)
+            assert_equal(len(list(H.edges(data=True))), H.number_of_edges())
+        G.to_subgraph(0, 100, edge_data=True)
+        assert_equal(sorted(iv for iv, d in G._iter_edge_attrs() if d is None), bare)
+
+    def test_edges_without_attributes_are_read_only(self):
+        G = self.G
+        iedge = next(iv for iv, d in G._iter_edge_attrs() if d is None)
+        d = dict(G.edges(data=True))[iedge]
+        assert_equal(d, {})
+        assert_raises(nx.NetworkXError, d.update, weight=5)
+
+    def test_set_attribute_through_edge_view(self):
+        G = self.G
+        iedge = next(iv for iv, d in G._iter_edge_attrs() if d is None)
+        G.edges()[iedge]['weight'] = 5
+        assert_equal(dict(G.edges(data='weight'))[iedge], 5)
+
+    def interval_weights(self, G):
+        """Return the sorted (begin, end, pair, weight) 4-tuples of the edges, with unordered pairs if undirected."""
+        edges = []
+        for iv, w in G.edges(data='weight'):
+            pair = iv.data if G.is_directed() else tuple(sorted(iv.data))
+            edges.append((iv.begin, iv.end, pair, None if w is None or w != w else w))
+        return sorted(edges)
+
+    def test_numpy_edgelist_round_trip(self):
+        G = self.G
+        columns = G.to_numpy_edgelist()
+        assert_equal(list(columns)[:4], ['source', 'target', 'begin', 'end'])
+        H = self.Graph.from_numpy_edgelist(columns['source'], columns['target'], columns['begin'], columns['end'],
+                                           edge_attr={'weight': columns['weight']})
+        assert_equal(self.interval_weights(H), self.interval_weights(G))
+
+        assert_raises(nx.NetworkXError, self.Graph.from_numpy_edgelist, [1, 2], [2], [0, 1], [5, 6])
+        assert_raises(nx.NetworkXError, self.Graph.from_numpy_edgelist, [1, 2], [2, 3], [0, 6], [5, 6])
+
+    def test_pandas_edgelist_round_trip(self):
+        try:
+            import pandas
+        except ImportError:
+            raise SkipTest('pandas not available.')
+        G = self.G
+        df = G.to_pandas_edgelist(source='u', target='v')
+        H = self.Graph.from_pandas_edgelist(df, source='u', target='v', edge_attr=True)
+        assert_equal(self.interval_weights(H), self.interval_weights(G))
+        H = self.Graph.from_pandas_edgelist(df, source='u', target='v')
+        assert_equal(list(H.edges(data='weight')), [(iv, None) for iv in H.edges()])
+
+    def test_pickle(self):
+        G = self.G
+        H = pickle.loads(pickle.dumps(G))
+        assert_equal(sorted(H.edges()), sorted(G.edges()))
+        assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        for begin, end in self.windows(10, 10):
+            assert_same_graph(H.to_subgraph(begin, end, edge_data=True), G.to_subgraph(begin, end, edge_data=True))
+
+
+class TestIntervalGraph(BaseIntervalGraphTester):
+    Graph = dnx.IntervalGraph
+
+
+    def test_window_view_reflects_changes(self):
+        G = self.G
+        H = dnx.window_view(G, 0, 10)
+        assert_false(H.has_edge(1, 7))
+        G.add_edge(1, 7, 5, 6, weight=8)
+        assert_equal(H.edges[1, 7]['weight'], 8)
+        G.remove_node(7)
+        assert_false(H.has_node(7))
+
+
+class TestIntervalDiGraph(BaseIntervalGraphTester):
+    Graph = dnx.IntervalDiGraph
+
+    def test_directed_subgraphs(self):
+        H = self.G.to_subgraph(0, 13, edge_data=True)
+        assert_true(H.is_directed())
+        assert_true(H.has_edge(2, 3) and H.has_edge(3, 2))
+        assert_false(H.has_edge(4, 2))
+        assert_equal(H.edges[3, 2]['weight'], 2)
+
+
+class BaseBackendTester(BaseIntervalGraphTester):
+    """Tests of the interval graph classes storing edges differently, against IntervalGraph."""
+
+    window_cache = False
+
+    def setup(self):
+        super(BaseBackendTester, self).setup()
+        self.reference = dnx.IntervalGraph()
+        self.reference.add_edges_from(EDGES)
+        self.reference.add_node('isolated', color='red')
+        self.reference.add_node(1, color='blue')
+
+    def test_nodes_and_edges(self):
+        G, R = self.G, self.reference
+        assert_equal(G.interval(), R.interval())
+        assert_nodes_equal(G.nodes(data=True), R.nodes(data=True))
+        assert_equal(sorted(G.edges(data='weight')), sorted(R.edges(data='weight')))
+        for begin, end in ((0, 5), (5, 8), (10, 25), (40, 70), (None, 12), (30, None)):
+            assert_equal(sorted(G.nodes(begin=begin, end=end)), sorted(R.nodes(begin=begin, end=end)))
+            assert_equal(G.number_of_nodes(begin=begin, end=end), R.number_of_nodes(begin=begin, end=end))
+            assert_equal(sorted(G.edges(begin=begin, end=end)), sorted(R.edges(begin=begin, end=end)))
+
+    def test_node_and_pair_edges(self):
+        G, R = self.G, self.reference
+        nodes = list(R.nodes())
+        for u in nodes:
+            for begin, end in ((None, None), (5, 15), (45, None)):
+                assert_equal(G.has_node(u, begin, end), R.has_node(u, begin, end))
+                assert_equal(sorted(G.edges(u=u, begin=begin, end=end)), sorted(R.edges(u=u, begin=begin, end=end)))
+            for v in nodes:
+                assert_equal(sorted(G.edges(u=u, v=v)), sorted(R.edges(u=u, v=v)))
+                assert_equal(G.has_edge(u, v), R.has_edge(u, v))
+                assert_equal(G.has_edge(u, v, 9, 13), R.has_edge(u, v, 9, 13))
+
+    def test_subgraphs_match_intervalgraph(self):
+        G, R = self.G, self.reference
+        for begin, end in self.windows(6, 5):
+            assert_same_graph(G.to_subgraph(begin, end, edge_data=True, node_data=True),
+                              R.to_subgraph(begin, end, edge_data=True, node_data=True))
+            assert_equal(sorted(G.to_subgraph(begin, end, multigraph=True).degree()),
+                         sorted(R.to_subgraph(begin, end, multigraph=True).degree()))
+
+    def test_series_match_intervalgraph(self):
+        G, R = self.G, self.reference
+        bins = [0, 5, 10, 20, 50, 100]
+        nodes = list(R.nodes())
+        assert_equal(G.degree_series(nodes, bins).tolist(), R.degree_series(nodes, bins).tolist())
+        assert_equal(G.degree_series(nodes, bins, multigraph=True).tolist(),
+                     R.degree_series(nodes, bins, multigraph=True).tolist())
+
+    def test_removals_match_intervalgraph(self):
+        G, R = self.G, self.reference
+        for H in (G, R):
+            H.remove_edge(2, 4, 8, 15, overlapping=False)
+            H.remove_node(6)
+            H.expire_before(12)
+        assert_nodes_equal(G.nodes(data=True), R.nodes(data=True))
+        assert_equal(sorted(G.edges(data='weight')), sorted(R.edges(data='weight')))
+        for u in R.nodes():
+            assert_equal(sorted(G.edges(u=u)), sorted(R.edges(u=u)))
+
+
+class TestArrayIntervalGraph(BaseBackendTester):
+    Graph = dnx.ArrayIntervalGraph
+
+
+class TestSQLiteIntervalGraph(BaseBackendTester):
+    Graph = dnx.SQLiteIntervalGraph
+
+    def test_edges_without_attributes_are_read_only(self):
+        # attribute dicts are copies read from the database
+        G = self.G
+        iedge = next(iv for iv, d in G._iter_edge_attrs() if d is None)
+        dict(G.edges(data=True))[iedge]['weight'] = 5
+        assert_equal(dict(G.edges(data='weight'))[iedge], None)
+
+    def test_set_attribute_through_edge_view(self):
+        G = self.G
+        iedge = next(iv for iv, d in G._iter_edge_attrs() if d is None)
+        G.edges()[iedge]['weight'] = 5
+        assert_equal(dict(G.edges(data='weight'))[iedge], None)
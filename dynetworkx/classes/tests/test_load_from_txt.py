@@ -0,0 +1,98 @@
+from nose import SkipTest
+from nose.tools import assert_equal, assert_raises
+import os
+import shutil
+import tempfile
+
+from networkx.exception import NetworkXError
+
+import dynetworkx as dnx
+from dynetworkx.classes import intervalgraph
+
+
+def edges(G, data='weight'):
+    if not data:
+        return sorted((iv.data[0], iv.data[1], iv.begin, iv.end) for iv in G.edges())
+    return sorted((iv.data[0], iv.data[1], iv.begin, iv.end, d) for iv, d in G.edges(data=data))
+
+
+class TestLoadFromTxt(object):
+    """Tests of IntervalGraph.load_from_txt, with the pandas and the Python parsers."""
+
+    def setup(self):
+        try:
+            import pandas
+        except ImportError:
+            raise SkipTest('pandas not available.')
+        self.dir = tempfile.mkdtemp()
+        self.read_txt_chunks = intervalgraph._read_txt_chunks
+
+    def teardown(self):
+        intervalgraph._read_txt_chunks = self.read_txt_chunks
+        shutil.rmtree(self.dir)
+
+    def write(self, text):
+        path = os.path.join(self.dir, 'edges.txt')
+        with open(path, 'w') as f:
+            f.write(text)
+        return path
+
+    def load(self, path, **kwargs):
+        """Return the graphs loaded with pandas and with the Python parser."""
+        intervalgraph._read_txt_chunks = self.read_txt_chunks
+        G = dnx.IntervalGraph.load_from_txt(path, **kwargs)
+        intervalgraph._read_txt_chunks = intervalgraph._parse_txt_chunks
+        H = dnx.IntervalGraph.load_from_txt(path, **kwargs)
+        return G, H
+
+    def test_parsers_match(self):
+        path = self.write("# contacts\n"
+                          "1 2 3 10 0.5\n"
+                          "2  4\t1 11   1.5  # comment\n"
+                          "\n"
+                          "   6 4 12 19 2.0\n")
+        G, H = self.load(path, columns={'u': 0, 'v': 1, 'begin': 2, 'end': 3, 'weight': 4},
+                         dtype={'weight': float})
+        expected = [('1', '2', 3, 10, 0.5), ('2', '4', 1, 11, 1.5), ('6', '4', 12, 19, 2.0)]
+        assert_equal(edges(G), expected)
+        assert_equal(edges(H), expected)
+
+    def test_parsers_match_delimiter(self):
+        path = self.write("a,b,3,10\nb, c,1,11\n")
+        for G in self.load(path, delimiter=','):
+            assert_equal(edges(G, data=False), [('a', 'b', 3, 10), ('b', 'c', 1, 11)])
+
+    def test_empty_node_field(self):
+        path = self.write("a,b,3,10\n,c,1,11\n")
+        intervalgraph._read_txt_chunks = self.read_txt_chunks
+        assert_raises(NetworkXError, dnx.IntervalGraph.load_from_txt, path, delimiter=',')
+        intervalgraph._read_txt_chunks = intervalgraph._parse_txt_chunks
+        assert_raises(NetworkXError, dnx.IntervalGraph.load_from_txt, path, delimiter=',')
+
+    def test_empty_time_field(self):
+        path = self.write("a,b,3,10\nb,c,,11\n")
+        intervalgraph._read_txt_chunks = self.read_txt_chunks
+        assert_raises(TypeError, dnx.IntervalGraph.load_from_txt, path, delimiter=',')
+        intervalgraph._read_txt_chunks = intervalgraph._parse_txt_chunks
+        assert_raises(TypeError, dnx.IntervalGraph.load_from_txt, path, delimiter=',')
+
+    def test_callable_nodetype(self):
+        path = self.write("1 2 3 10\n2 4 1 11\n")
+        for G in self.load(path, nodetype=lambda n: ('node', int(n))):
+            assert_equal(edges(G, data=False), [(('node', 1), ('node', 2), 3, 10), (('node', 2), ('node', 4), 1, 11)])
+        for G in self.load(path, nodetype=int):
+            assert_equal(edges(G, data=False), [(1, 2, 3, 10), (2, 4, 1, 11)])
+
+    def test_multicharacter_comments(self):
+        path = self.write("// contacts\n1 2 3 10 // first\n2 4 1 11\n")
+        G = dnx.IntervalGraph.load_from_txt(path, comments='//', nodetype=int)
+        assert_equal(edges(G, data=False), [(1, 2, 3, 10), (2, 4, 1, 11)])
+
+    def test_chunks(self):
+        lines = ["{0} {1} {2} {3} {4}\n".format(i, i + 1, i, i + 5, i * 0.5) for i in range(25)]
+        path = self.write(''.join(lines))
+        columns = {'u': 0, 'v': 1, 'begin': 2, 'end': 3, 'weight': 4}
+        expected = [(str(i), str(i + 1), i, i + 5, i * 0.5) for i in range(25)]
+        for chunksize in (1, 4, 25, 100):
+            for G in self.load(path, columns=columns, dtype={'weight': float}, chunksize=chunksize):
+                assert_equal(sorted(edges(G), key=lambda e: e[2]), expected)
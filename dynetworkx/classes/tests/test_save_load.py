@@ -0,0 +1,73 @@
+from nose.tools import assert_equal, assert_true, assert_false
+from datetime import datetime, timedelta
+from decimal import Decimal
+import os
+import shutil
+import tempfile
+
+from networkx.testing import assert_nodes_equal
+
+import dynetworkx as dnx
+
+
+def edges(G):
+    return sorted((iv.begin, iv.end, iv.data, d) for iv, d in G.edges(data=True))
+
+
+class TestSaveLoad(object):
+    """Round-trips of interval graphs through save and load."""
+
+    def setup(self):
+        self.dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.dir, 'graph.dnx')
+
+    def teardown(self):
+        shutil.rmtree(self.dir)
+
+    def round_trip(self, G, Graph=dnx.IntervalGraph, **kwargs):
+        G.save(self.path)
+        H = Graph.load(self.path, **kwargs)
+        assert_equal(H.graph, G.graph)
+        assert_nodes_equal(H.nodes(data=True), G.nodes(data=True))
+        assert_equal(edges(H), edges(G))
+        return H
+
+    def test_numeric_bounds(self):
+        G = dnx.IntervalGraph(name='contacts')
+        G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11, {'weight': 2.5}), (4, 'a', 8, 15, {'kind': ('x', 1)})])
+        G.add_node('isolated', color='red')
+        for mmap in (True, False):
+            self.round_trip(G, mmap=mmap)
+            self.round_trip(G, Graph=dnx.ArrayIntervalGraph, mmap=mmap)
+
+    def test_float_bounds(self):
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, 0.5, 2.25), (2, 3, 1.0, 4.5)])
+        self.round_trip(G)
+
+    def test_object_bounds(self):
+        start = datetime(2020, 1, 1)
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, start, start + timedelta(days=2), {'weight': 1}),
+                          (2, 3, start + timedelta(days=1), start + timedelta(days=5))])
+        for mmap in (True, False):
+            self.round_trip(G, mmap=mmap)
+
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, Decimal('0.1'), Decimal('0.3')), (2, 3, Decimal('0.2'), Decimal('1'))])
+        H = self.round_trip(G)
+        assert_equal(set(type(iv.begin) for iv in H.edges()), {Decimal})
+
+    def test_no_edge_attributes(self):
+        G = dnx.IntervalGraph()
+        G.add_edges_from([(1, 2, 3, 10), (2, 4, 1, 11)])
+        assert_equal(G._edge_columns()[-1], None)
+        G.save(self.path)
+        assert_false(any(name.startswith('attr.') for name in os.listdir(self.path)))
+        H = dnx.IntervalGraph.load(self.path)
+        assert_true(all(d == {} for iv, d in H.edges(data=True)))
+
+    def test_empty_graph(self):
+        G = dnx.IntervalGraph()
+        G.add_node(1)
+        self.round_trip(G)
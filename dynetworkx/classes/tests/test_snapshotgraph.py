@@ -0,0 +1,62 @@
+from nose.tools import assert_equal, assert_raises
+
+import networkx as nx
+import numpy as np
+
+import dynetworkx as dnx
+
+
+class TestSnapshotGraphDegreeSeries(object):
+    """Tests of SnapshotGraph.degree_series against the degrees in the unions of snapshots."""
+
+    def setup(self):
+        self.G = dnx.SnapshotGraph()
+        self.G.add_snapshot([(1, 2), (1, 3)])
+        self.G.add_snapshot([(1, 4), (1, 3), (4, 4)])
+        self.G.add_snapshot([(2, 3)])
+        self.G.add_snapshot(graph=nx.empty_graph([5]))
+
+    def test_windows_match_unions(self):
+        G = self.G
+        nodes = [1, 2, 3, 4, 5]
+        for bins in (None, [0, 2, 4], [1, 3], [0, 4]):
+            degrees = G.degree_series(nodes, bins)
+            bounds = bins if bins is not None else range(len(G.snapshots) + 1)
+            for i, (first, last) in enumerate(zip(bounds[:-1], bounds[1:])):
+                H = nx.compose_all(G.snapshots[first:last])
+                assert_equal(degrees[:, i].tolist(), [H.degree(n) if n in H else 0 for n in nodes])
+
+    def test_all_nodes(self):
+        G = self.G
+        assert_equal(G.degree_series(None).shape, (5, 4))
+
+    def test_unknown_node(self):
+        assert_raises(nx.NetworkXError, self.G.degree_series, [1, 'missing'])
+
+
+class TestSnapshotGraphSparseTensor(object):
+    """Tests of SnapshotGraph.to_sparse_tensor against the adjacency matrix of each snapshot."""
+
+    def test_snapshots_match_blocks(self):
+        for create_using in (nx.Graph, nx.DiGraph, nx.MultiGraph):
+            G = dnx.SnapshotGraph()
+            G.add_snapshot(graph=create_using([(1, 2), (1, 3), (3, 3)]))
+            G.add_snapshot(graph=create_using([(1, 4), (3, 1)]))
+            G.add_snapshot(graph=create_using([(2, 'a'), (2, 'a')]))
+            k = len(G.snapshots)
+
+            nodes, A = G.to_sparse_tensor()
+            n = len(nodes)
+            assert_equal(sorted(nodes, key=repr), sorted(set(v for g in G.snapshots for v in g), key=repr))
+            assert_equal(A.shape, (k * n, n))
+
+            _, S = G.to_sparse_tensor(supra=True, coupling=2)
+            S = S.toarray()
+            for t, g in enumerate(G.snapshots):
+                H = create_using(g)
+                H.add_nodes_from(nodes)
+                block = nx.to_numpy_array(H, nodelist=nodes, weight=None).tolist()
+                assert_equal(A.toarray()[t * n:(t + 1) * n].tolist(), block)
+                assert_equal(S[t * n:(t + 1) * n, t * n:(t + 1) * n].tolist(), block)
+                if t + 1 < k:
+                    assert_equal(S[t * n:(t + 1) * n, (t + 1) * n:(t + 2) * n].tolist(), (2 * np.eye(n)).tolist())
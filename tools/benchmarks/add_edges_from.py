@@ -0,0 +1,76 @@
+"""
+Benchmark of building an IntervalGraph edge by edge and in bulk.
+
+Times adding random edges to an empty IntervalGraph with add_edge, one
+call per edge, and with a single add_edges_from call, which builds the
+interval tree at once.
+
+Usage::
+
+    python tools/benchmarks/add_edges_from.py [--edges 200000] [--nodes 20000] [--repeat 3]
+"""
+from __future__ import print_function
+
+import argparse
+import gc
+import random
+import time
+
+import dynetworkx as dnx
+
+
+def random_edges(edges, nodes, seed=0):
+    """Return a list of random (u, v, begin, end) edges."""
+    rng = random.Random(seed)
+    result = []
+    for _ in range(edges):
+        begin = rng.randrange(10 ** 6)
+        result.append((rng.randrange(nodes), rng.randrange(nodes), begin, begin + rng.randint(1, 1000)))
+    return result
+
+
+def add_edge(E):
+    G = dnx.IntervalGraph()
+    for e in E:
+        G.add_edge(*e)
+    return G
+
+
+def add_edges_from(E):
+    G = dnx.IntervalGraph()
+    G.add_edges_from(E)
+    return G
+
+
+def best_time(func, E, repeat):
+    """Return the best time of repeat calls of func(E), without garbage collection."""
+    best = float('inf')
+    for _ in range(repeat):
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.time()
+            func(E)
+            best = min(best, time.time() - start)
+        finally:
+            gc.enable()
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--edges', type=int, default=200000)
+    parser.add_argument('--nodes', type=int, default=20000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args()
+
+    E = random_edges(args.edges, args.nodes)
+    one = best_time(add_edge, E, args.repeat)
+    bulk = best_time(add_edges_from, E, args.repeat)
+    print("{} edges, {} nodes".format(args.edges, args.nodes))
+    print("for e in E: G.add_edge(*e)  {:.2f} s".format(one))
+    print("G.add_edges_from(E)         {:.2f} s  ({:.1f}x)".format(bulk, one / bulk))
+
+
+if __name__ == '__main__':
+    main()